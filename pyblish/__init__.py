@@ -18,6 +18,7 @@ _registered_hosts = list()
 _registered_targets = list()
 _registered_gui = list()
 _registered_plugin_filters = list()
+_registered_id_generator = dict()
 
 
 __all__ = [
@@ -32,5 +33,6 @@ __all__ = [
     "_registered_hosts",
     "_registered_targets",
     "_registered_gui",
-    "_registered_plugin_filters"
+    "_registered_plugin_filters",
+    "_registered_id_generator",
 ]
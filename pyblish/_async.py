@@ -0,0 +1,179 @@
+"""Publishing from within an asyncio event loop
+
+Requires Python 3.7 or above, as log records of concurrent plug-ins are
+kept apart by context variables. Exposed via :mod:`pyblish.util`.
+
+Plug-ins whose `process` is a coroutine function are awaited in the
+event loop, whereas regular plug-ins are processed in an executor, such
+that the event loop is never blocked. The instances of each plug-in are
+processed concurrently, e.g. I/O-bound integrators uploading files or
+writing to a database.
+
+"""
+
+import time
+import asyncio
+import inspect
+import logging
+
+# Local library
+from . import api, logic, plugin, lib, util
+
+log = logging.getLogger("pyblish.util")
+
+
+async def publish_async(context=None, plugins=None, targets=None,
+                        concurrency=None):
+    """Publish everything, without blocking the event loop
+
+    Arguments:
+        context (Context, optional): Context, defaults to
+            creating a new context
+        plugins (list, optional): Plug-ins to include,
+            defaults to results of discover()
+        targets (list, optional): Targets to include for publish session.
+        concurrency (int, optional): Maximum number of instances
+            processed at once, defaults to no limit.
+
+    Returns:
+        Context: The context processed by the plugins.
+
+    Usage:
+        >> context = await util.publish_async()
+
+    """
+
+    context = context if context is not None else api.Context()
+
+    async for _ in publish_aiter(context, plugins, targets, concurrency):
+        pass
+
+    return context
+
+
+async def publish_aiter(context=None, plugins=None, targets=None,
+                        concurrency=None):
+    """Publish asynchronous iterator
+
+    Like :func:`pyblish.util.publish_iter`, yielding results in the same
+    order as when processed serially. Plug-ins are processed one at a
+    time, in order, whereas the instances of each plug-in are processed
+    concurrently.
+
+    Arguments:
+        context (Context, optional): Context, defaults to
+            creating a new context
+        plugins (list, optional): Plug-ins to include,
+            defaults to results of discover()
+        targets (list, optional): Targets to include for publish session.
+        concurrency (int, optional): Maximum number of instances
+            processed at once, defaults to no limit.
+
+    Yields:
+        dict: Result of each processed plug-in and instance
+
+    Usage:
+        >> async for result in util.publish_aiter(context):
+               print(result)
+
+    """
+
+    loop = asyncio.get_running_loop()
+
+    # Must check against None, as objects be emptys
+    context = api.Context() if context is None else context
+
+    if plugins is None:
+        plugins = await loop.run_in_executor(None, api.discover)
+
+    pipeline = util._Pipeline(context, plugins, targets)
+
+    semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+
+    async def process(Plugin, instance):
+        if semaphore is None:
+            return await _process(loop, Plugin, context, instance)
+
+        async with semaphore:
+            return await _process(loop, Plugin, context, instance)
+
+    # Collection is processed serially, as collectors create instances
+    for Plugin, instance in logic.Iterator(pipeline.collectors,
+                                           context,
+                                           targets=targets):
+        result = await process(Plugin, instance)
+        plugin._processed(context, result)
+        pipeline.collected(Plugin, result)
+
+        yield result
+
+    pipeline.prepare()
+
+    for Plugin, instances in logic.batches(pipeline.plugins,
+                                           context,
+                                           pipeline.state,
+                                           targets=targets,
+                                           plan=pipeline.plan):
+        tasks = list(
+            loop.create_task(process(Plugin, instance))
+            for instance in instances
+            if instance is None or logic.is_publishable(instance)
+        )
+
+        try:
+            for task in tasks:
+                result = await task
+                plugin._processed(context, result)
+                pipeline.processed(Plugin, result)
+
+                yield result
+
+        finally:
+            # E.g. on an unexpected exception, or the caller breaking
+            for task in tasks:
+                task.cancel()
+
+    api.emit("published", context=context)
+
+
+async def _process(loop, Plugin, context, instance):
+    """Produce a single result, without recording it"""
+    runner = Plugin()
+
+    if Plugin.__dict__.get("__lazy__"):
+        runner = plugin._lazy_runner(runner)
+
+    explicit = issubclass(Plugin, (api.ContextPlugin, api.InstancePlugin))
+
+    if not explicit or not inspect.iscoroutinefunction(runner.process):
+        return await loop.run_in_executor(
+            None, plugin._process, Plugin, context, instance)
+
+    if issubclass(Plugin, api.InstancePlugin) and instance is None:
+        raise AssertionError("Cannot process an InstancePlugin without an "
+                             "instance. This is a bug")
+
+    result = plugin.Result(Plugin, context, instance)
+
+    __start = time.time()
+
+    try:
+        # Each task runs in a context of its own, see plugin.capture()
+        with plugin.capture(result.records):
+            await runner.process(
+                context if issubclass(Plugin, api.ContextPlugin)
+                else instance)
+            result["success"] = True
+
+    except Exception as error:
+        lib.extract_traceback(error, Plugin.__module__)
+        result["error"] = error
+
+    __end = time.time()
+
+    # Families may have been changed in-place, see plugin._FamilyIndex
+    plugin._FamilyIndex._generation += 1
+
+    result["duration"] = (__end - __start) * 1000  # ms
+
+    return result
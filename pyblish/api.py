@@ -23,6 +23,8 @@ import os
 from .plugin import (
     Context,
     Instance,
+    Result,
+    Results,
 
     Action,
     Category,
@@ -40,6 +42,7 @@ from .plugin import (
     Integrator,
     Collector,
     discover,
+    Discoverer,
 
     ContextPlugin,
     InstancePlugin,
@@ -85,6 +88,10 @@ from .plugin import (
     deregister_all_discovery_filters,
     registered_discovery_filters,
 
+    register_id_generator,
+    registered_id_generator,
+    deregister_id_generator,
+
     sort as sort_plugins,
 
     registered_paths,
@@ -179,6 +186,8 @@ __all__ = [
     # Base objects
     "Context",
     "Instance",
+    "Result",
+    "Results",
     "Asset",
 
     # Matching algorithms
@@ -209,6 +218,7 @@ __all__ = [
 
     # Plug-in utilities
     "discover",
+    "Discoverer",
 
     "plugin_paths",
     "registered_paths",
@@ -242,6 +252,10 @@ __all__ = [
     "deregister_test",
     "registered_test",
 
+    "register_id_generator",
+    "registered_id_generator",
+    "deregister_id_generator",
+
     "register_gui",
     "registered_guis",
     "deregister_gui",
@@ -26,7 +26,7 @@ import tempfile
 import subprocess
 import contextlib
 
-from . import api, lib, util, __version__
+from . import api, lib, util, manifest, __version__
 from .vendor import click
 
 _ctx = None
@@ -385,5 +385,45 @@ def gui(ctx, package):
         sys.exit(process.returncode)
 
 
+@click.command()
+@click.argument("paths", nargs=-1)
+@click.pass_context
+def index(ctx, paths):
+    """Write manifest of plug-ins, for lazy discovery
+
+    A manifest named pyblish-index.json is written into each
+    directory, describing the plug-ins within it. Re-run this
+    command whenever a plug-in is changed, as changed files are
+    otherwise loaded as usual.
+
+    \b
+    Arguments:
+        paths: Optional directories to index. Defaults to
+               all available plug-in paths.
+
+    \b
+    Usage:
+        $ pyblish index
+        $ pyblish index /path/to/plugins
+        $ PYBLISH_LAZY_DISCOVERY=1 pyblish publish
+
+    """
+
+    paths = list(paths) or ctx.obj["plugin_paths"]
+
+    for path in paths:
+        if not os.path.isdir(path):
+            click.echo("Skipped: %s, not a directory" % path)
+            continue
+
+        fname = manifest.write(path)
+        files = manifest.read(path)["files"]
+        lazy = list(entry for entry in files.values() if entry["lazy"])
+
+        click.echo("%s (%i of %i files lazy)" % (
+            fname, len(lazy), len(files)))
+
+
 main.add_command(publish)
 main.add_command(gui)
+main.add_command(index)
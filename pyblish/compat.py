@@ -128,7 +128,7 @@ def create_asset(self, *args, **kwargs):
 
 @lib.deprecated
 def add(self, other):
-    return super(plugin.Context, self).append(other)
+    return self.append(other)
 
 
 plugin.Context.create_asset = create_asset
@@ -5,6 +5,8 @@ import datetime
 import warnings
 import traceback
 import functools
+import threading
+import collections
 
 from . import _registered_callbacks
 from .vendor import six
@@ -53,30 +55,50 @@ class MessageHandler(logging.Handler):
             self.records.append(record)
 
 
+# Maximum number of frames kept per traceback, innermost first
+TRACEBACK_LIMIT = 50
+
+
 def extract_traceback(exception, fname=None):
     """Inject current traceback and store in exception.traceback.
 
-    Also storing the formatted traceback on exception.formtatted_traceback.
+    Also storing the formatted traceback on exception.formtatted_traceback,
+    limited to the innermost `TRACEBACK_LIMIT` frames.
 
     Arguments:
         exception (Exception): Exception object
         fname (str): Optionally provide a file name for the exception.
-            This is necessary to inject the correct file path in the traceback.
-            If plugins are registered through `api.plugin.discover`, they only
-            show "<string>" instead of the actual source file.
+            Plug-ins found through `api.plugin.discover` are compiled
+            with their absolute path and need no help. Code executed from
+            a string however only shows "<string>" in place of the actual
+            source file, in which case `fname` is injected instead.
     """
     exc_type, exc_value, exc_traceback = sys.exc_info()
-    exception.traceback = traceback.extract_tb(exc_traceback)[-1]
 
-    formatted_traceback = ''.join(traceback.format_exception(
-        exc_type, exc_value, exc_traceback))
-    if 'File "<string>", line' in formatted_traceback and fname is not None:
+    if hasattr(traceback, "TracebackException"):
+        summary = traceback.TracebackException(
+            exc_type, exc_value, exc_traceback, limit=-TRACEBACK_LIMIT)
+        frames = summary.stack
+        formatted_traceback = "".join(summary.format())
+
+    else:
+        # Python 2, without chained exceptions nor negative limits
+        frames = traceback.extract_tb(exc_traceback)[-TRACEBACK_LIMIT:]
+        formatted_traceback = "".join(
+            ["Traceback (most recent call last):\n"] +
+            traceback.format_list(frames) +
+            traceback.format_exception_only(exc_type, exc_value))
+
+    exception.traceback = tuple(frames[-1])
+
+    if fname is not None and any(frame[0] == "<string>" for frame in frames):
         _, lineno, func, msg = exception.traceback
         fname = os.path.abspath(fname)
         exception.traceback = (fname, lineno, func, msg)
         formatted_traceback = formatted_traceback.replace(
             'File "<string>", line',
             'File "{0}", line'.format(fname))
+
     exception.formatted_traceback = formatted_traceback
 
     del(exc_type, exc_value, exc_traceback)
@@ -285,6 +307,81 @@ def emit(signal, **kwargs):
             # TODO(marcus): Make it prettier
 
 
+def lru_cache(maxsize=128):
+    """Memoize the most recently used `maxsize` results of a function
+
+    Equivalent to :func:`functools.lru_cache`, which is
+    used where available, for Python 2 compatibility.
+
+    Example:
+        >>> @lru_cache(maxsize=2)
+        ... def double(value):
+        ...     return value * 2
+        ...
+        >>> double(2)
+        4
+        >>> double.cache_info().misses
+        1
+        >>> double(2)
+        4
+        >>> double.cache_info().hits
+        1
+        >>> double.cache_clear()
+
+    """
+
+    if hasattr(functools, "lru_cache"):
+        return functools.lru_cache(maxsize=maxsize)
+
+    def decorator(func):
+        cache = collections.OrderedDict()
+        stats = {"hits": 0, "misses": 0}
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            with lock:
+                try:
+                    result = cache.pop(args)
+                except KeyError:
+                    pass
+                else:
+                    cache[args] = result  # Most recently used
+                    stats["hits"] += 1
+                    return result
+
+            result = func(*args)
+
+            with lock:
+                stats["misses"] += 1
+                cache[args] = result
+
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+
+            return result
+
+        def cache_info():
+            return CacheInfo(stats["hits"], stats["misses"],
+                             maxsize, len(cache))
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+                stats["hits"] = stats["misses"] = 0
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+
+        return wrapper
+
+    return decorator
+
+
+CacheInfo = collections.namedtuple(
+    "CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
 def deprecated(func):
     """Deprecation decorator
 
@@ -2,6 +2,7 @@
 
 import os
 import sys
+import math
 import logging
 import traceback
 
@@ -14,13 +15,16 @@ from .plugin import (
     Subset,
     Exact,
 
-    registered_targets
+    registered_targets,
+    _attribute_set,
+    _instance_families,
 )
 
+# Operating on frozensets, see _attribute_set() and _instance_families()
 _algorithms = {
-    Intersection: lambda a, b: set(a).intersection(b),
-    Subset: lambda a, b: set(a).issubset(b),
-    Exact: lambda a, b: set(a) == set(b)
+    Intersection: lambda a, b: not a.isdisjoint(b),
+    Subset: lambda a, b: a.issubset(b),
+    Exact: lambda a, b: a == b
 }
 
 log = logging.getLogger("pyblish.logic")
@@ -164,10 +168,12 @@ def plugins_by_families(plugins, families):
     """
 
     compatible = list()
+    families = frozenset(families)
 
     for plugin in plugins:
+        plugin_families = _attribute_set(plugin, "families")
 
-        if "*" in plugin.families:
+        if "*" in plugin_families:
             compatible.append(plugin)
             continue
 
@@ -176,7 +182,7 @@ def plugins_by_families(plugins, families):
         assert algorithm, ("Plug-in did not provide "
                            "valid matching algorithm: %s" % plugin.match)
 
-        if algorithm(plugin.families, families):
+        if algorithm(plugin_families, families):
             compatible.append(plugin)
 
     return compatible
@@ -209,11 +215,7 @@ def plugins_by_instance(plugins, instance):
 
     """
 
-    family = instance.data.get("family")
-    families = instance.data.get("families", [])
-
-    return plugins_by_families(
-        plugins, ([family] if family else []) + families)
+    return plugins_by_families(plugins, _instance_families(instance))
 
 
 def plugins_by_host(plugins, host):
@@ -232,7 +234,8 @@ def plugins_by_host(plugins, host):
 
     for plugin in plugins:
         # TODO(marcus): Expand to take partial wildcards e.g. "*Mesh"
-        if any(x in getattr(plugin, "hosts", None) for x in (host, "*")):
+        hosts = _attribute_set(plugin, "hosts")
+        if host in hosts or "*" in hosts:
             compatible.append(plugin)
 
     return compatible
@@ -251,6 +254,7 @@ def plugins_by_targets(plugins, targets):
     """
 
     compatible = list()
+    targets = frozenset(targets)
 
     for plugin in plugins:
 
@@ -259,7 +263,7 @@ def plugins_by_targets(plugins, targets):
         assert algorithm, ("Plug-in did not provide "
                            "valid matching algorithm: %s" % plugin.match)
 
-        if algorithm(plugin.targets, targets):
+        if algorithm(_attribute_set(plugin, "targets"), targets):
             compatible.append(plugin)
 
     return compatible
@@ -287,28 +291,178 @@ def instances_by_plugin(instances, plugin):
     """
 
     algorithm = _algorithms.get(plugin.match)
+    plugin_families = _attribute_set(plugin, "families")
 
-    compatible = list()
+    if "*" in plugin_families:
+        return list(instances)
 
-    for instance in instances:
+    # Contexts index their instances by family
+    by_families = getattr(instances, "_instances_by_families", None)
 
-        if "*" in plugin.families:
-            compatible.append(instance)
-            continue
+    if algorithm and by_families is not None:
+        compatible = by_families(plugin_families, plugin.match)
+
+        if compatible is not None:
+            return compatible
 
+    compatible = list()
+
+    for instance in instances:
         assert algorithm, ("Plug-in did not provide "
                            "valid matching algorithm: %s" % plugin.match)
 
-        family = instance.data.get("family")
-        families = [family] if family else []
-        families += instance.data.get("families", [])
-
-        if algorithm(plugin.families, families):
+        if algorithm(plugin_families, _instance_families(instance)):
             compatible.append(instance)
 
     return compatible
 
 
+class Plan(object):
+    """Instances compatible with each plug-in, computed once
+
+    Instances are grouped by their families, such that each plug-in
+    is matched once per distinct set of families, rather than once per
+    instance. The plan remains current until instances are added to or
+    removed from the context, or their families change.
+
+    Attributes:
+        plugins (list): Plug-ins of the plan, in order
+
+    Example:
+        >>> import pyblish.api
+        >>> class A(pyblish.api.InstancePlugin):
+        ...     families = ["model"]
+        >>> class B(pyblish.api.ContextPlugin):
+        ...     pass
+        >>> context = pyblish.api.Context()
+        >>> _ = context.create_instance("Rig", family="rig")
+        >>> _ = context.create_instance("Model", family="model")
+        >>> tasks = plan([A, B], context)
+        >>> [(p.__name__, getattr(i, "name", None)) for p, i in tasks.tasks()]
+        [('A', 'Model'), ('B', None)]
+
+    """
+
+    def __init__(self, plugins, context):
+        self.plugins = list(plugins)
+        self._context = context
+        self._version = getattr(context, "_families_version", lambda: None)()
+        self._instances = dict()
+
+        # Positions of instances, by families
+        groups = dict()
+        for position, instance in enumerate(context):
+            groups.setdefault(
+                _instance_families(instance), list()).append(position)
+
+        for plugin in self.plugins:
+            if not plugin.__instanceEnabled__:
+                continue
+
+            plugin_families = _attribute_set(plugin, "families")
+
+            if "*" in plugin_families:
+                self._instances[plugin] = list(context)
+                continue
+
+            algorithm = _algorithms.get(plugin.match)
+
+            assert algorithm, ("Plug-in did not provide "
+                               "valid matching algorithm: %s" % plugin.match)
+
+            positions = list()
+            for families, group in groups.items():
+                if algorithm(plugin_families, families):
+                    positions.extend(group)
+
+            positions.sort()
+            self._instances[plugin] = list(context[position]
+                                           for position in positions)
+
+    def __iter__(self):
+        """Yield each plug-in along with its instances, like :func:`batches`"""
+        for plugin in self.plugins:
+            yield plugin, self.instances(plugin)
+
+    def instances(self, plugin):
+        """Return instances compatible with `plugin`
+
+        Plug-ins processing the context have a single `None`.
+
+        """
+
+        if not plugin.__instanceEnabled__:
+            return [None]
+
+        return self._instances[plugin]
+
+    def tasks(self):
+        """Return every pair of plug-in and instance, in order"""
+        return list((plugin, instance)
+                    for plugin, instances in self
+                    for instance in instances)
+
+    def is_current(self, context):
+        """Whether the plan still applies to `context`"""
+        if context is not self._context or self._version is None:
+            return False
+
+        return context._families_version() == self._version
+
+
+def plan(plugins, context, targets=None):
+    """Return :class:`Plan` of `plugins` compatible with `targets`
+
+    Inactive plug-ins are excluded. The plan may be passed to
+    :func:`Iterator` and :func:`batches`, e.g. once presented to a
+    user, to process the very same tasks.
+
+    Arguments:
+        plugins (list): Plug-ins to consider
+        context (list): Instances to consider
+        targets (list, optional): Targets to include for publish session.
+
+    """
+
+    if not targets:
+        targets = ["default"] + registered_targets()
+
+    return Plan((plugin for plugin in plugins_by_targets(plugins, targets)
+                 if plugin.active), context)
+
+
+def estimate_instances(instances, plugin):
+    """Return approximate number of `instances` compatible with `plugin`
+
+    Contexts estimate from the size of their index of families, without
+    matching each instance, erring on the side of too many. Plug-ins
+    processing the context count as 1.
+
+    Arguments:
+        instances (list): List of instances
+        plugin (Plugin): Plugin with which to compare against
+
+    """
+
+    if not plugin.__instanceEnabled__:
+        return 1
+
+    plugin_families = _attribute_set(plugin, "families")
+
+    if "*" in plugin_families:
+        return len(instances)
+
+    estimate = getattr(instances, "_estimate_by_families", None)
+
+    if estimate is not None and plugin.match in _algorithms:
+        count = estimate(plugin_families, plugin.match)
+
+        if count is not None:
+            return count
+
+    return len(instances_by_plugin(instances, plugin))
+
+
 def _extract_traceback(exception):
     """Append traceback to `exception`
 
@@ -334,7 +488,7 @@ def _extract_traceback(exception):
         del(exc_type, exc_value, exc_traceback)
 
 
-def Iterator(plugins, context, state=None, targets=None):
+def Iterator(plugins, context, state=None, targets=None, plan=None):
     """Primary iterator
 
     This is the brains of publishing. It handles logic related
@@ -346,6 +500,37 @@ def Iterator(plugins, context, state=None, targets=None):
         context (list): Instances to consider
         state (dict): Mutable state
         targets (list, optional): Targets to include for publish session.
+        plan (Plan, optional): Instances of each plug-in, used for as long
+            as it is current, see :func:`plan`.
+
+    """
+
+    for plugin, instances in batches(plugins, context, state, targets, plan):
+        for instance in instances:
+            if instance is not None and not is_publishable(instance):
+                continue
+
+            yield plugin, instance
+
+
+def batches(plugins, context, state=None, targets=None, plan=None):
+    """Iterate over each plug-in along with the instances it is to process
+
+    Like :func:`Iterator`, but yielding each plug-in once, along
+    with every compatible instance, or `[None]` for plug-ins processing
+    the context. Instances compatible with a plug-in are determined
+    as it is reached, i.e. once the previous batch is done.
+
+    Instances that are not to be published are included, and may be
+    filtered using :func:`is_publishable`.
+
+    Arguments:
+        plugins (list): Plug-ins to consider
+        context (list): Instances to consider
+        state (dict): Mutable state
+        targets (list, optional): Targets to include for publish session.
+        plan (Plan, optional): Instances of each plug-in, used for as long
+            as it is current, see :func:`plan`.
 
     """
 
@@ -374,14 +559,335 @@ def Iterator(plugins, context, state=None, targets=None):
             log.error("Stopped due to %s" % message)
             return
 
-        instances = instances_by_plugin(context, plugin)
-        if plugin.__instanceEnabled__:
-            for instance in instances:
-                if instance.data.get("publish") is False:
-                    log.debug("%s was inactive, skipping.." % instance)
-                    continue
-
-                yield plugin, instance
+        if not plugin.__instanceEnabled__:
+            yield plugin, [None]
 
         else:
-            yield plugin, None
+            yield plugin, _planned_instances(plan, context, plugin)
+
+
+def _planned_instances(plan, context, plugin):
+    """Return instances of `plugin` from `plan`, unless no longer current"""
+    if (plan is not None and plugin in plan._instances and
+            plan.is_current(context)):
+        return plan.instances(plugin)
+
+    return instances_by_plugin(context, plugin)
+
+
+def is_publishable(instance):
+    """Return whether `instance` is to be processed"""
+    if instance.data.get("publish") is False:
+        log.debug("%s was inactive, skipping.." % instance)
+        return False
+
+    return True
+
+
+def _band(plugin):
+    """Return index of CVEI band of `plugin`, see :func:`lib.inrange`"""
+    return int(math.floor(plugin.order + 0.5))
+
+
+def dependencies(plugins):
+    """Return the plug-ins each of `plugins` waits for, within its band
+
+    Plug-ins are grouped by band, Collection, Validation, Extraction
+    and Integration, each processed after the band before it. Within
+    a band, plug-ins declaring `requires_plugins` wait for those alone,
+    whereas other plug-ins wait for every plug-in before them, unless
+    that plug-in requires them in turn.
+
+    Each requirement is either the name of a plug-in, or a key of data
+    listed under `provides` by other plug-ins. Requirements of an
+    earlier band are met already, and those not present are ignored.
+
+    Invalid requirements, of a later band or cyclic, are logged and
+    ignored, with the plug-ins declaring them waiting for those before
+    them, as though they declared no requirements.
+
+    .. note:: Bands remain barriers, such that the registered test
+        sees every error of a band before the next one starts, and
+        collectors are processed one at a time before any of this
+        applies. Declaring requirements therefore only lets plug-ins
+        of the same band overlap, e.g. validators of different data,
+        and never starts a plug-in before an earlier band is done.
+
+    Arguments:
+        plugins (list): Plug-ins, sorted by order
+
+    Returns:
+        Dictionary of plug-in to frozenset of plug-ins
+
+    """
+
+    providers = dict()
+
+    for plugin in plugins:
+        providers.setdefault(plugin.__name__, list()).append(plugin)
+
+        for key in _attribute_set(plugin, "provides"):
+            providers.setdefault(key, list()).append(plugin)
+
+    result = dict((plugin, set()) for plugin in plugins)
+    requiring = set()
+
+    # Declared requirements come first..
+    for plugin in plugins:
+        requirements = _attribute_set(plugin, "requires_plugins")
+
+        if not requirements:
+            continue
+
+        band = _band(plugin)
+        waits = set(provider
+                    for requirement in requirements
+                    for provider in providers.get(requirement, ())
+                    if provider is not plugin and _band(provider) >= band)
+
+        later = sorted(provider.__name__ for provider in waits
+                       if _band(provider) > band)
+
+        if later:
+            log.error("%s requires %s, which is processed after it, "
+                      "ignoring its requirements"
+                      % (plugin.__name__, ", ".join(later)))
+            continue
+
+        result[plugin] = waits
+        requiring.add(plugin)
+
+    cyclic = _cyclic(result)
+
+    if cyclic:
+        log.error("Cyclic requirements between %s, ignoring their "
+                  "requirements" % ", ".join(
+                      sorted(plugin.__name__ for plugin in cyclic)))
+
+        for plugin in cyclic:
+            result[plugin] = set()
+            requiring.discard(plugin)
+
+    # ..followed by the order of plug-ins without requirements,
+    # each waiting for those before it unless required by them.
+    previous = dict()  # Band -> last plug-in without requirements
+    declared = dict()  # Band -> plug-ins with requirements since then
+
+    for plugin in plugins:
+        band = _band(plugin)
+
+        if plugin in requiring:
+            declared.setdefault(band, list()).append(plugin)
+            continue
+
+        waits = declared.pop(band, list())
+
+        if band in previous:
+            waits.append(previous[band])
+
+        for other in waits:
+            if not _waits_for(result, other, plugin):
+                result[plugin].add(other)
+
+        previous[band] = plugin
+
+    return dict((plugin, frozenset(waits))
+                for plugin, waits in result.items())
+
+
+def _waits_for(dependencies, plugin, other):
+    """Return whether `plugin` waits for `other`, directly or indirectly"""
+    visited = set()
+    queue = [plugin]
+
+    while queue:
+        current = queue.pop()
+
+        if current is other:
+            return True
+
+        if current not in visited:
+            visited.add(current)
+            queue.extend(dependencies[current])
+
+    return False
+
+
+def _cyclic(dependencies):
+    """Return plug-ins waiting for one another, or for such plug-ins"""
+    remaining = dict((plugin, set(waits))
+                     for plugin, waits in dependencies.items())
+
+    while remaining:
+        ready = list(plugin for plugin, waits in remaining.items()
+                     if not waits)
+
+        if not ready:
+            return set(remaining)
+
+        for plugin in ready:
+            remaining.pop(plugin)
+
+        for waits in remaining.values():
+            waits.difference_update(ready)
+
+    return set()
+
+
+def sort_by_dependencies(plugins):
+    """Return `plugins` such that each follows those it waits for
+
+    Plug-ins keep their order unless required by a plug-in before
+    them, see :func:`dependencies`. This is the order in which plug-ins
+    are processed one at a time.
+
+    Example:
+        >>> import pyblish.api
+        >>> class A(pyblish.api.ContextPlugin):
+        ...     requires_plugins = ["frames"]
+        >>> class B(pyblish.api.ContextPlugin):
+        ...     provides = ["frames"]
+        >>> class C(pyblish.api.ContextPlugin):
+        ...     pass
+        >>> [p.__name__ for p in sort_by_dependencies([A, B, C])]
+        ['B', 'A', 'C']
+
+    """
+
+    if not any(_attribute_set(plugin, "requires_plugins")
+               for plugin in plugins):
+        return list(plugins)
+
+    remaining = dict((plugin, set(waits))
+                     for plugin, waits in dependencies(plugins).items())
+    result = list()
+
+    while remaining:
+        plugin = next(plugin for plugin in plugins
+                      if plugin in remaining and not remaining[plugin])
+
+        remaining.pop(plugin)
+        result.append(plugin)
+
+        for waits in remaining.values():
+            waits.discard(plugin)
+
+    return result
+
+
+class Scheduler(object):
+    """Determine which plug-ins may be processed, as others complete
+
+    The concurrent counterpart to :func:`batches`, following the
+    :func:`dependencies` of each plug-in. Plug-ins are started in
+    order of band, and the registered test is evaluated before
+    each, given the errors of plug-ins completed thus far.
+
+    Example:
+        >>> import pyblish.api
+        >>> class A(pyblish.api.ContextPlugin):
+        ...     provides = ["frames"]
+        >>> class B(pyblish.api.ContextPlugin):
+        ...     pass
+        >>> class C(pyblish.api.ContextPlugin):
+        ...     requires_plugins = ["frames"]
+        >>> scheduler = Scheduler([A, B, C], pyblish.api.Context())
+        >>> [plugin.__name__ for plugin, _ in scheduler.ready()]
+        ['A']
+        >>> scheduler.done(A)
+        >>> [plugin.__name__ for plugin, _ in scheduler.ready()]
+        ['B', 'C']
+
+    Arguments:
+        plugins (list): Plug-ins to consider, sorted by order
+        context (list): Instances to consider
+        state (dict): Mutable state
+        targets (list, optional): Targets to include for publish session.
+        plan (Plan, optional): Instances of each plug-in, used for as long
+            as it is current, see :func:`plan`.
+
+    """
+
+    def __init__(self, plugins, context, state=None, targets=None,
+                 plan=None):
+        if not targets:
+            targets = ["default"] + registered_targets()
+
+        self.plugins = plugins_by_targets(plugins, targets)
+        self.state = state or {
+            "nextOrder": None,
+            "ordersWithError": set()
+        }
+
+        self._context = context
+        self._plan = plan
+        self._test = registered_test()
+        self._dependencies = dependencies(self.plugins)
+        self._pending = list(self.plugins)
+        self._running = set()
+        self._done = set()
+
+    @property
+    def finished(self):
+        """Whether no plug-in is left to process, nor being processed"""
+        return not self._pending and not self._running
+
+    def is_settled(self, plugin):
+        """Whether `plugin` is done, or will not be processed"""
+        return plugin not in self._running and plugin not in self._pending
+
+    def ready(self):
+        """Return plug-ins ready for processing, along with their instances
+
+        Each plug-in is returned once, like :func:`batches`, and is
+        considered running until passed to :func:`done`.
+
+        """
+
+        started = list()
+
+        while self._pending:
+            band = _band(self._pending[0])
+
+            # Bands are processed one at a time
+            if any(_band(plugin) < band for plugin in self._running):
+                break
+
+            plugin = next((
+                plugin for plugin in self._pending
+                if _band(plugin) == band and
+                self._dependencies[plugin].issubset(self._done)), None)
+
+            if plugin is None:
+                break
+
+            self._pending.remove(plugin)
+
+            if not plugin.active:
+                log.debug("%s was inactive, skipping.." % plugin)
+                self._done.add(plugin)
+                continue
+
+            self.state["nextOrder"] = plugin.order
+
+            message = self._test(**self.state)
+            if message:
+                log.error("Stopped due to %s" % message)
+                self._pending[:] = []
+                break
+
+            self._running.add(plugin)
+
+            if not plugin.__instanceEnabled__:
+                started.append((plugin, [None]))
+
+            else:
+                started.append((plugin, _planned_instances(
+                    self._plan, self._context, plugin)))
+
+        return started
+
+    def done(self, plugin):
+        """Mark `plugin` as having been processed"""
+        self._running.discard(plugin)
+        self._done.add(plugin)
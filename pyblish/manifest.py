@@ -0,0 +1,363 @@
+"""Static plug-in manifests
+
+A manifest describes the plug-ins of a directory without executing
+any of its files. It is generated via `pyblish index` and used by
+:func:`pyblish.plugin.discover` to produce lightweight stand-ins for
+plug-ins, whose modules are only executed once processed.
+
+Attributes are extracted from the syntax tree of each file, which
+limits what a file may contain for it to be loaded lazily. A file
+is eligible when it consists of nothing but imports, literal
+assignments, functions and classes, and each of its plug-ins:
+
+- Subclass either `ContextPlugin` or `InstancePlugin`
+- Assign nothing but literals to class attributes, with the
+  exception of the built-in orders and matching algorithms,
+  e.g. `pyblish.api.CollectorOrder + 0.1`. Tuples are not
+  considered literals, as they would be read back as lists.
+- Refer to names of Pyblish either directly, or as attributes
+  of `api` or `pyblish.api`
+- Take either `context` or `instance` as argument to `process()`
+
+Files that are not eligible are executed during discovery as usual.
+
+.. note:: Names imported into an eligible file are never considered
+    plug-ins, unlike during regular discovery where e.g.
+    `from pyblish.api import ContextPlugin` results in
+    `ContextPlugin` being discovered alongside your own plug-ins.
+
+"""
+
+import os
+import ast
+import json
+import logging
+
+from . import __version__
+from .vendor import six
+
+log = logging.getLogger("pyblish.manifest")
+
+MANIFEST_NAME = "pyblish-index.json"
+MANIFEST_VERSION = 1
+
+# Names resolvable without executing anything,
+# mirroring those in pyblish.plugin
+_constants = {
+    "CollectorOrder": 0,
+    "ValidatorOrder": 1,
+    "ExtractorOrder": 2,
+    "IntegratorOrder": 3,
+    "Intersection": 1 << 0,
+    "Subset": 1 << 1,
+    "Exact": 1 << 2,
+}
+
+_bases = ("ContextPlugin", "InstancePlugin")
+_qualifiers = ("api", "pyblish.api")
+_serialisable = six.string_types + six.integer_types + (
+    float, bool, type(None), list, dict)
+
+
+class NotStatic(Exception):
+    """Raised for syntax which cannot be evaluated statically"""
+
+
+def _name(node):
+    """Return name of `node`, e.g. "CollectorOrder" of api.CollectorOrder
+
+    Attributes of anything but `api` or `pyblish.api` are
+    not resolved, e.g. `other.CollectorOrder`.
+
+    """
+
+    if isinstance(node, ast.Name):
+        return node.id
+
+    if isinstance(node, ast.Attribute) and _dotted(node.value) in _qualifiers:
+        return node.attr
+
+    raise NotStatic(node)
+
+
+def _dotted(node):
+    """Return dotted name of `node`, e.g. "pyblish.api", or None"""
+    if isinstance(node, ast.Name):
+        return node.id
+
+    if isinstance(node, ast.Attribute):
+        parent = _dotted(node.value)
+        return None if parent is None else parent + "." + node.attr
+
+    return None
+
+
+def _evaluate(node):
+    """Return value of expression `node` without executing it"""
+    try:
+        value = ast.literal_eval(node)
+
+    except (ValueError, TypeError, SyntaxError):
+        pass
+
+    else:
+        if not _is_serialisable(value):
+            raise NotStatic(node)
+        return value
+
+    if isinstance(node, ast.BinOp):
+        left, right = _evaluate(node.left), _evaluate(node.right)
+
+        if isinstance(node.op, ast.Add):
+            return left + right
+
+        if isinstance(node.op, ast.Sub):
+            return left - right
+
+        if isinstance(node.op, ast.Mult):
+            return left * right
+
+        if isinstance(node.op, ast.BitOr):
+            return left | right
+
+    if isinstance(node, ast.UnaryOp):
+        if isinstance(node.op, ast.USub):
+            return -_evaluate(node.operand)
+
+        if isinstance(node.op, ast.UAdd):
+            return _evaluate(node.operand)
+
+    if isinstance(node, (ast.Name, ast.Attribute)):
+        name = _name(node)
+        if name in _constants:
+            return _constants[name]
+
+    raise NotStatic(node)
+
+
+def _is_serialisable(value):
+    if isinstance(value, list):
+        return all(_is_serialisable(item) for item in value)
+
+    if isinstance(value, dict):
+        return all(isinstance(key, six.string_types) and
+                   _is_serialisable(item)
+                   for key, item in value.items())
+
+    return isinstance(value, _serialisable)
+
+
+def _is_docstring(statement):
+    if not isinstance(statement, ast.Expr):
+        return False
+
+    try:
+        value = ast.literal_eval(statement.value)
+    except (ValueError, TypeError, SyntaxError):
+        return False
+
+    return isinstance(value, six.string_types)
+
+
+def _arguments(function):
+    """Return argument names of FunctionDef `function`"""
+    return list(getattr(arg, "arg", getattr(arg, "id", None))
+                for arg in function.args.args)
+
+
+def _parse_class(node):
+    """Return description of plug-in class `node`
+
+    Raises:
+        NotStatic if any part of the class cannot be evaluated
+
+    """
+
+    if len(node.bases) != 1 or getattr(node, "keywords", None):
+        raise NotStatic(node)
+
+    if node.decorator_list:
+        raise NotStatic(node)
+
+    base = _name(node.bases[0])
+
+    if base not in _bases:
+        raise NotStatic(node)
+
+    attributes = dict()
+    argument = "context" if base == "ContextPlugin" else "instance"
+
+    for statement in node.body:
+        if _is_docstring(statement) or isinstance(statement, ast.Pass):
+            continue
+
+        if isinstance(statement, ast.FunctionDef):
+            if statement.name == "process":
+                arguments = _arguments(statement)[1:]
+
+                if statement.decorator_list or len(arguments) != 1:
+                    raise NotStatic(statement)
+
+                argument = arguments[0]
+
+            continue
+
+        if isinstance(statement, ast.Assign):
+            if len(statement.targets) != 1:
+                raise NotStatic(statement)
+
+            target = statement.targets[0]
+
+            if not isinstance(target, ast.Name):
+                raise NotStatic(statement)
+
+            attributes[target.id] = _evaluate(statement.value)
+            continue
+
+        raise NotStatic(statement)
+
+    if argument not in ("context", "instance"):
+        raise NotStatic(node)
+
+    return {
+        "name": node.name,
+        "base": base,
+        "argument": argument,
+        "doc": ast.get_docstring(node),
+        "attributes": attributes,
+    }
+
+
+def parse(source):
+    """Return plug-ins described by `source`, or None if not eligible
+
+    Arguments:
+        source (str): Python source of a plug-in file
+
+    Returns:
+        List of dictionaries, one per plug-in
+
+    """
+
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return None
+
+    plugins = dict()
+
+    for statement in tree.body:
+        if isinstance(statement, (ast.Import, ast.ImportFrom)):
+            continue
+
+        if _is_docstring(statement) or isinstance(statement, ast.FunctionDef):
+            continue
+
+        try:
+            if isinstance(statement, ast.Assign):
+                _evaluate(statement.value)
+                continue
+
+            if isinstance(statement, ast.ClassDef):
+                plugins[statement.name] = _parse_class(statement)
+                continue
+
+        except NotStatic:
+            return None
+
+        return None
+
+    return list(plugins[name] for name in sorted(plugins))
+
+
+def generate(path):
+    """Return manifest of plug-ins in directory `path`
+
+    Arguments:
+        path (str): Absolute path to directory of plug-ins
+
+    """
+
+    files = dict()
+
+    for fname in sorted(os.listdir(path)):
+        abspath = os.path.join(path, fname)
+
+        if fname.startswith("_") or not fname.endswith(".py"):
+            continue
+
+        if not os.path.isfile(abspath):
+            continue
+
+        stat = os.stat(abspath)
+
+        with open(abspath, "rb") as f:
+            plugins = parse(f.read())
+
+        if plugins is None:
+            log.debug("Not eligible for lazy loading: %s", abspath)
+
+        files[fname] = {
+            "mtime": stat.st_mtime,
+            "size": stat.st_size,
+            "lazy": plugins is not None,
+            "plugins": plugins or [],
+        }
+
+    return {
+        "version": MANIFEST_VERSION,
+        "pyblish": __version__,
+        "files": files,
+    }
+
+
+def write(path):
+    """Generate and write manifest for directory `path`
+
+    Returns:
+        Absolute path to written manifest
+
+    """
+
+    path = os.path.abspath(path)
+    manifest = generate(path)
+    fname = os.path.join(path, MANIFEST_NAME)
+
+    with open(fname, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    return fname
+
+
+def read(path):
+    """Return manifest of directory `path`, or None if there is none
+
+    Manifests of an unsupported version are ignored.
+
+    """
+
+    fname = os.path.join(path, MANIFEST_NAME)
+
+    try:
+        with open(fname) as f:
+            manifest = json.load(f)
+
+    except (IOError, OSError):
+        return None
+
+    except ValueError as e:
+        log.warning("Skipped manifest: \"%s\" (%s)", fname, e)
+        return None
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        log.debug("Skipped manifest of unsupported version: %s", fname)
+        return None
+
+    return manifest
+
+
+def is_current(entry, mtime, size):
+    """Return whether manifest `entry` still describes its file"""
+    return (entry["lazy"] and
+            entry["mtime"] == mtime and
+            entry["size"] == size)
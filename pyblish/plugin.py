@@ -13,13 +13,27 @@ with "validate" and ends with ".py"
 # Standard library
 import os
 import sys
+import json
 import time
 import types
 import logging
 import inspect
 import warnings
 import contextlib
+import functools
 import uuid
+import itertools
+import marshal
+import hashlib
+import weakref
+import threading
+import collections
+
+try:
+    import contextvars
+except ImportError:
+    # Python < 3.7
+    contextvars = None
 
 # Local library
 from . import (
@@ -31,16 +45,25 @@ from . import (
     _registered_hosts,
     _registered_paths,
     _registered_targets,
-    _registered_plugin_filters
+    _registered_plugin_filters,
+    _registered_id_generator,
 )
 
-from . import lib
+from . import lib, manifest
 from .vendor import iscompatible, six
+from .vendor.six.moves import copyreg
 
 if six.PY2:
+    import imp
     get_arg_spec = inspect.getargspec
+    BYTECODE_MAGIC = imp.get_magic()
+    MutableMapping = collections.MutableMapping
 else:
+    import importlib.util
+    import collections.abc
     get_arg_spec = inspect.getfullargspec
+    BYTECODE_MAGIC = importlib.util.MAGIC_NUMBER
+    MutableMapping = collections.abc.MutableMapping
 
 log = logging.getLogger("pyblish.plugin")
 
@@ -62,6 +85,77 @@ EARLY_ADOPTER = bool(os.getenv("PYBLISH_EARLY_ADOPTER"))
 ALLOW_DUPLICATE_PLUGINS = EARLY_ADOPTER or ALLOW_DUPLICATES
 STRICT_DATATYPES = EARLY_ADOPTER or STRICT_DATATYPES
 
+# Remember compiled plug-in files between discoveries
+DISCOVERY_CACHE = not os.getenv("PYBLISH_DISABLE_DISCOVERY_CACHE")
+
+# Directory in which to store compiled plug-ins across processes
+BYTECODE_CACHE_DIR = os.getenv("PYBLISH_BYTECODE_CACHE_DIR") or None
+
+# Stat and read plug-in files using a pool of threads
+PARALLEL_DISCOVERY = bool(os.getenv("PYBLISH_PARALLEL_DISCOVERY"))
+DISCOVERY_THREADS = int(os.getenv("PYBLISH_DISCOVERY_THREADS") or 8)
+
+# Use manifests to defer executing plug-in modules till processed
+LAZY_DISCOVERY = bool(os.getenv("PYBLISH_LAZY_DISCOVERY"))
+
+# Generate ids of plug-ins, contexts and instances with uuid4, as
+# opposed to a cheaper counter. This is to preserve backwards compatibility
+UUID_IDS = bool(os.getenv("PYBLISH_UUID_IDS"))
+
+
+def uuid_id():
+    """Return a random id, as generated prior to :class:`SequentialIds`"""
+    return str(uuid.uuid4())
+
+
+class SequentialIds(object):
+    """Generate ids from a random prefix and a counter
+
+    The prefix is drawn once per process, and anew in forked processes,
+    such that ids remain unique across processes and machines at the
+    cost of a single counter increment per id.
+
+    Example:
+        >>> ids = SequentialIds()
+        >>> ids() != ids()
+        True
+
+    """
+
+    def __init__(self):
+        self._pid = None
+        self._prefix = None
+        self._counter = None
+
+    def __call__(self):
+        if self._pid != os.getpid():
+            self._seed()
+
+        return "%s-%x" % (self._prefix, next(self._counter))
+
+    def _seed(self):
+        self._prefix = uuid.uuid4().hex
+        self._counter = itertools.count(1)
+        self._pid = os.getpid()
+
+
+sequential_id = SequentialIds()
+
+
+def new_id():
+    """Return a new id, from the registered id generator
+
+    See :func:`register_id_generator`.
+
+    """
+
+    try:
+        generator = _registered_id_generator["default"]
+    except KeyError:
+        generator = uuid_id if UUID_IDS else sequential_id
+
+    return generator()
+
 
 class Provider():
     """Dependency provider
@@ -72,8 +166,14 @@ class Provider():
     For example, the function func:`myfunc(a, b)` is given the services
     called "a" and "b", given they have previously been added to the provider.
 
+    A provider may be reused, with services injected anew per invocation.
+    Arguments of each function are looked up once.
+
     """
 
+    # Argument names per function, for the lifetime of each function
+    _args = weakref.WeakKeyDictionary()
+
     def __init__(self):
         self._services = dict()
 
@@ -92,8 +192,23 @@ class Provider():
 
     @classmethod
     def args(cls, func):
-        return [a for a in get_arg_spec(func)[0]
-                if a not in ("self", "cls")]
+        # Bound methods are created anew on each access
+        func = getattr(func, "__func__", func)
+
+        try:
+            return list(cls._args[func])
+        except KeyError:
+            pass
+        except TypeError:
+            # Not weakly referenceable, e.g. a builtin
+            return [a for a in get_arg_spec(func)[0]
+                    if a not in ("self", "cls")]
+
+        args = tuple(a for a in get_arg_spec(func)[0]
+                     if a not in ("self", "cls"))
+        cls._args[func] = args
+
+        return list(args)
 
     def invoke(self, func):
         """Supply function `func` with objects to its signature
@@ -107,13 +222,13 @@ class Provider():
         """
 
         args = self.args(func)
-        unavailable = [a for a in args if a not in self.services]
+        services = self.services
+        unavailable = [a for a in args if a not in services]
 
         if unavailable:
             raise KeyError("Unavailable service requested: %s" % unavailable)
 
-        inject = dict((k, v) for k, v in self.services.items()
-                      if k in args)
+        inject = dict((k, services[k]) for k in args)
 
         return func(**inject)
 
@@ -179,12 +294,47 @@ def append_logger(plugin):
     # Package name appended, for filtering of LogRecord instances
     logname = "pyblish.%s" % name
     plugin.log = logging.getLogger(logname)
-    plugin.log.setLevel(logging.DEBUG)
+
+    # Setting a level clears the cache of every logger in the process,
+    # avoid doing so for plug-ins whose logger already exists.
+    if plugin.log.level != logging.DEBUG:
+        plugin.log.setLevel(logging.DEBUG)
 
     # All messages are handled by root-logger
     plugin.log.propagate = True
 
 
+def _attribute_set(plugin, attribute):
+    """Return list attribute `attribute` of `plugin` as a frozenset
+
+    The frozenset is stored on the plug-in, and recomputed once the
+    attribute is reassigned or its contents change. Plug-ins compute
+    theirs for hosts, families and targets on creation, see
+    :class:`MetaPlugin`.
+
+    """
+
+    value = getattr(plugin, attribute)
+    contents = tuple(value)
+    cache = "_%s_set" % attribute
+
+    try:
+        source, previous, frozen = getattr(plugin, cache)
+    except AttributeError:
+        pass
+    else:
+        if source is value and previous == contents:
+            return frozen
+
+    if isinstance(value, six.string_types):
+        frozen = frozenset([value])
+    else:
+        frozen = frozenset(contents)
+
+    setattr(plugin, cache, (value, contents, frozen))
+    return frozen
+
+
 class MetaPlugin(type):
     """Rewrite plug-ins written prior to 1.1
 
@@ -200,9 +350,17 @@ class MetaPlugin(type):
         evaluate_enabledness(cls)
 
         # Compute once
-        cls._id = str(uuid.uuid4())
+        cls._id = new_id()
         cls.id = lib.classproperty(lambda self: self._id)
 
+        # Used in matching and scheduling, see pyblish.logic
+        for attribute in ("hosts", "families", "targets",
+                          "requires_plugins", "provides"):
+            try:
+                _attribute_set(cls, attribute)
+            except (AttributeError, TypeError):
+                pass  # Reported on validation, see plugin_is_valid()
+
         return super(MetaPlugin, cls).__init__(*args, **kwargs)
 
 
@@ -238,6 +396,16 @@ class Plugin():
             Intersection -> set(a).intersection(b)
             Subset       -> set(a).issubset(b)
             Exact        -> a == b
+        multiprocess: Whether instances may be processed in a separate
+            process, given only the data of each instance. See
+            :func:`pyblish.util.publish`.
+        requires_plugins: Names of plug-ins, or keys of data provided
+            by plug-ins, to be processed before this one, including
+            those of a later order within the same band. Plug-ins
+            declaring none are processed after every plug-in before
+            them. See :func:`pyblish.logic.dependencies`.
+        provides: Keys of data provided by this plug-in, as
+            required by others via `requires_plugins`.
 
     """
 
@@ -253,6 +421,9 @@ class Plugin():
     actions = []
     id = None  # Defined by metaclass
     match = Intersection  # Default matching algorithm
+    multiprocess = False
+    requires_plugins = []
+    provides = []
 
     def __str__(self):
         return self.label or type(self).__name__
@@ -360,7 +531,7 @@ class MetaAction(type):
     """Inject additional metadata into Action"""
 
     def __init__(cls, *args, **kwargs):
-        cls._id = str(uuid.uuid4())
+        cls._id = new_id()
         cls.id = lib.classproperty(lambda self: cls._id)
 
         cls.__error__ = None
@@ -458,6 +629,251 @@ def logger(handler):
         logger.setLevel(old_level)
 
 
+class _RecordRouter(logging.Handler):
+    """Append records to the list of the task currently being processed
+
+    Installed once on the "pyblish" logger, as opposed to on the
+    root logger per task, such that tasks processed concurrently
+    each receive their own records.
+
+    Records emitted outside of a task are passed on to
+    `logging.lastResort` when no other handler receives them, as
+    though this handler was not installed.
+
+    """
+
+    def __init__(self):
+        # Not using super(), for compatibility with Python 2.6
+        logging.Handler.__init__(self)
+
+        if contextvars is not None:
+            self._records = contextvars.ContextVar("pyblish_records",
+                                                   default=None)
+        else:
+            self._records = None
+            self._local = threading.local()
+
+    def get(self):
+        if self._records is not None:
+            return self._records.get()
+        return getattr(self._local, "records", None)
+
+    def set(self, records):
+        if self._records is not None:
+            self._records.set(records)
+        else:
+            self._local.records = records
+
+    def handle(self, record):
+        # Appending to a list is atomic, skip the lock of Handler.handle()
+        records = self.get()
+        if records is None:
+            last_resort = getattr(logging, "lastResort", None)
+            if (last_resort is not None and
+                    record.levelno >= last_resort.level and
+                    not self._handled_elsewhere(record)):
+                last_resort.handle(record)
+        elif self.filter(record):
+            records.append(record)
+        return record
+
+    def _handled_elsewhere(self, record):
+        """Return whether another handler receives `record`
+
+        Mirrors logging.Logger.callHandlers()
+
+        """
+
+        logger = logging.getLogger(record.name)
+
+        while logger is not None:
+            for handler in logger.handlers:
+                if handler is not self:
+                    return True
+
+            if not logger.propagate:
+                break
+
+            logger = logger.parent
+
+        return False
+
+    def emit(self, record):
+        self.handle(record)
+
+
+_record_router = _RecordRouter()
+
+
+@contextlib.contextmanager
+def capture(records):
+    """Append records of the current task to `records`
+
+    Records are captured from the "pyblish" logger and its children,
+    e.g. Plugin.log, and only those emitted from the current thread
+    or asyncio task.
+
+    Arguments:
+        records (list): Captured records are appended here
+
+    """
+
+    pyblish_log = logging.getLogger("pyblish")
+
+    # Handlers may have been reset since, e.g. by lib.setup_log()
+    if _record_router not in pyblish_log.handlers:
+        pyblish_log.addHandler(_record_router)
+
+    previous = _record_router.get()
+    _record_router.set(records)
+
+    try:
+        yield
+    finally:
+        _record_router.set(previous)
+
+
+class Result(MutableMapping):
+    """Result of processing a plug-in, with or without an instance
+
+    Compatible with the dictionary it replaces, with members accessed
+    as keys or attributes, but without a dictionary per result.
+    Members other than those below are stored separately, such as the
+    deprecated "asset" of implicit plug-ins, and only those may be
+    removed. Results compare equal to dictionaries of equal items.
+
+    Attributes:
+        success (bool): Whether processing finished without error
+        plugin (Plugin): Processed plug-in class
+        instance (Instance): Processed instance, if any
+        action (Action): Processed action, if any
+        error (Exception): Exception raised during processing, if any
+        records (list): Log records emitted during processing
+        duration (float): Time taken to process, in milliseconds
+        progress (float): Progress of the publish, between 0 and 1
+        context (Context): Processed context
+
+    Example:
+        >>> result = Result(Plugin, Context())
+        >>> result["success"], result.success
+        (False, False)
+        >>> result["asset"] = None
+        >>> list(result)[-2:]
+        ['context', 'asset']
+        >>> "asset" in result, "missing" in result
+        (True, False)
+        >>> result.pop("asset"), "asset" in result
+        (None, False)
+        >>> result == dict(result.items())
+        True
+
+    """
+
+    _fields = (
+        "success",
+        "plugin",
+        "instance",
+        "action",
+        "error",
+        "records",
+        "duration",
+        "progress",
+        "context",
+    )
+
+    __slots__ = _fields + ("_extra",)
+
+    def __init__(self, plugin, context, instance=None, action=None):
+        self.success = False
+        self.plugin = plugin
+        self.instance = instance
+        self.action = action
+        self.error = None
+        self.records = list()
+        self.duration = None
+        self.progress = 0
+        self.context = context
+        self._extra = None
+
+    def __getitem__(self, key):
+        if key in _result_fields:
+            return getattr(self, key)
+
+        if self._extra is None:
+            raise KeyError(key)
+
+        return self._extra[key]
+
+    def __setitem__(self, key, value):
+        if key in _result_fields:
+            return setattr(self, key, value)
+
+        if self._extra is None:
+            self._extra = dict()
+
+        self._extra[key] = value
+
+    def __delitem__(self, key):
+        if key in _result_fields:
+            raise TypeError("\"%s\" is a member of every result, "
+                            "and cannot be removed" % key)
+
+        if self._extra is None:
+            raise KeyError(key)
+
+        del self._extra[key]
+
+    def __contains__(self, key):
+        return key in _result_fields or (
+            self._extra is not None and key in self._extra)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __repr__(self):
+        return "%s(%r)" % (type(self).__name__, dict(self.items()))
+
+    def __getstate__(self):
+        return dict(self.items())
+
+    def __setstate__(self, state):
+        self._extra = None
+        self.update(state)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def copy(self):
+        """Return a shallow copy, like dict.copy()"""
+        result = type(self).__new__(type(self))
+        result.__setstate__(self.__getstate__())
+        return result
+
+    def keys(self):
+        if self._extra is None:
+            return list(self._fields)
+        return list(self._fields) + list(self._extra)
+
+    def values(self):
+        return list(self[key] for key in self.keys())
+
+    def items(self):
+        return list((key, self[key]) for key in self.keys())
+
+    def update(self, other=(), **kwargs):
+        for key, value in dict(other, **kwargs).items():
+            self[key] = value
+
+
+_result_fields = frozenset(Result._fields)
+
+
 def process(plugin, context, instance=None, action=None):
     """Produce a single result from a Plug-in
 
@@ -468,17 +884,57 @@ def process(plugin, context, instance=None, action=None):
         action(str): Id of action to process, in place of plug-in.
 
     Returns:
-        Dictionary of result
+        Result: Result of processing, see :class:`Result`
 
     """
 
-    if issubclass(plugin, (ContextPlugin, InstancePlugin)):
-        result = __explicit_process(plugin, context, instance, action)
-    else:
-        result = __implicit_process(plugin, context, instance, action)
+    result = _process(plugin, context, instance, action)
+    _processed(context, result)
+    return result
+
+
+def _process(plugin, context, instance=None, action=None):
+    """Produce a single result, without recording it
+
+    Safe to call from multiple threads at once, with results
+    recorded in order from a single thread, see :func:`_processed`.
+
+    """
+
+    try:
+        if issubclass(plugin, (ContextPlugin, InstancePlugin)):
+            return __explicit_process(plugin, context, instance, action)
+        else:
+            return __implicit_process(plugin, context, instance, action)
+
+    finally:
+        # Families may have been changed in-place, see _FamilyIndex
+        _FamilyIndex._generation += 1
+
+
+def _processed(context, result):
+    """Record `result` in `context` and notify listeners
+
+    Listeners are notified, and failures logged, from the thread
+    recording results, rather than from whichever thread or process
+    produced them.
+
+    """
+
+    error = result["error"]
+
+    if error is not None:
+        lib.emit("pluginFailed", plugin=result["plugin"], context=context,
+                 instance=result["instance"], error=error)
+        log.error("%s: %s", type(error).__name__, error)
+        log.debug(error.formatted_traceback)
+
+    if "results" not in context.data:
+        context.data["results"] = list()
+
+    context.data["results"].append(result)
 
     lib.emit("pluginProcessed", result=result)
-    return result
 
 
 def __explicit_process(plugin, context, instance=None, action=None):
@@ -495,17 +951,7 @@ def __explicit_process(plugin, context, instance=None, action=None):
         raise AssertionError("Cannot process an InstancePlugin without an "
                              "instance. This is a bug")
 
-    result = {
-        "success": False,
-        "plugin": plugin,
-        "instance": instance,
-        "action": action,
-        "error": None,
-        "records": list(),
-        "duration": None,
-        "progress": 0,
-        "context": context,
-    }
+    result = Result(plugin, context, instance, action)
 
     if not action:
         args = (context if issubclass(plugin, ContextPlugin) else instance,)
@@ -518,37 +964,23 @@ def __explicit_process(plugin, context, instance=None, action=None):
         args = (context, plugin)
         runner = action().process
 
-    records = list()
-    handler = lib.MessageHandler(records)
-
     __start = time.time()
 
     try:
-        with logger(handler):
+        with capture(result.records):
             runner(*args)
             result["success"] = True
     except Exception as error:
         # FIXME: This is apparently not very healthy,
         # as it creates a circular reference.
         # http://stackoverflow.com/a/11417308/478949
-        lib.emit("pluginFailed", plugin=plugin, context=context,
-                 instance=instance, error=error)
         lib.extract_traceback(error, plugin.__module__)
         result["error"] = error
-        log.exception(result["error"].formatted_traceback)
 
     __end = time.time()
 
-    for record in records:
-        result["records"].append(record)
-
     result["duration"] = (__end - __start) * 1000  # ms
 
-    if "results" not in context.data:
-        context.data["results"] = list()
-
-    context.data["results"].append(result)
-
     return result
 
 
@@ -563,17 +995,7 @@ def __implicit_process(plugin, context, instance=None, action=None):
 
     """
 
-    result = {
-        "success": False,
-        "plugin": plugin,
-        "instance": instance,
-        "action": action,
-        "error": None,
-        "records": list(),
-        "duration": None,
-        "progress": 0,
-        "context": context,
-    }
+    result = Result(plugin, context, instance, action)
 
     if not action:
         runner = plugin().process
@@ -584,10 +1006,7 @@ def __implicit_process(plugin, context, instance=None, action=None):
         action = actions[action]
         runner = action().process
 
-    records = list()
-    handler = lib.MessageHandler(records)
-
-    provider = Provider()
+    provider = _pooled_provider()
     provider.inject("plugin", plugin)
     provider.inject("context", context)
     provider.inject("instance", instance)
@@ -595,34 +1014,40 @@ def __implicit_process(plugin, context, instance=None, action=None):
     __start = time.time()
 
     try:
-        with logger(handler):
+        with capture(result.records):
             provider.invoke(runner)
             result["success"] = True
     except Exception as error:
-        lib.emit("pluginFailed", plugin=plugin, context=context,
-                 instance=instance, error=error)
         lib.extract_traceback(error, plugin.__module__)
         result["error"] = error
-        log.exception(result["error"].formatted_traceback)
+    finally:
+        # Don't keep the context alive past processing
+        provider.inject("plugin", None)
+        provider.inject("context", None)
+        provider.inject("instance", None)
 
     __end = time.time()
 
-    for record in records:
-        result["records"].append(record)
-
     result["duration"] = (__end - __start) * 1000  # ms
 
-    if "results" not in context.data:
-        context.data["results"] = list()
-
-    context.data["results"].append(result)
-
     # Backwards compatibility
     result["asset"] = instance  # Deprecated key
 
     return result
 
 
+_providers = threading.local()
+
+
+def _pooled_provider():
+    """Return provider reused across calls within the current thread"""
+    try:
+        return _providers.provider
+    except AttributeError:
+        _providers.provider = Provider()
+        return _providers.provider
+
+
 def repair(plugin, context, instance=None):
     """Produce single result from repairing"""
 
@@ -631,20 +1056,10 @@ def repair(plugin, context, instance=None):
     if "results" not in context.data:
         context.data["results"] = list()
 
-    result = {
-        "success": False,
-        "plugin": plugin,
-        "instance": instance,
-        "error": None,
-        "records": list(),
-        "duration": None
-    }
+    result = Result(plugin, context, instance)
 
     plugin = plugin()
 
-    records = list()
-    handler = lib.MessageHandler(records)
-
     provider = Provider()
     provider.inject("context", context)
     provider.inject("instance", instance)
@@ -652,7 +1067,7 @@ def repair(plugin, context, instance=None):
     __start = time.time()
 
     try:
-        with logger(handler):
+        with capture(result.records):
             provider.invoke(plugin.repair)
             result["success"] = True
     except Exception as error:
@@ -661,9 +1076,6 @@ def repair(plugin, context, instance=None):
 
     __end = time.time()
 
-    for record in records:
-        result["records"].append(record)
-
     result["duration"] = (__end - __start) * 1000  # ms
 
     context.data["results"].append(result)
@@ -671,9 +1083,122 @@ def repair(plugin, context, instance=None):
     return result
 
 
+class Results(object):
+    """Bounded record of results, optionally streamed to a file
+
+    Replaces the unbounded list of `context.data["results"]`, such
+    that memory remains constant in the number of processed pairs.
+    Only the most recent results are kept in memory, whereas every
+    result is written to `stream` as a line of JSON, with log records
+    flattened to their message, level and time.
+
+    Arguments:
+        maxlen (int, optional): Number of results kept in memory,
+            defaults to 1000
+        stream (file, optional): Writable text stream, such as
+            a file opened for writing, defaults to none
+
+    Attributes:
+        count (int): Total number of results recorded
+
+    Example:
+        >>> import io
+        >>> import pyblish.api
+        >>> class MyPlugin(pyblish.api.ContextPlugin):
+        ...     def process(self, context):
+        ...         self.log.info("Hello")
+        >>> stream = io.StringIO()
+        >>> context = pyblish.api.Context()
+        >>> context.data["results"] = Results(maxlen=2, stream=stream)
+        >>> for _ in range(3):
+        ...     _ = process(MyPlugin, context)
+        >>> len(context.data["results"]), context.data["results"].count
+        (2, 3)
+        >>> line = json.loads(stream.getvalue().splitlines()[-1])
+        >>> line["plugin"], line["records"][0]["msg"]
+        ('MyPlugin', 'Hello')
+
+    """
+
+    def __init__(self, maxlen=1000, stream=None):
+        self._results = collections.deque(maxlen=maxlen)
+        self._stream = stream
+        self.count = 0
+
+    def __iter__(self):
+        return iter(self._results)
+
+    def __len__(self):
+        return len(self._results)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._results)[index]
+        return self._results[index]
+
+    def __repr__(self):
+        return "%s(%r)" % (type(self).__name__, list(self._results))
+
+    def append(self, result):
+        self._results.append(result)
+        self.count += 1
+
+        if self._stream is not None:
+            self._stream.write(six.text_type(
+                json.dumps(format_result(result))) + u"\n")
+
+    def extend(self, results):
+        for result in results:
+            self.append(result)
+
+    def flush(self):
+        if self._stream is not None:
+            self._stream.flush()
+
+
+def format_result(result):
+    """Return JSON-compatible copy of `result`
+
+    Plug-ins, instances and actions are referenced by name, errors by
+    their message and traceback and log records by their message,
+    level and time.
+
+    Arguments:
+        result (dict): Result of :func:`process`
+
+    """
+
+    error = result["error"]
+    action = result.get("action")
+    formatted_traceback = getattr(error, "formatted_traceback", None)
+
+    return {
+        "success": result["success"],
+        "plugin": getattr(result["plugin"], "__name__", None),
+        "instance": getattr(result["instance"], "name", None),
+        "action": getattr(action, "id", action),
+        "error": None if error is None else {
+            "message": six.text_type(error),
+            "traceback": None if formatted_traceback is None
+            else six.text_type(formatted_traceback),
+        },
+        "records": list(
+            {
+                "msg": record.getMessage(),
+                "level": record.levelname,
+                "time": record.created,
+            }
+            for record in result["records"]
+        ),
+        "duration": result["duration"],
+    }
+
+
 class _Dict(dict):
     """Temporary object during transition from set_data to data dictionary"""
 
+    __slots__ = ("_parent",)
+
     def __init__(self, parent):
         self._parent = parent
 
@@ -686,6 +1211,31 @@ class _Dict(dict):
 
         return self.get(key, default)
 
+    def __getitem__(self, k):
+        if k == "families":
+            self._families_read()
+        return dict.__getitem__(self, k)
+
+    def get(self, k, default=None):
+        if k == "families":
+            self._families_read()
+        return dict.get(self, k, default)
+
+    def items(self):
+        if "families" in self:
+            self._families_read()
+        return dict.items(self)
+
+    def values(self):
+        if "families" in self:
+            self._families_read()
+        return dict.values(self)
+
+    def copy(self):
+        if "families" in self:
+            self._families_read()
+        return dict.copy(self)
+
     def __setitem__(self, k, v):
         # Backwards incompatible data validation.
         if STRICT_DATATYPES:
@@ -695,65 +1245,676 @@ class _Dict(dict):
 
         dict.__setitem__(self, k, v)
 
+        if k in _family_keys:
+            self._families_changed()
 
-class AbstractEntity(list):
-    """Superclass for Context and Instance
+    def __delitem__(self, k):
+        dict.__delitem__(self, k)
 
-    Attributes:
-        id (str): Unique identifier of instance
-        name (str): Name of instance
-        data (dict): Data shared between plug-ins
-        parent (AbstractEntity): Optional parent of instance
+        if k in _family_keys:
+            self._families_changed()
 
-    """
+    def update(self, *args, **kwargs):
+        for k, v in dict(*args, **kwargs).items():
+            self[k] = v
 
-    def __init__(self, name, parent=None):
-        assert isinstance(name, six.string_types)
-        assert parent is None or isinstance(parent, AbstractEntity)
+    def setdefault(self, k, default=None):
+        if k not in self:
+            self[k] = default
+        return self[k]
 
-        # Read-only properties
-        self._name = name
-        self._data = _Dict(self)
-        self._id = str(uuid.uuid4())
-        self._parent = parent
+    def pop(self, k, *args):
+        value = dict.pop(self, k, *args)
 
-        if parent is not None:
-            parent.append(self)
+        if k in _family_keys:
+            self._families_changed()
 
-    @property
-    def id(self):
-        return self._id
+        return value
 
-    @property
-    def parent(self):
-        return self._parent
+    def popitem(self):
+        item = dict.popitem(self)
 
-    @property
-    def name(self):
-        return self._name
+        if item[0] in _family_keys:
+            self._families_changed()
 
-    @property
-    def data(self):
-        return self._data
+        return item
 
+    def clear(self):
+        dict.clear(self)
+        self._families_changed()
 
-class Context(AbstractEntity):
-    """Maintain a collection of Instances"""
+    def _families_changed(self):
+        self._parent._families_changed()
 
-    def __init__(self, name="Context", parent=None):
-        super(Context, self).__init__(name, parent)
+    def _families_read(self):
+        self._parent._families_read()
 
-    def __contains__(self, key):
-        """Support both Instance objects and `id` strings
+    def __reduce_ex__(self, protocol):
+        return (copyreg.__newobj__, (type(self),), {
+            "_parent": self._parent,
+            "_items": dict(self),
+        })
 
-        Example:
-            >>> context = Context()
-            >>> instance = context.create_instance("MyInstance")
-            >>> instance.id in context
-            True
-            >>> instance in context
-            True
-            >>> "NotExists" in context
+    def __setstate__(self, state):
+        self._parent = state["_parent"]
+        dict.update(self, state["_items"])
+
+
+_family_keys = ("family", "families")
+
+
+def _instance_families(instance):
+    """Return family and families of `instance` as a frozenset
+
+    The frozenset is stored on the instance, and recomputed once
+    either member is reassigned or the contents of "families" change,
+    including in-place.
+
+    """
+
+    data = instance.data
+    family = dict.get(data, "family")
+    families = tuple(dict.get(data, "families", ()))
+
+    cached = getattr(instance, "_families_set", None)
+
+    if (cached is not None and
+            cached[0] == family and
+            cached[1] == families):
+        return cached[2]
+
+    frozen = frozenset(((family,) if family else ()) + families)
+    instance._families_set = (family, families, frozen)
+
+    return frozen
+
+
+# Guards indexes of instances, see Context
+_index_lock = threading.RLock()
+
+
+def _synchronized(func):
+    """Hold `_index_lock` whilst calling `func`
+
+    Instances may be added, removed or given new families by plug-ins
+    processed concurrently, see :func:`pyblish.util.publish`.
+
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _index_lock:
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+class _FamilyIndex(object):
+    """Instances of a :class:`Context` by family
+
+    Instances are kept in per-family buckets along with their position
+    in the context, such that instances of a family are found without
+    visiting every instance. Instances without a family are kept in the
+    bucket of `None`.
+
+    Each instance notifies the indexes it is part of once its families
+    are reassigned, see :class:`_Dict`. Instances refer to indexes weakly,
+    such that discarded indexes need not be removed from each instance.
+    Lists of families changed in-place are compared against a copy of
+    their contents on :meth:`refresh`, but only once a list has been
+    handed out by, or assigned to, the data of an instance, or once a
+    plug-in has been processed since the previous refresh.
+    Changes to the order of the context are not tracked, and require
+    a new index. Every other change increments `version`.
+
+    Raises:
+        ValueError on instances occurring more than once, or without data
+
+    """
+
+    # Incremented per processed plug-in, see _process()
+    _generation = 0
+
+    def __init__(self, instances):
+        self._buckets = dict()
+        self._entries = dict()
+        self._watched = dict()
+        self._watched_lists = None
+        self._stale = False
+        self._generation = _FamilyIndex._generation
+        self._count = 0
+        self.version = 0
+
+        for instance in instances:
+            self.add(instance)
+
+    def add(self, instance):
+        key = id(instance)
+
+        if key in self._entries:
+            raise ValueError("%s occurs more than once" % instance)
+
+        try:
+            families = _instance_families(instance)
+            indexes = instance._family_indexes
+        except AttributeError:
+            raise ValueError("%s cannot be indexed" % instance)
+
+        self._entries[key] = (self._count, families)
+        self._count += 1
+        self._insert(key, instance, families)
+        self._watch(key, instance)
+        self.version += 1
+
+        if indexes is None:
+            indexes = instance._family_indexes = list()
+
+        indexes.append(weakref.ref(self))
+
+    def update(self, instance):
+        key = id(instance)
+
+        try:
+            position, previous = self._entries[key]
+        except KeyError:
+            return
+
+        families = _instance_families(instance)
+        self._watch(key, instance)
+
+        if families == previous:
+            return
+
+        self._pop(key, previous)
+        self._entries[key] = (position, families)
+        self._insert(key, instance, families)
+        self.version += 1
+
+    def discard(self, instance):
+        key = id(instance)
+
+        try:
+            position, families = self._entries.pop(key)
+        except KeyError:
+            return
+
+        self._pop(key, families)
+        self._watched.pop(key, None)
+        self._watched_lists = None
+        self.version += 1
+
+        instance._family_indexes[:] = list(
+            ref for ref in instance._family_indexes
+            if ref() not in (self, None)
+        )
+
+    def stale(self):
+        """Mark lists of families as possibly changed in-place"""
+        self._stale = True
+
+    def refresh(self):
+        """Update instances whose list of families changed in-place"""
+        if not self._stale and \
+                self._generation == _FamilyIndex._generation:
+            return
+
+        self._stale = False
+        self._generation = _FamilyIndex._generation
+
+        if self._watched_lists is None:
+            entries = list(self._watched.values())
+            self._watched_lists = (list(entry[1] for entry in entries),
+                                   list(entry[2] for entry in entries),
+                                   entries)
+
+        lists, contents, entries = self._watched_lists
+
+        # Compared all at once, in the common case of no changes
+        if lists == contents:
+            return
+
+        for instance in list(instance for instance, families, copy
+                             in entries if families != copy):
+            self.update(instance)
+
+    def _watch(self, key, instance):
+        families = dict.get(instance.data, "families")
+
+        if isinstance(families, list):
+            self._watched[key] = (instance, families, list(families))
+        else:
+            self._watched.pop(key, None)
+
+        self._watched_lists = None
+
+    def _insert(self, key, instance, families):
+        for family in families or (None,):
+            self._buckets.setdefault(family, dict())[key] = instance
+
+    def _pop(self, key, families):
+        for family in families or (None,):
+            bucket = self._buckets[family]
+            bucket.pop(key)
+
+            if not bucket:
+                self._buckets.pop(family)
+
+    def query(self, families, match):
+        """Return instances compatible with `families`, in order
+
+        Arguments:
+            families (frozenset): Families of a plug-in
+            match (int): Intersection, Subset or Exact
+
+        """
+
+        if match == Intersection:
+            candidates = dict()
+
+            for family in families:
+                candidates.update(self._buckets.get(family, {}))
+
+        elif not families and match == Exact:
+            candidates = self._buckets.get(None, {})
+
+        elif not families:
+            # Every instance is a superset of no families
+            candidates = dict()
+
+            for bucket in self._buckets.values():
+                candidates.update(bucket)
+
+        else:
+            # Instances must have every family, start from the rarest
+            candidates = min((self._buckets.get(family, {})
+                              for family in families), key=len)
+
+            compare = families.issubset if match == Subset \
+                else families.__eq__
+
+            candidates = dict(
+                (key, instance) for key, instance in candidates.items()
+                if compare(self._entries[key][1])
+            )
+
+        return [candidates[key] for key in sorted(
+            candidates, key=lambda key: self._entries[key][0])]
+
+    def estimate(self, families, match):
+        """Return at least as many instances as query() would
+
+        Computed from the size of buckets alone, in time proportional
+        to the number of `families` rather than of instances.
+
+        """
+
+        if match == Intersection:
+            return min(len(self._entries), sum(
+                len(self._buckets.get(family, ())) for family in families))
+
+        elif not families and match == Exact:
+            return len(self._buckets.get(None, ()))
+
+        elif not families:
+            return len(self._entries)
+
+        return min(len(self._buckets.get(family, ())) for family in families)
+
+
+class AbstractEntity(list):
+    """Superclass for Context and Instance
+
+    Attributes:
+        id (str): Unique identifier of instance
+        name (str): Name of instance
+        data (dict): Data shared between plug-ins
+        parent (AbstractEntity): Optional parent of instance
+
+    """
+
+    # Arbitrary attributes are still supported via __dict__,
+    # which is only created once such an attribute is assigned.
+    __slots__ = ("_name", "_data", "_id", "_parent",
+                 "__dict__", "__weakref__")
+
+    # Incremented on re-parenting any entity, see Instance.context
+    _hierarchy_generation = 0
+
+    def __init__(self, name, parent=None):
+        assert isinstance(name, six.string_types)
+        assert parent is None or isinstance(parent, AbstractEntity)
+
+        # Read-only properties
+        self._name = name
+        self._data = _Dict(self)
+        self._id = new_id()
+        self._parent = parent
+
+        if parent is not None:
+            parent.append(self)
+
+    def __reduce_ex__(self, protocol):
+        # Restore children and data ahead of any indexes, see Context
+        state = dict(getattr(self, "__dict__", {}))
+        state.update({
+            "_name": self._name,
+            "_data": self._data,
+            "_id": self._id,
+            "_parent": self._parent,
+            "_children": list(self),
+        })
+
+        return (copyreg.__newobj__, (type(self),), state)
+
+    def __setstate__(self, state):
+        state = dict(state)
+        list.extend(self, state.pop("_children"))
+
+        for key, value in state.items():
+            setattr(self, key, value)
+
+    @property
+    def id(self):
+        return self._id
+
+    @property
+    def parent(self):
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent):
+        """Re-parent entity
+
+        The entity is not moved between its previous and new parent,
+        such as via :meth:`list.remove` and :meth:`list.append`.
+
+        """
+
+        assert parent is None or isinstance(parent, AbstractEntity)
+        self._parent = parent
+
+        # Contexts cached by instances may no longer apply
+        AbstractEntity._hierarchy_generation += 1
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def data(self):
+        return self._data
+
+    def _families_changed(self):
+        """Called once family or families of data has changed"""
+
+    def _families_read(self):
+        """Called once families of data may be changed in-place"""
+
+
+class Context(AbstractEntity):
+    """Maintain a collection of Instances
+
+    Instances are indexed by id and family as they are added and
+    removed, for constant-time lookups by id and for matching
+    instances to plug-ins, see :func:`pyblish.logic.instances_by_plugin`.
+
+    """
+
+    __slots__ = ("_ids", "_id_counts", "_family_index")
+
+    def __init__(self, name="Context", parent=None):
+        self._ids = dict()
+        self._id_counts = dict()
+        self._family_index = None
+        super(Context, self).__init__(name, parent)
+
+    def __setstate__(self, state):
+        super(Context, self).__setstate__(state)
+
+        # Indexes are rebuilt on first use
+        self._ids = None
+        self._id_counts = dict()
+        self._family_index = None
+
+    def _added(self, children, appended=True):
+        """Index `children`, `appended` to the end of this context"""
+        ids = self._ids
+
+        if ids is not None:
+            for child in children:
+                key = getattr(child, "id", None)
+                count = self._id_counts.get(key, 0)
+                self._id_counts[key] = count + 1
+
+                if not count:
+                    ids[key] = child
+
+                elif not appended and ids[key] is not child:
+                    self._ids = None  # Unknown which is first
+                    break
+
+        if not appended:
+            self._family_index = None
+
+        elif self._family_index:
+            try:
+                for child in children:
+                    self._family_index.add(child)
+            except ValueError:
+                self._family_index = False
+
+    def _removed(self, children):
+        """Forget about `children`, having been removed"""
+        ids = self._ids
+
+        if ids is not None:
+            for child in children:
+                key = getattr(child, "id", None)
+                count = self._id_counts.pop(key) - 1
+
+                if not count:
+                    ids.pop(key)
+
+                elif ids[key] is child:
+                    self._ids = None  # Unknown which remains first
+                    break
+
+                else:
+                    self._id_counts[key] = count
+
+        if self._family_index:
+            for child in children:
+                self._family_index.discard(child)
+        else:
+            self._family_index = None
+
+    def _reordered(self):
+        if self._ids is not None and len(self._ids) != len(self):
+            self._ids = None  # Duplicates may have changed place
+
+        self._family_index = None
+
+    def _id_index(self):
+        """Return dictionary of id to first instance of each id"""
+        ids = self._ids
+
+        if ids is None:
+            with _index_lock:
+                ids = dict()
+                counts = dict()
+
+                for child in self:
+                    key = getattr(child, "id", None)
+                    counts[key] = counts.get(key, 0) + 1
+                    ids.setdefault(key, child)
+
+                self._ids = ids
+                self._id_counts = counts
+
+        return ids
+
+    @_synchronized
+    def append(self, instance):
+        super(Context, self).append(instance)
+        self._added([instance])
+
+    @_synchronized
+    def extend(self, instances):
+        instances = list(instances)
+        super(Context, self).extend(instances)
+        self._added(instances)
+
+    def __iadd__(self, instances):
+        self.extend(instances)
+        return self
+
+    @_synchronized
+    def insert(self, index, instance):
+        super(Context, self).insert(index, instance)
+        self._added([instance], appended=False)
+
+    @_synchronized
+    def pop(self, index=-1):
+        instance = super(Context, self).pop(index)
+        self._removed([instance])
+        return instance
+
+    @_synchronized
+    def remove(self, instance):
+        return self.pop(self.index(instance))
+
+    @_synchronized
+    def clear(self):
+        del self[:]
+
+    @_synchronized
+    def __delitem__(self, index):
+        removed = list.__getitem__(self, index)
+        super(Context, self).__delitem__(index)
+        self._removed(removed if isinstance(index, slice) else [removed])
+
+    @_synchronized
+    def __setitem__(self, index, value):
+        removed = list.__getitem__(self, index)
+
+        if isinstance(index, slice):
+            value = list(value)
+
+        super(Context, self).__setitem__(index, value)
+
+        if isinstance(index, slice):
+            self._removed(removed)
+            self._added(value, appended=False)
+        else:
+            self._removed([removed])
+            self._added([value], appended=False)
+
+    if six.PY2:
+        def __delslice__(self, i, j):
+            self.__delitem__(slice(i, j))
+
+        def __setslice__(self, i, j, value):
+            self.__setitem__(slice(i, j), value)
+
+    @_synchronized
+    def __imul__(self, count):
+        instances = list(self)
+        super(Context, self).__imul__(count)
+
+        if count > 0:
+            self._added(instances * (count - 1))
+        else:
+            self._removed(instances)
+
+        return self
+
+    @_synchronized
+    def sort(self, *args, **kwargs):
+        super(Context, self).sort(*args, **kwargs)
+        self._reordered()
+
+    @_synchronized
+    def reverse(self):
+        super(Context, self).reverse()
+        self._reordered()
+
+    @_synchronized
+    def _indexed_families(self):
+        """Return index of instances by family, or None if unindexable"""
+        if self._family_index is None:
+            try:
+                self._family_index = _FamilyIndex(self)
+            except ValueError:
+                self._family_index = False
+
+        if self._family_index is False:
+            return None
+
+        self._family_index.refresh()
+        return self._family_index
+
+    @_synchronized
+    def _families_version(self):
+        """Return object equal to itself until instances or families change
+
+        Returns:
+            Tuple of index and version, or None if they cannot be indexed
+
+        """
+
+        index = self._indexed_families()
+
+        if index is None:
+            return None
+
+        return (index, index.version)
+
+    @_synchronized
+    def _estimate_by_families(self, families, match):
+        """Return an estimate of the number of instances compatible
+
+        Returns:
+            Number of instances, or None if they cannot be indexed
+
+        """
+
+        index = self._indexed_families()
+
+        if index is None:
+            return None
+
+        return index.estimate(families, match)
+
+    @_synchronized
+    def _instances_by_families(self, families, match):
+        """Return instances compatible with `families`, by index
+
+        The index is built on first use, and rebuilt once the order
+        of instances has changed, see :class:`_FamilyIndex`.
+
+        Returns:
+            List of instances, or None if they cannot be indexed
+
+        """
+
+        index = self._indexed_families()
+
+        if index is None:
+            return None
+
+        return index.query(families, match)
+
+    def __contains__(self, key):
+        """Support both Instance objects and `id` strings
+
+        Example:
+            >>> context = Context()
+            >>> instance = context.create_instance("MyInstance")
+            >>> instance.id in context
+            True
+            >>> instance in context
+            True
+            >>> "NotExists" in context
             False
 
         """
@@ -763,7 +1924,10 @@ class Context(AbstractEntity):
         except Exception:
             pass
 
-        return key in [c.id for c in self]
+        try:
+            return key in self._id_index()
+        except TypeError:
+            return False  # Unhashable
 
     def create_instance(self, name, **kwargs):
         """Convenience method of the following.
@@ -794,8 +1958,8 @@ class Context(AbstractEntity):
         if isinstance(item, int):
             return super(Context, self).__getitem__(item)
         try:
-            return next(c for c in self if c.id == item)
-        except StopIteration:
+            return self._id_index()[item]
+        except (KeyError, TypeError):
             raise KeyError("%s not in list" % item)
 
     def get(self, key, default=None):
@@ -808,7 +1972,10 @@ class Context(AbstractEntity):
 
         """
 
-        return next((c for c in self if c.id == key), default)
+        try:
+            return self._id_index().get(key, default)
+        except TypeError:
+            return default  # Unhashable
 
 
 @lib.log
@@ -826,12 +1993,36 @@ class Instance(AbstractEntity):
 
     """
 
+    __slots__ = ("_families_set", "_family_indexes", "_context")
+
     def __init__(self, name, parent=None, **kwargs):
+        self._family_indexes = None
         super(Instance, self).__init__(name, parent)
         self._data["family"] = "default"
         self._data["name"] = name
         self._data.update(kwargs)
 
+    def __setstate__(self, state):
+        super(Instance, self).__setstate__(state)
+        self._family_indexes = None
+
+    @_synchronized
+    def _families_changed(self):
+        self._families_set = None
+
+        for ref in self._family_indexes or ():
+            index = ref()
+
+            if index is not None:
+                index.update(self)
+
+    def _families_read(self):
+        for ref in self._family_indexes or ():
+            index = ref()
+
+            if index is not None:
+                index.stale()
+
     def __eq__(self, other):
         return self._id == getattr(other, "id", None)
 
@@ -846,17 +2037,30 @@ class Instance(AbstractEntity):
 
     @property
     def context(self):
-        """Return top-level parent; the context"""
+        """Return top-level parent; the context
+
+        The context is looked up once, and again only after an entity
+        has been re-parented via :attr:`AbstractEntity.parent`.
+
+        """
+
+        try:
+            generation, context = self._context
+        except AttributeError:
+            pass
+        else:
+            if generation == AbstractEntity._hierarchy_generation:
+                return context
+
         parent = self.parent
-        while parent.parent:
-            try:
-                parent = parent.parent
-            except Exception:
-                break
+        while parent.parent is not None:
+            parent = parent.parent
 
         assert isinstance(parent, Context), ("Parent was not a Context:"
                                              "%s" % type(parent))
 
+        self._context = (AbstractEntity._hierarchy_generation, parent)
+
         return parent
 
 
@@ -1113,14 +2317,40 @@ def registered_plugins():
 
     for plugin in _registered_plugins.values():
         # Maintain immutability across retrievals
-        copy = type(plugin.__name__, (plugin,), {})
-        copy._id = plugin._id
-        copy.__doc__ = plugin.__doc__
-        plugins.append(copy)
+        plugins.append(_copy_plugin(plugin))
 
     return plugins
 
 
+def _copy_plugin(plugin):
+    """Return subclass of `plugin` sharing its id and docstring
+
+    Public attributes that are lists, dictionaries or sets are copied
+    (shallowly), such that changes made in-place to those of the
+    subclass, e.g. families.append(), leave `plugin` as-is.
+
+    """
+
+    attributes = dict()
+
+    for key in dir(plugin):
+        if key.startswith("_"):
+            continue
+
+        value = getattr(plugin, key, None)
+
+        if isinstance(value, (list, dict, set)):
+            attributes[key] = type(value)(value)
+
+    if plugin.__dict__.get("__lazy__"):
+        attributes["__lazy__"] = True
+
+    copy = type(plugin.__name__, (plugin,), attributes)
+    copy._id = plugin._id
+    copy.__doc__ = plugin.__doc__
+    return copy
+
+
 def register_host(host):
     """Register a new host
 
@@ -1136,6 +2366,7 @@ def register_host(host):
 
     if host not in _registered_hosts:
         _registered_hosts.append(host)
+        host_index.bump()
 
 
 def deregister_host(host, quiet=False):
@@ -1154,10 +2385,13 @@ def deregister_host(host, quiet=False):
     except Exception as e:
         if not quiet:
             raise e
+    else:
+        host_index.bump()
 
 
 def deregister_all_hosts():
     _registered_hosts[:] = []
+    host_index.bump()
 
 
 def registered_hosts():
@@ -1165,33 +2399,115 @@ def registered_hosts():
     return list(_registered_hosts)
 
 
-def current_target():
-    return _registered_targets[-1] if _registered_targets else ""
-
-
-def register_target(target):
-    """Register a new target
+class HostIndex(object):
+    """Registered hosts, frozen for repeated compatibility checks
 
-    Registered targets can be used in plug-ins to determin outputs
+    Registered hosts are kept as a frozenset, recomputed only once the
+    generation has been bumped by registering or deregistering a host.
+    Together with the frozenset of hosts of each plug-in, determining
+    whether a plug-in is compatible amounts to a set intersection
+    rather than a scan of both lists.
 
-    Example:
-        >>> register_target("Studio")
-        >>> "Studio" in registered_targets()
-        True
-        >>> current_target()
-        'Studio'
+    Attributes:
+        generation (int): Incremented on every change to registered hosts
 
     """
 
-    if target in _registered_targets:
-        idx = _registered_targets.index(target)
-        _registered_targets.pop(idx)
+    def __init__(self):
+        self.generation = 0
+        self._frozen = (-1, frozenset(), ())
 
-    _registered_targets.append(target)
+    def bump(self):
+        self.generation += 1
 
+    def _current(self):
+        frozen = self._frozen
 
-def deregister_target(target, quiet=False):
-    """Remove an already registered target
+        if frozen[0] != self.generation:
+            hosts = frozenset(_registered_hosts)
+            frozen = (self.generation, hosts, tuple(sorted(hosts)))
+            self._frozen = frozen
+
+        return frozen
+
+    @property
+    def hosts(self):
+        """Return frozenset of registered hosts"""
+        return self._current()[1]
+
+    @property
+    def key(self):
+        """Return sorted tuple of registered hosts, for use in cache keys"""
+        return self._current()[2]
+
+    def is_compatible(self, plugin):
+        """Return whether `plugin` supports any of the registered hosts"""
+        hosts = _attribute_set(plugin, "hosts")
+        return "*" in hosts or not hosts.isdisjoint(self.hosts)
+
+
+host_index = HostIndex()
+
+
+def register_id_generator(generator):
+    """Register callable used to generate ids of new entities
+
+    Applies to contexts, instances, plug-ins and actions created from
+    here on. Defaults to :data:`sequential_id`, or to :func:`uuid_id`
+    given the environment variable PYBLISH_UUID_IDS.
+
+    Arguments:
+        generator (callable): Called without arguments, returning
+            a new string, unique to each call
+
+    Example:
+        >>> register_id_generator(uuid_id)
+        >>> len(Context().id)
+        36
+        >>> deregister_id_generator()
+
+    """
+
+    _registered_id_generator["default"] = generator
+
+
+def registered_id_generator():
+    """Return the currently registered id generator, or None"""
+    return _registered_id_generator.get("default")
+
+
+def deregister_id_generator():
+    """Restore default id generator"""
+    _registered_id_generator.pop("default", None)
+
+
+def current_target():
+    return _registered_targets[-1] if _registered_targets else ""
+
+
+def register_target(target):
+    """Register a new target
+
+    Registered targets can be used in plug-ins to determin outputs
+
+    Example:
+        >>> register_target("Studio")
+        >>> "Studio" in registered_targets()
+        True
+        >>> current_target()
+        'Studio'
+
+    """
+
+    if target in _registered_targets:
+        idx = _registered_targets.index(target)
+        _registered_targets.pop(idx)
+
+    _registered_targets.append(target)
+
+
+def deregister_target(target, quiet=False):
+    """Remove an already registered target
 
     Arguments:
         target (str): Name of target
@@ -1289,16 +2605,18 @@ def plugin_paths():
     """
 
     paths = list()
+    seen = set()
 
     for path in registered_paths() + environment_paths():
-        if path in paths:
+        if path in seen:
             continue
+        seen.add(path)
         paths.append(path)
 
     return paths
 
 
-def discover(type=None, regex=None, paths=None):
+def discover(type=None, regex=None, paths=None, parallel=None, lazy=None):
     """Find and return available plug-ins
 
     This function looks for files within paths registered via
@@ -1320,6 +2638,15 @@ def discover(type=None, regex=None, paths=None):
             multiple plugins.
         paths (list, optional): Paths to discover plug-ins from.
             If no paths are provided, all paths are searched.
+        parallel (bool, optional): List, stat and read files using a
+            pool of threads, which helps when paths are located on a
+            network. Modules are still executed one at a time and in the
+            same order as otherwise. Defaults to :attr:`PARALLEL_DISCOVERY`.
+        lazy (bool, optional): Use manifests written by `pyblish index`
+            to return stand-ins for plug-ins, only executing their module
+            once processed. Modules without any plug-in compatible with
+            the registered hosts are not executed at all. Defaults to
+            :attr:`LAZY_DISCOVERY`, see :mod:`pyblish.manifest`.
 
     """
 
@@ -1330,58 +2657,80 @@ def discover(type=None, regex=None, paths=None):
         warnings.warn("discover(): regex argument "
                       "has been deprecated and does nothing")
 
-    plugins = dict()
-    plugin_names = []
+    if parallel is None:
+        parallel = PARALLEL_DISCOVERY
+
+    if lazy is None:
+        lazy = LAZY_DISCOVERY
+
+    # Hosts are part of every cache key, compute them once per discovery
+    hosts = host_index.key
 
     # Include plug-ins from registered paths
-    for path in paths or plugin_paths():
-        path = os.path.normpath(path)
-        if not os.path.isdir(path):
-            log.debug("Skipped: \"%s\", path is not a valid folder", path)
+    paths = list(os.path.normpath(path) for path in paths or plugin_paths())
+    files = list()
+
+    for path_files in _map(_scan_plugin_path, paths, parallel):
+        files.extend(path_files)
+
+    # Manifest entries per file, for lazy discovery
+    entries = _manifest_entries(paths) if lazy else dict()
+
+    stats = _map(lambda abspath: _read_plugin_file(
+                 abspath, hosts, entries.get(abspath)),
+                 list(abspath for abspath, mod_name in files),
+                 parallel)
+
+    modules = list()
+
+    for (abspath, mod_name), (key, source) in zip(files, stats):
+        entry = entries.get(abspath)
+
+        try:
+            if entry is not None and manifest.is_current(
+                    entry, key[1], key[2]):
+                module, module_plugins = _lazy_plugin_module(
+                    abspath, mod_name, entry)
+
+            else:
+                module, module_plugins = _load_plugin_module(
+                    abspath, mod_name, key, source)
+
+        except Exception as err:
+            log.error("Skipped: \"%s\" (%s)", mod_name, err)
             continue
 
-        for fname in os.listdir(path):
-            if fname.startswith("_"):
-                log.debug("Skipped: \"%s\", starts with _", fname)
-                continue
+        modules.append((module.__file__, module_plugins))
 
-            abspath = os.path.join(path, fname)
+    return _assemble_plugins(modules)
 
-            if not os.path.isfile(abspath):
-                log.debug("Skipped: \"%s\", not a valid file", abspath)
-                continue
 
-            mod_name, mod_ext = os.path.splitext(fname)
+def _assemble_plugins(modules):
+    """Return final list of plug-ins, given plug-ins per module
 
-            if not mod_ext == ".py":
-                log.debug("Skipped: \"%s\",\"%s\", not end in .py", mod_name, mod_ext)
-                continue
+    Duplicates are removed, registered plug-ins included
+    and the result sorted and filtered.
 
-            module = types.ModuleType(mod_name)
-            module.__file__ = abspath
+    Arguments:
+        modules (list): Absolute path of each module, and its plug-ins,
+            in the order in which they were discovered.
 
-            try:
-                # Store reference to original module, to avoid
-                # garbage collection from collecting it's global
-                # imports, such as `import os`.
-                sys.modules[abspath] = module
-                with open(abspath, "rb") as f:
-                    six.exec_(f.read(), module.__dict__)
-
-            except Exception as err:
-                log.error("Skipped: \"%s\" (%s)", mod_name, err)
-                continue
+    """
 
-            for plugin in plugins_from_module(module):
-                if not ALLOW_DUPLICATES and plugin.__name__ in plugin_names:
-                    log.debug("Duplicate plug-in found: %s", plugin)
-                    continue
+    plugins = dict()
+    plugin_names = set()
+
+    for abspath, module_plugins in modules:
+        for plugin in module_plugins:
+            if not ALLOW_DUPLICATES and plugin.__name__ in plugin_names:
+                log.debug("Duplicate plug-in found: %s", plugin)
+                continue
 
-                plugin_names.append(plugin.__name__)
+            plugin_names.add(plugin.__name__)
 
-                plugin.__module__ = module.__file__
-                key = "{0}.{1}".format(plugin.__module__, plugin.__name__)
-                plugins[key] = plugin
+            plugin.__module__ = abspath
+            key = "{0}.{1}".format(plugin.__module__, plugin.__name__)
+            plugins[key] = plugin
 
     # Include plug-ins from registration.
     # Directly registered plug-ins take precedence.
@@ -1390,7 +2739,7 @@ def discover(type=None, regex=None, paths=None):
             log.debug("Duplicate plug-in found: %s", plugin)
             continue
 
-        plugin_names.append(plugin.__name__)
+        plugin_names.add(plugin.__name__)
 
         plugins[plugin.__name__] = plugin
 
@@ -1404,6 +2753,575 @@ def discover(type=None, regex=None, paths=None):
     return plugins
 
 
+class Discoverer(object):
+    """Discover plug-ins incrementally
+
+    Holds on to the modules found during the previous call to
+    :meth:`refresh`, and only executes files that have since been
+    added or changed, as determined by their modification time and
+    size. Plug-ins of removed files are dropped, and files that failed
+    to load are executed anew on each refresh, e.g. once a module they
+    import becomes available. The result is otherwise identical to
+    that of :func:`discover`.
+
+    Each refresh returns new subclasses of the plug-ins found, with
+    attributes that are lists, dictionaries or sets copied, rather than
+    the new classes of a cold :func:`discover`. Changes made in-place
+    to such attributes do not carry over to the next refresh, whereas
+    changes to objects nested within them, or to module-level state of
+    unchanged files, do.
+
+    Arguments:
+        paths (list, optional): Paths to discover plug-ins from,
+            defaults to those of :func:`plugin_paths` at each refresh.
+        parallel (bool, optional): List, stat and read files using a
+            pool of threads, see :func:`discover`.
+        lazy (bool, optional): Return stand-ins for plug-ins described
+            by manifests, see :func:`discover`.
+
+    Example:
+        >>> discoverer = Discoverer()
+        >>> plugins = discoverer.refresh()
+        >>> discoverer.changed()
+        False
+
+    """
+
+    def __init__(self, paths=None, parallel=None, lazy=None):
+        self._paths = paths
+        self._parallel = PARALLEL_DISCOVERY if parallel is None \
+            else parallel
+        self._lazy = LAZY_DISCOVERY if lazy is None else lazy
+        self._modules = dict()
+        self._failed = set()  # Files that failed to load, retried
+        self._watcher = None
+
+    def _normpaths(self):
+        return list(os.path.normpath(path)
+                    for path in self._paths or plugin_paths())
+
+    def _files(self, paths=None):
+        hosts = host_index.key
+        files = list()
+
+        for path_files in _map(_scan_plugin_path,
+                               paths or self._normpaths(),
+                               self._parallel):
+            files.extend(path_files)
+
+        def key(abspath):
+            try:
+                return _plugin_file_key(abspath, hosts)
+            except OSError:
+                return None  # Removed since listed
+
+        keys = _map(key, list(abspath for abspath, _ in files),
+                    self._parallel)
+
+        return list((abspath, mod_name, key)
+                    for (abspath, mod_name), key in zip(files, keys)
+                    if key is not None)
+
+    def _snapshot(self, refreshed=False):
+        if refreshed:
+            return dict((abspath, module[0])
+                        for abspath, module in self._modules.items())
+
+        return dict((abspath, key) for abspath, _, key in self._files())
+
+    def changed(self):
+        """Return whether any plug-in file was added, changed or removed"""
+        return self._snapshot() != self._snapshot(refreshed=True)
+
+    def refresh(self):
+        """Return plug-ins, executing only modules changed since last time"""
+        hosts = host_index.key
+        paths = self._normpaths()
+        files = self._files(paths)
+
+        # Manifest entries per file, for lazy discovery
+        entries = _manifest_entries(paths) if self._lazy else dict()
+
+        changed = list(
+            abspath for abspath, mod_name, key in files
+            if abspath in self._failed or
+            self._modules.get(abspath, (None,))[0] != key
+        )
+
+        stats = dict(zip(changed, _map(
+            lambda abspath: _read_plugin_file(
+                abspath, hosts, entries.get(abspath)),
+            changed,
+            self._parallel)))
+
+        modules = dict()
+        failed = set()
+        found = list()
+
+        for abspath, mod_name, key in files:
+            if abspath not in stats:
+                modules[abspath] = self._modules[abspath]
+
+            else:
+                read_key, source = stats[abspath]
+                entry = entries.get(abspath)
+
+                try:
+                    if entry is not None and manifest.is_current(
+                            entry, read_key[1], read_key[2]):
+                        module, module_plugins = _lazy_plugin_module(
+                            abspath, mod_name, entry)
+
+                    else:
+                        module, module_plugins = _load_plugin_module(
+                            abspath, mod_name, read_key, source)
+
+                except Exception as err:
+                    log.error("Skipped: \"%s\" (%s)", mod_name, err)
+                    module_plugins = list()
+                    failed.add(abspath)
+
+                modules[abspath] = (key, module_plugins)
+
+            found.append((abspath, list(
+                _copy_plugin(plugin) for plugin in modules[abspath][1])))
+
+        self._modules = modules
+        self._failed = failed
+
+        return _assemble_plugins(found)
+
+    def watch(self, callback, interval=1.0):
+        """Call `callback` from a background thread on changes to any file
+
+        Files are polled every `interval` seconds, until :meth:`unwatch`,
+        and `callback` called without arguments once per change since
+        the last refresh. Call
+        :meth:`refresh` from there or, for GUIs, from the main thread.
+
+        """
+
+        import threading
+
+        self.unwatch()
+        stop = threading.Event()
+
+        def poll(previous):
+            while not stop.wait(interval):
+                try:
+                    current = self._snapshot()
+
+                    if current != previous:
+                        previous = current
+                        callback()
+
+                except Exception:
+                    log.exception("Unexpected error whilst watching files")
+
+        thread = threading.Thread(target=poll,
+                                  args=(self._snapshot(refreshed=True),),
+                                  name="pyblish.Discoverer")
+        thread.daemon = True
+        thread.start()
+
+        self._watcher = stop
+
+    def unwatch(self):
+        """Stop watching files, see :meth:`watch`"""
+        if self._watcher is not None:
+            self._watcher.set()
+            self._watcher = None
+
+
+class DiscoveryCache(object):
+    """Remember compiled plug-in modules between calls to :func:`discover`
+
+    Each file is stored alongside a key made up of its absolute path,
+    modification time and size, the running version of Pyblish and the
+    currently registered hosts. A file whose key is unchanged is neither
+    re-read nor re-compiled, and the plug-ins it contained are picked
+    up by name rather than validated anew.
+
+    The module itself is still executed on each discovery, such that
+    every call to :func:`discover` returns fresh classes.
+
+    Attributes:
+        hits (int): Number of files served from the cache
+        misses (int): Number of files read and compiled from disk
+
+    """
+
+    def __init__(self):
+        self._entries = dict()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, abspath):
+        return os.path.normpath(abspath) in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, abspath, key):
+        """Return code and plug-in names for `abspath`, or None
+
+        Arguments:
+            abspath (str): Absolute path to plug-in file
+            key (tuple): Key computed from the current state of `abspath`
+
+        """
+
+        entry = self._entries.get(abspath)
+
+        if entry is None or entry[0] != key:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry[1:]
+
+    def is_current(self, abspath, key):
+        """Return whether `abspath` is cached under `key`, without counting"""
+        entry = self._entries.get(abspath)
+        return entry is not None and entry[0] == key
+
+    def set(self, abspath, key, code, names=None):
+        self._entries[abspath] = (key, code, names)
+
+    def invalidate(self, abspath=None):
+        """Forget about `abspath`, or every file if None is given"""
+        if abspath is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(os.path.normpath(abspath), None)
+
+    def reset_counters(self):
+        self.hits = 0
+        self.misses = 0
+
+
+discovery_cache = DiscoveryCache()
+
+
+def _bytecode_path(abspath):
+    """Return path to the cached bytecode of plug-in file `abspath`"""
+    mod_name = os.path.splitext(os.path.basename(abspath))[0]
+    digest = hashlib.sha1(abspath.encode("utf-8")).hexdigest()
+    return os.path.join(BYTECODE_CACHE_DIR,
+                        "%s-%s.pyc" % (mod_name, digest[:16]))
+
+
+def _compile_plugin_source(source, abspath):
+    """Compile `source` of `abspath`, reusing on-disk bytecode if possible
+
+    Bytecode is stored in :attr:`BYTECODE_CACHE_DIR` along with the
+    magic number of the running interpreter and a hash of the source
+    it was compiled from. Either differing means the bytecode is stale
+    and the source is compiled anew.
+
+    The code carries `abspath` as its file name, such that tracebacks
+    point to the actual plug-in file.
+
+    Arguments:
+        source (bytes): Contents of `abspath`
+        abspath (str): Absolute path to plug-in file
+
+    Returns:
+        Code object
+
+    """
+
+    if not BYTECODE_CACHE_DIR:
+        return compile(source, abspath, "exec", 0, True)
+
+    checksum = hashlib.sha1(source).digest()
+    header = BYTECODE_MAGIC + checksum
+    cachepath = _bytecode_path(abspath)
+
+    try:
+        with open(cachepath, "rb") as f:
+            data = f.read()
+
+    except (IOError, OSError):
+        pass
+
+    else:
+        if data[:len(header)] == header:
+            try:
+                code = marshal.loads(data[len(header):])
+            except (EOFError, ValueError, TypeError):
+                log.debug("Corrupt bytecode: \"%s\"", cachepath)
+            else:
+                if code.co_filename == abspath:
+                    return code
+
+    code = compile(source, abspath, "exec", 0, True)
+
+    # Write to a temporary file first, such that concurrent
+    # processes never read a partially written file.
+    tmppath = "%s.%i.tmp" % (cachepath, os.getpid())
+
+    try:
+        if not os.path.isdir(BYTECODE_CACHE_DIR):
+            os.makedirs(BYTECODE_CACHE_DIR)
+
+        with open(tmppath, "wb") as f:
+            f.write(header + marshal.dumps(code))
+
+        if os.path.exists(cachepath):
+            os.remove(cachepath)  # Windows won't rename onto existing files
+        os.rename(tmppath, cachepath)
+
+    except (IOError, OSError) as e:
+        log.debug("Could not write bytecode: \"%s\" (%s)", cachepath, e)
+
+        try:
+            os.remove(tmppath)
+        except (IOError, OSError):
+            pass
+
+    return code
+
+
+def _map(func, iterable, parallel=False):
+    """Return list of `func` applied to `iterable`, optionally threaded"""
+    if not parallel:
+        return list(map(func, iterable))
+
+    from multiprocessing.pool import ThreadPool
+
+    pool = ThreadPool(DISCOVERY_THREADS)
+
+    try:
+        return pool.map(func, iterable)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _scan_plugin_path(path):
+    """Return absolute path and module name of plug-in files in `path`"""
+    files = list()
+
+    if not os.path.isdir(path):
+        log.debug("Skipped: \"%s\", path is not a valid folder", path)
+        return files
+
+    for fname in os.listdir(path):
+        if fname.startswith("_"):
+            log.debug("Skipped: \"%s\", starts with _", fname)
+            continue
+
+        abspath = os.path.join(path, fname)
+
+        if not os.path.isfile(abspath):
+            log.debug("Skipped: \"%s\", not a valid file", abspath)
+            continue
+
+        mod_name, mod_ext = os.path.splitext(fname)
+
+        if not mod_ext == ".py":
+            log.debug("Skipped: \"%s\",\"%s\", not end in .py", mod_name, mod_ext)
+            continue
+
+        files.append((abspath, mod_name))
+
+    return files
+
+
+def _plugin_file_key(abspath, hosts):
+    """Return key identifying the current state of plug-in file `abspath`"""
+    stat = os.stat(abspath)
+    return (abspath, stat.st_mtime, stat.st_size, __version__, hosts)
+
+
+def _read_plugin_file(abspath, hosts, entry=None):
+    """Return cache key and source of `abspath`
+
+    The source is only read when not already present in the discovery
+    cache nor described by manifest `entry`, otherwise None is returned
+    in its place.
+
+    Errors are returned in place of a key, to be raised
+    once the file is loaded by :func:`_load_plugin_module`.
+
+    """
+
+    try:
+        key = _plugin_file_key(abspath, hosts)
+
+        if DISCOVERY_CACHE and discovery_cache.is_current(abspath, key):
+            return key, None
+
+        if entry is not None and manifest.is_current(entry, key[1], key[2]):
+            return key, None
+
+        with open(abspath, "rb") as f:
+            return key, f.read()
+
+    except Exception as e:
+        return e, None
+
+
+def _load_plugin_module(abspath, mod_name, key, source=None):
+    """Execute plug-in file `abspath` and return it along with its plug-ins
+
+    Arguments:
+        abspath (str): Absolute path to a Python file
+        mod_name (str): Name given to the resulting module
+        key (tuple): Cache key, as returned by :func:`_read_plugin_file`
+        source (bytes, optional): Contents of `abspath`, read
+            from disk if not provided and not already cached.
+
+    Returns:
+        Tuple of module and the plug-ins found within it
+
+    """
+
+    if isinstance(key, Exception):
+        raise key
+
+    entry = discovery_cache.get(abspath, key) if DISCOVERY_CACHE else None
+
+    if entry is not None:
+        code, names = entry
+
+    else:
+        if source is None:
+            with open(abspath, "rb") as f:
+                source = f.read()
+
+        code = _compile_plugin_source(source, abspath)
+        names = None
+
+    module = types.ModuleType(mod_name)
+    module.__file__ = abspath
+
+    # Store reference to original module, to avoid
+    # garbage collection from collecting it's global
+    # imports, such as `import os`.
+    sys.modules[abspath] = module
+    six.exec_(code, module.__dict__)
+
+    if names is not None:
+        plugins = list(module.__dict__[name] for name in names
+                       if name in module.__dict__)
+
+    else:
+        names, plugins = [], []
+        for name, plugin in _named_plugins_from_module(module):
+            names.append(name)
+            plugins.append(plugin)
+
+        if DISCOVERY_CACHE:
+            discovery_cache.set(abspath, key, code, names)
+
+    return module, plugins
+
+
+def _manifest_entries(paths):
+    """Return manifest entries of files in `paths`, by absolute path"""
+    entries = dict()
+
+    for path in paths:
+        contents = manifest.read(path)
+
+        if contents is None:
+            continue
+
+        for fname, entry in contents["files"].items():
+            entries[os.path.join(path, fname)] = entry
+
+    return entries
+
+
+def _lazy_plugin_module(abspath, mod_name, entry):
+    """Return stand-in module and plug-ins of `abspath` from manifest `entry`
+
+    The module of `abspath` is left unexecuted. Plug-ins are represented
+    by subclasses of :class:`ContextPlugin` or :class:`InstancePlugin`
+    carrying the attributes and docstring of the actual plug-in, and
+    whose process() executes the module the first time it is called.
+
+    """
+
+    module = types.ModuleType(mod_name)
+    module.__file__ = abspath
+
+    for description in entry["plugins"]:
+        Base = ContextPlugin if description["base"] == "ContextPlugin" \
+            else InstancePlugin
+
+        attributes = dict(description["attributes"])
+        attributes.update({
+            "__doc__": description["doc"],
+            "__module__": abspath,
+            "__lazy__": True,
+            "process": _lazy_process[description["argument"]],
+        })
+
+        plugin = type(Base)(str(description["name"]), (Base,), attributes)
+
+        setattr(module, description["name"], plugin)
+
+    return module, plugins_from_module(module)
+
+
+def _resolve_lazy_plugin(plugin):
+    """Return actual plug-in of lazily discovered `plugin`"""
+    resolved = plugin.__dict__.get("__resolved__")
+
+    if resolved is not None:
+        return resolved
+
+    abspath = plugin.__module__
+    mod_name = os.path.splitext(os.path.basename(abspath))[0]
+    hosts = host_index.key
+
+    key, source = _read_plugin_file(abspath, hosts)
+    module, _ = _load_plugin_module(abspath, mod_name, key, source)
+
+    resolved = module.__dict__[plugin.__name__]
+    resolved.__module__ = abspath
+
+    setattr(plugin, "__resolved__", resolved)
+
+    return resolved
+
+
+def _lazy_runner(plugin):
+    """Return actual plug-in instance for stand-in plug-in instance `plugin`
+
+    Attributes of the stand-in, which may have been modified since
+    discovery, take precedence over those of the actual plug-in.
+
+    """
+
+    Plugin = type(plugin)
+    runner = _resolve_lazy_plugin(Plugin)()
+
+    for key in ("hosts", "families", "targets", "label", "active",
+                "optional", "order", "match", "requires", "version"):
+        if hasattr(Plugin, key):
+            setattr(runner, key, getattr(Plugin, key))
+
+    return runner
+
+
+def _lazy_process_context(self, context):
+    return _lazy_runner(self).process(context)
+
+
+def _lazy_process_instance(self, instance):
+    return _lazy_runner(self).process(instance)
+
+
+_lazy_process = {
+    "context": _lazy_process_context,
+    "instance": _lazy_process_instance,
+}
+
+
 def plugins_from_module(module):
     """Return plug-ins from module
 
@@ -1416,6 +3334,17 @@ def plugins_from_module(module):
 
     """
 
+    return list(plugin for _, plugin in _named_plugins_from_module(module))
+
+
+def _named_plugins_from_module(module):
+    """Return plug-ins from module along with the name bound to each
+
+    Plug-ins may be bound to names other than their own, such as
+    those created by a factory function.
+
+    """
+
     plugins = list()
 
     for name in dir(module):
@@ -1445,7 +3374,7 @@ def plugins_from_module(module):
             log.debug("No supported host found for plugin:%s",  obj)
             continue
 
-        plugins.append(obj)
+        plugins.append((name, obj))
 
     return plugins
 
@@ -1508,12 +3437,52 @@ def version_is_compatible(plugin):
 
     """
 
-    if not iscompatible.iscompatible(requirements=plugin.requires,
-                                     version=version_info):
+    if not requirements_are_compatible(plugin.requires, version_info):
         return False
     return True
 
 
+@lib.lru_cache(maxsize=256)
+def parse_requirements(requires):
+    """Return tuple of (operator, version) pairs of `requires`
+
+    Results are memoized, see :func:`clear_compatibility_cache`.
+
+    Example:
+        >>> parse_requirements("pyblish>=1, <2")
+        (('>=', (1,)), ('<', (2,)))
+
+    """
+
+    return tuple(
+        (operator, iscompatible.string_to_tuple(required))
+        for operator, required in iscompatible.parse_requirements(requires)
+    )
+
+
+@lib.lru_cache(maxsize=256)
+def requirements_are_compatible(requires, version):
+    """Return whether `requires` is compatible with `version`
+
+    Equivalent to :func:`iscompatible.iscompatible` with
+    results memoized, see :func:`clear_compatibility_cache`.
+
+    Arguments:
+        requires (str): Requirement, e.g. "pyblish>=1"
+        version (tuple): Version to compare against, e.g. (1, 0, 1)
+
+    """
+
+    return all(iscompatible.operators[operator](version, required)
+               for operator, required in parse_requirements(requires))
+
+
+def clear_compatibility_cache():
+    """Forget memoized results of :func:`version_is_compatible`"""
+    parse_requirements.cache_clear()
+    requirements_are_compatible.cache_clear()
+
+
 def host_is_compatible(plugin):
     """Determine whether plug-in `plugin` is compatible with the current host
 
@@ -1524,10 +3493,7 @@ def host_is_compatible(plugin):
 
     """
 
-    if "*" in plugin.hosts:
-        return True
-
-    return any(host in plugin.hosts for host in registered_hosts())
+    return host_index.is_compatible(plugin)
 
 
 def sort(plugins):
@@ -3,11 +3,15 @@
 from __future__ import absolute_import
 
 # Standard library
+import os
+import sys
+import pickle
 import logging
 import warnings
 
 # Local library
 from . import api, logic, plugin, lib
+from .vendor import six
 
 log = logging.getLogger("pyblish.util")
 
@@ -27,7 +31,8 @@ __all__ = [
 ]
 
 
-def publish(context=None, plugins=None, targets=None):
+def publish(context=None, plugins=None, targets=None, workers=None,
+            processes=None):
     """Publish everything
 
     This function will process all available plugins of the
@@ -40,6 +45,10 @@ def publish(context=None, plugins=None, targets=None):
         plugins (list, optional): Plug-ins to include,
             defaults to results of discover()
         targets (list, optional): Targets to include for publish session.
+        workers (int, optional): Process the instances of each plug-in
+            using this many threads, see :func:`publish_iter`.
+        processes (int, optional): Process the instances of supporting
+            plug-ins using this many processes, see :func:`publish_iter`.
 
     Returns:
         Context: The context processed by the plugins.
@@ -53,13 +62,14 @@ def publish(context=None, plugins=None, targets=None):
 
     context = context if context is not None else api.Context()
 
-    for _ in publish_iter(context, plugins, targets):
+    for _ in publish_iter(context, plugins, targets, workers, processes):
         pass
 
     return context
 
 
-def publish_iter(context=None, plugins=None, targets=None):
+def publish_iter(context=None, plugins=None, targets=None, workers=None,
+                 processes=None):
     """Publish iterator
 
     This function will process all available plugins of the
@@ -72,6 +82,17 @@ def publish_iter(context=None, plugins=None, targets=None):
         plugins (list, optional): Plug-ins to include,
             defaults to results of discover()
         targets (list, optional): Targets to include for publish session.
+        workers (int, optional): Process the instances of each plug-in
+            using this many threads. Plug-ins are still processed one
+            at a time, in order, and results are yielded in the same
+            order as when processed serially. Collectors are always
+            processed serially. Defaults to serial processing.
+        processes (int, optional): Process the instances of plug-ins
+            with :attr:`Plugin.multiprocess` using this many processes,
+            e.g. CPU-bound extractors. Each process is given a copy of
+            the data of an instance, and changes to it are merged back
+            along with records and errors. Plug-ins must be discovered
+            or importable, and data picklable.
 
     Yields:
         tuple of dict and Context: A tuple is returned with a dictionary and
@@ -87,13 +108,16 @@ def publish_iter(context=None, plugins=None, targets=None):
                print result
 
     """
-    for result in _convenience_iter(context, plugins, targets):
+    for result in _convenience_iter(context, plugins, targets,
+                                    workers=workers,
+                                    processes=processes):
         yield result
 
     api.emit("published", context=context)
 
 
-def _convenience_iter(context=None, plugins=None, targets=None, order=None):
+def _convenience_iter(context=None, plugins=None, targets=None, order=None,
+                      workers=None, processes=None):
     # Must check against None, as objects be emptys
     context = api.Context() if context is None else context
     plugins = api.discover() if plugins is None else plugins
@@ -104,73 +128,28 @@ def _convenience_iter(context=None, plugins=None, targets=None, order=None):
             if lib.inrange(Plugin.order, order)
         )
 
-    # Do not consider inactive plug-ins
-    plugins = list(p for p in plugins if p.active)
-    collectors = list(p for p in plugins if lib.inrange(
-        number=p.order,
-        base=api.CollectorOrder)
-    )
-
-    # Compute an approximation of all future tasks
-    # NOTE: It's an approximation, because tasks are
-    # dynamically determined at run-time by contents of
-    # the context and families of contained instances;
-    # each of which may differ between task.
-    task_count = len(list(logic.Iterator(plugins, context, targets=targets)))
+    pipeline = _Pipeline(context, plugins, targets)
 
     # First pass, collection
-    tasks_processed_count = 1
-    for Plugin, instance in logic.Iterator(collectors,
+    for Plugin, instance in logic.Iterator(pipeline.collectors,
                                            context,
                                            targets=targets):
         result = plugin.process(Plugin, context, instance)
+        pipeline.collected(Plugin, result)
 
-        # Inject additional member for results here.
-        result["progress"] = float(tasks_processed_count) / task_count
-
-        tasks_processed_count += 1
         yield result
 
-    # Exclude collectors from further processing
-    plugins = list(p for p in plugins if p not in collectors)
-
-    # Exclude plug-ins that do not have at
-    # least one compatible instance.
-    for Plugin in list(plugins):
-        if Plugin.__instanceEnabled__:
-            if not logic.instances_by_plugin(context, Plugin):
-                plugins.remove(Plugin)
-
-    # Mutable state, used in Iterator
-    state = {
-        "nextOrder": None,
-        "ordersWithError": set()
-    }
+    pipeline.prepare()
 
     # Second pass, the remainder
-    for Plugin, instance in logic.Iterator(plugins,
-                                           context,
-                                           state,
-                                           targets=targets):
-        try:
-            result = plugin.process(Plugin, context, instance)
-            result["progress"] = (
-                float(tasks_processed_count) / task_count
-            )
-
-            tasks_processed_count += 1
-        except StopIteration:  # End of items
-            raise
-
-        except Exception:  # This is unexpected, most likely a bug
-            log.error("An expected exception occurred.\n")
-            raise
-
-        else:
-            # Make note of the order at which the
-            # potential error error occured.
-            if result["error"]:
-                state["ordersWithError"].add(Plugin.order)
+    for Plugin, result in _process_iter(pipeline.plugins,
+                                        context,
+                                        pipeline.state,
+                                        targets,
+                                        workers,
+                                        processes,
+                                        pipeline.plan):
+        pipeline.processed(Plugin, result)
 
         if isinstance(result, Exception):
             log.error("An unexpected error happened: %s" % result)
@@ -183,6 +162,497 @@ def _convenience_iter(context=None, plugins=None, targets=None, order=None):
         yield result
 
 
+class _Pipeline(object):
+    """Steps of publishing shared by publish_iter() and publish_aiter()
+
+    Plug-ins are filtered and sorted up-front, collectors processed
+    first, followed by the remainder once instances are collected,
+    see :func:`_convenience_iter`. Processing itself is left to the
+    caller, such that it may happen in threads or an event loop.
+
+    Attributes:
+        collectors (list): Plug-ins processed first, in order
+        plugins (list): Remaining plug-ins, as of :meth:`prepare`
+        plan (logic.Plan): Instances of remaining plug-ins
+        state (dict): Mutable state, used in logic.batches()
+
+    """
+
+    def __init__(self, context, plugins, targets=None):
+        # Do not consider inactive plug-ins
+        plugins = list(p for p in plugins if p.active)
+
+        # Plug-ins follow those they require, whether processed one at a
+        # time or concurrently. Invalid requirements are logged and
+        # ignored, see logic.dependencies().
+        plugins = logic.sort_by_dependencies(plugins)
+
+        self.collectors = list(p for p in plugins if lib.inrange(
+            number=p.order,
+            base=api.CollectorOrder)
+        )
+
+        self.plugins = plugins
+        self.plan = None
+        self.state = {
+            "nextOrder": None,
+            "ordersWithError": set()
+        }
+
+        self._context = context
+        self._targets = targets
+
+        # Progress is estimated as collectors add instances, rather
+        # than by a dry run of every plug-in against every instance.
+        self._progress = _Progress(plugins, context, targets)
+
+    def collected(self, Plugin, result):
+        """Make note of `result` of collector `Plugin`"""
+        self._progress.estimate()
+
+        # Inject additional member for results here.
+        result["progress"] = self._progress.next(Plugin)
+
+    def prepare(self):
+        """Determine remaining plug-ins, once collection is done"""
+
+        # Exclude collectors from further processing
+        plugins = list(p for p in self.plugins if p not in self.collectors)
+
+        # Match instances to plug-ins once, for
+        # as long as instances remain unchanged.
+        self.plan = logic.plan(plugins, self._context, self._targets)
+
+        # Exclude plug-ins that do not have at
+        # least one compatible instance.
+        self.plugins = list(p for p in self.plan.plugins
+                            if not p.__instanceEnabled__ or
+                            self.plan.instances(p))
+
+    def processed(self, Plugin, result):
+        """Make note of `result` of remaining `Plugin`"""
+        result["progress"] = self._progress.next(Plugin)
+
+        # Make note of the order at which the
+        # potential error error occured.
+        if result["error"]:
+            self.state["ordersWithError"].add(Plugin.order)
+
+
+class _Progress(object):
+    """Estimate progress of publishing `plugins`, as tasks are processed
+
+    The number of tasks of each plug-in is estimated from the index
+    of families of the context, see :func:`logic.estimate_instances`,
+    and re-estimated on request, e.g. as collectors add instances.
+
+    NOTE: It's an approximation, because tasks are dynamically
+    determined at run-time by contents of the context and families
+    of contained instances; each of which may differ between task.
+
+    """
+
+    def __init__(self, plugins, context, targets=None):
+        if not targets:
+            targets = ["default"] + api.registered_targets()
+
+        self._plugins = logic.plugins_by_targets(plugins, targets)
+        self._context = context
+        self._counts = dict()
+        self._after = dict()  # Tasks estimated after each plug-in
+
+        self._current = None
+        self._before = 0  # Tasks processed before the current plug-in
+        self._processed = 0
+
+        self.estimate()
+
+    def estimate(self):
+        """(Re-)estimate the number of tasks of each plug-in"""
+        remaining = 0
+
+        for Plugin in reversed(self._plugins):
+            self._after[Plugin] = remaining
+            self._counts[Plugin] = logic.estimate_instances(self._context,
+                                                            Plugin)
+            remaining += self._counts[Plugin]
+
+    def next(self, Plugin):
+        """Return progress as of having processed a task of `Plugin`"""
+        if Plugin is not self._current:
+            self._current = Plugin
+            self._before = self._processed
+
+            # Correct the estimate, now that instances are known
+            if Plugin.__instanceEnabled__:
+                self._counts[Plugin] = len(list(
+                    instance for instance
+                    in logic.instances_by_plugin(self._context, Plugin)
+                    if logic.is_publishable(instance)
+                ))
+
+        self._processed += 1
+
+        current = max(self._counts.get(Plugin, 1),
+                      self._processed - self._before)
+        total = self._before + current + self._after.get(Plugin, 0)
+
+        return float(self._processed) / total
+
+
+def _process_iter(plugins, context, state, targets=None, workers=None,
+                  processes=None, plan=None):
+    """Yield each plug-in along with its result, in order
+
+    Each batch of instances, see :func:`logic.batches`, is processed
+    by `workers` threads or, for plug-ins supporting it, `processes`
+    processes. Results are recorded in the order of instances, as they
+    become available. Plug-ins declaring `requires_plugins` are
+    scheduled by their dependencies instead, see :func:`_scheduled_iter`.
+
+    """
+
+    if (workers and workers > 1 or processes) and any(
+            plugin._attribute_set(Plugin, "requires_plugins")
+            for Plugin in plugins):
+        for Plugin, result in _scheduled_iter(plugins, context, state,
+                                              targets, workers, processes,
+                                              plan):
+            yield Plugin, result
+
+        return
+
+    pools = dict()
+
+    try:
+        for Plugin, instances in logic.batches(plugins,
+                                               context,
+                                               state,
+                                               targets=targets,
+                                               plan=plan):
+            if processes and _is_multiprocess(Plugin):
+                if "processes" not in pools:
+                    import multiprocessing
+                    pools["processes"] = multiprocessing.Pool(processes)
+
+                results = _remote_results(pools["processes"],
+                                          Plugin,
+                                          context,
+                                          _publishable(instances))
+
+            elif workers and workers > 1 and len(instances) > 1:
+                if "threads" not in pools:
+                    from multiprocessing.pool import ThreadPool
+                    pools["threads"] = ThreadPool(workers)
+
+                def process(instance, Plugin=Plugin):
+                    return plugin._process(Plugin, context, instance)
+
+                results = pools["threads"].imap(process,
+                                                _publishable(instances))
+
+            else:
+                # Instances are considered one at a time, as
+                # each may be deactivated by the one before it.
+                results = (
+                    plugin._process(Plugin, context, instance)
+                    for instance in instances
+                    if instance is None or logic.is_publishable(instance)
+                )
+
+            try:
+                for result in results:
+                    plugin._processed(context, result)
+                    yield Plugin, result
+
+            except Exception:  # This is unexpected, most likely a bug
+                log.error("An expected exception occurred.\n")
+                raise
+
+    finally:
+        for pool in pools.values():
+            pool.close()
+            pool.join()
+
+
+def _scheduled_iter(plugins, context, state, targets=None, workers=None,
+                    processes=None, plan=None):
+    """Yield each plug-in along with its result, as per logic.Scheduler
+
+    Plug-ins are processed as soon as those they depend on are, with
+    their instances processed by `workers` threads, or `processes`
+    processes. Results are recorded in the order of plug-ins, and
+    of instances, once every plug-in before them is done.
+
+    """
+
+    from multiprocessing.pool import ThreadPool
+    from .vendor.six.moves import queue
+
+    scheduler = logic.Scheduler(plugins, context, state, targets, plan)
+    completed = queue.Queue()
+
+    # Threads wait on remote jobs, too
+    pools = {"threads": ThreadPool(max(workers or 1, processes or 1))}
+
+    if processes:
+        import multiprocessing
+        pools["processes"] = multiprocessing.Pool(processes)
+
+    def run(Plugin, index, instance, job):
+        try:
+            if job is None:
+                result = plugin._process(Plugin, context, instance)
+            else:
+                result = pools["processes"].apply(_process_remote, (job,))
+        except Exception:
+            completed.put((Plugin, index, None, sys.exc_info()))
+        else:
+            completed.put((Plugin, index, result, None))
+
+    # Plug-in -> [instances, results, number of results remaining]
+    started = dict()
+    position = 0
+
+    try:
+        while True:
+            for Plugin, instances in scheduler.ready():
+                instances = _publishable(instances)
+                remote = processes and _is_multiprocess(Plugin)
+
+                started[Plugin] = [instances,
+                                   [None] * len(instances),
+                                   len(instances)]
+
+                if not instances:
+                    scheduler.done(Plugin)
+
+                for index, instance in enumerate(instances):
+                    job = _remote_job(Plugin, instance) if remote else None
+                    pools["threads"].apply_async(
+                        run, (Plugin, index, instance, job))
+
+            # Record results in order of plug-ins
+            while (position < len(scheduler.plugins) and
+                   scheduler.is_settled(scheduler.plugins[position])):
+                Plugin = scheduler.plugins[position]
+                position += 1
+
+                for result in started.pop(Plugin, [None, ()])[1]:
+                    plugin._processed(context, result)
+                    yield Plugin, result
+
+            if not any(entry[2] for entry in started.values()):
+                if scheduler.finished:
+                    break
+
+                continue  # Plug-ins without instances, ready for more
+
+            Plugin, index, result, exc_info = completed.get()
+
+            if exc_info is not None:
+                log.error("An expected exception occurred.\n")
+                six.reraise(*exc_info)
+
+            instances, results, _ = entry = started[Plugin]
+
+            if "changed" in result:
+                result = _merge_remote(result, Plugin, context,
+                                       instances[index])
+
+            results[index] = result
+            entry[2] -= 1
+
+            # Make note of errors before further plug-ins are started
+            if result["error"]:
+                scheduler.state["ordersWithError"].add(Plugin.order)
+
+            if not entry[2]:
+                scheduler.done(Plugin)
+
+    finally:
+        for pool in pools.values():
+            pool.close()
+
+        for pool in pools.values():
+            pool.join()
+
+
+def _publishable(instances):
+    return list(instance for instance in instances
+                if instance is None or logic.is_publishable(instance))
+
+
+def _is_multiprocess(Plugin):
+    """Return whether `Plugin` may be processed in a separate process
+
+    Plug-ins are shipped by module and name, and must either be
+    discovered or importable.
+
+    """
+
+    if not Plugin.multiprocess or not issubclass(Plugin, api.InstancePlugin):
+        return False
+
+    module = sys.modules.get(Plugin.__module__)
+
+    return (hasattr(module, Plugin.__name__) or
+            os.path.isfile(Plugin.__module__))
+
+
+def _remote_results(pool, Plugin, context, instances):
+    """Yield results of processing `instances` in `pool`, in order
+
+    Instances whose data cannot be pickled are processed here instead.
+
+    """
+
+    jobs = list(_remote_job(Plugin, instance) for instance in instances)
+    remote = pool.imap(_process_remote,
+                       list(job for job in jobs if job is not None))
+
+    for instance, job in zip(instances, jobs):
+        if job is None:
+            yield plugin._process(Plugin, context, instance)
+        else:
+            yield _merge_remote(next(remote), Plugin, context, instance)
+
+
+def _remote_job(Plugin, instance):
+    """Return job for processing `instance` remotely, or None"""
+    try:
+        data = pickle.dumps(dict(instance.data), pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        log.debug("%s could not be pickled, processing locally.."
+                  % instance)
+        return None
+
+    return (Plugin.__module__, Plugin.__name__, instance.name, data)
+
+
+def _merge_remote(result, Plugin, context, instance):
+    """Merge `result` of processing `instance` remotely"""
+
+    # Merge changes to data, as made in the separate process
+    for key in result.pop("removed"):
+        instance.data.pop(key, None)
+
+    instance.data.update(result.pop("changed"))
+
+    merged = plugin.Result(Plugin, context, instance)
+    merged.update(result)
+
+    return merged
+
+
+def _process_remote(job):
+    """Process a single instance, in a separate process
+
+    The instance is given a context of its own, and changes
+    to its data are returned along with the result.
+
+    """
+
+    module, name, instance_name, data = job
+
+    Plugin = _resolve_plugin(module, name)
+    context = api.Context()
+    instance = api.Instance(instance_name, parent=context)
+    instance.data.clear()
+    instance.data.update(pickle.loads(data))
+
+    result = plugin._process(Plugin, context, instance)
+
+    before = pickle.loads(data)
+    after = dict(instance.data)
+
+    changes = {
+        "changed": dict((key, value) for key, value in after.items()
+                        if key not in before or
+                        _differs(before[key], value)),
+        "removed": list(key for key in before if key not in after),
+    }
+
+    try:
+        pickle.dumps(changes, pickle.HIGHEST_PROTOCOL)
+    except Exception as error:
+        lib.extract_traceback(error)
+        result["success"] = False
+        result["error"] = error
+        changes = {"changed": {}, "removed": []}
+
+    remote = {
+        "success": result["success"],
+        "error": _portable_error(result["error"]),
+        "records": list(_portable_record(record)
+                        for record in result["records"]),
+        "duration": result["duration"],
+    }
+
+    remote.update(changes)
+
+    return remote
+
+
+def _resolve_plugin(module, name):
+    """Return plug-in `name` of `module`, an absolute path or module name"""
+    Plugin = getattr(sys.modules.get(module), name, None)
+
+    if Plugin is not None and Plugin.__dict__.get("__lazy__"):
+        return plugin._resolve_lazy_plugin(Plugin)
+
+    if Plugin is not None:
+        return Plugin
+
+    if os.path.isfile(module):
+        key, source = plugin._read_plugin_file(module, plugin.host_index.key)
+        mod_name = os.path.splitext(os.path.basename(module))[0]
+        module, _ = plugin._load_plugin_module(module, mod_name, key, source)
+
+    else:
+        __import__(module)
+        module = sys.modules[module]
+
+    return getattr(module, name)
+
+
+def _differs(before, after):
+    try:
+        return bool(before != after)
+    except Exception:
+        return True  # E.g. arrays, without a truth value
+
+
+def _portable_error(error):
+    """Return `error`, or a stand-in should it not survive pickling"""
+    if error is None:
+        return None
+
+    try:
+        pickle.loads(pickle.dumps(error, pickle.HIGHEST_PROTOCOL))
+        return error
+
+    except Exception:
+        portable = Exception("%s: %s" % (type(error).__name__, error))
+        portable.traceback = getattr(error, "traceback", None)
+        portable.formatted_traceback = getattr(
+            error, "formatted_traceback", None)
+        return portable
+
+
+def _portable_record(record):
+    """Prepare `record` for pickling, like logging.handlers.SocketHandler"""
+    if record.exc_info:
+        record.exc_text = record.exc_text or \
+            logging.Formatter().formatException(record.exc_info)
+
+    record.msg = record.getMessage()
+    record.args = None
+    record.exc_info = None
+
+    return record
+
+
 def collect(context=None, plugins=None, targets=None):
     """Convenience function for collection-only
 
@@ -292,6 +762,19 @@ def _convenience(context=None, plugins=None, targets=None, order=None):
     return context
 
 
+# Asynchronous counterparts, see pyblish._async
+if sys.version_info >= (3, 7):
+    from ._async import (
+        publish_async,
+        publish_aiter,
+    )
+
+    __all__ += [
+        "publish_async",
+        "publish_aiter",
+    ]
+
+
 # Backwards compatibility
 select = collect
 conform = integrate
@@ -0,0 +1,111 @@
+"""Tests of pyblish.util.publish_async, see test_async.py
+
+Kept apart from test_async.py, which is imported on Python 2 as well,
+as coroutine functions cannot be compiled there.
+
+"""
+
+import asyncio
+import threading
+
+from . import lib
+
+from pyblish import api, util
+from nose.tools import (
+    with_setup,
+    assert_equals,
+)
+
+
+def _run(coroutine):
+    loop = asyncio.new_event_loop()
+
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_publish_async():
+    """Coroutine and regular plug-ins are processed concurrently, in order"""
+
+    running = {"#": 0, "max": 0}
+    threads = set()
+
+    class Collector(api.ContextPlugin):
+        order = api.CollectorOrder
+
+        def process(self, context):
+            threads.add(threading.current_thread())
+
+            for name in ("A", "B", "C", "Invalid"):
+                context.create_instance(name)
+
+    class Validator(api.InstancePlugin):
+        order = api.ValidatorOrder
+
+        async def process(self, instance):
+            running["#"] += 1
+            running["max"] = max(running["max"], running["#"])
+
+            # Have each instance log at the same time
+            await asyncio.sleep(0.01)
+            self.log.info(instance.name)
+
+            running["#"] -= 1
+            assert instance.name != "Invalid", "Invalid instance"
+
+    class Extractor(api.InstancePlugin):
+        order = api.ExtractorOrder
+
+        def process(self, instance):
+            assert False, "Extractor should not run"
+
+    context = _run(util.publish_async(plugins=[Collector,
+                                               Validator,
+                                               Extractor]))
+
+    assert threading.current_thread() not in threads
+    assert_equals(running["max"], 4)
+
+    results = context.data["results"]
+    assert_equals([r["plugin"] for r in results],
+                  [Collector] + [Validator] * 4)
+    assert_equals([r["success"] for r in results],
+                  [True, True, True, True, False])
+
+    for result in results[1:]:
+        assert_equals([record.msg for record in result["records"]],
+                      [result["instance"].name])
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_publish_aiter_concurrency():
+    """Concurrency limits the number of instances processed at once"""
+
+    running = {"#": 0, "max": 0}
+
+    class Integrator(api.InstancePlugin):
+        order = api.IntegratorOrder
+
+        async def process(self, instance):
+            running["#"] += 1
+            running["max"] = max(running["max"], running["#"])
+            await asyncio.sleep(0.01)
+            running["#"] -= 1
+
+    context = api.Context()
+    for index in range(10):
+        context.create_instance("Instance%d" % index)
+
+    async def publish():
+        return list([result async for result in util.publish_aiter(
+            context, [Integrator], concurrency=3)])
+
+    results = _run(publish())
+
+    assert_equals(running["max"], 3)
+    assert_equals([r["instance"] for r in results], list(context))
+    assert_equals([r["progress"] for r in results],
+                  list((index + 1) / 10.0 for index in range(10)))
@@ -0,0 +1,9 @@
+"""Tests of pyblish.util.publish_async, requiring Python 3.7"""
+
+import sys
+import unittest
+
+if sys.version_info < (3, 7):
+    raise unittest.SkipTest("publish_async requires Python 3.7")
+
+from ._test_async import *
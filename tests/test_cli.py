@@ -6,6 +6,7 @@ import tempfile
 import pyblish
 import pyblish.cli
 import pyblish.api
+import pyblish.manifest
 from nose.tools import (
     with_setup,
     assert_equals,
@@ -311,3 +312,28 @@ if __name__ == '__main__':
     result = results.output.splitlines()[-1].rstrip()
     assert_equals(result, "imagesequence")
     assert_equals(results.exit_code, 0)
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_index():
+    """Indexing writes a manifest into each plug-in path"""
+
+    with lib.tempdir() as temp:
+        with open(os.path.join(temp, "collect_a.py"), "w") as f:
+            f.write("""
+import pyblish.api
+import pyblish.manifest
+
+class CollectA(pyblish.api.ContextPlugin):
+    order = pyblish.api.CollectorOrder
+""")
+
+        runner = CliRunner()
+        result = runner.invoke(pyblish.cli.main, ["index", temp])
+
+        assert_equals(result.exit_code, 0)
+        assert "1 of 1 files lazy" in result.output, result.output
+
+        manifest = pyblish.manifest.read(temp)
+        entry = manifest["files"]["collect_a.py"]
+        assert_equals([p["name"] for p in entry["plugins"]], ["CollectA"])
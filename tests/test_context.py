@@ -9,7 +9,8 @@ import pyblish.plugin
 from . import lib
 from nose.tools import (
     with_setup,
-    raises
+    raises,
+    assert_equals,
 )
 
 
@@ -126,5 +127,247 @@ def test_context_instance_unique_id():
     assert instance1.id != instance2.id
 
 
+def test_family_index():
+    """Instances by family follow changes to the context and its instances"""
+
+    from pyblish import api, logic
+
+    class Intersecting(api.InstancePlugin):
+        families = ["a", "b"]
+
+    class Subset(api.InstancePlugin):
+        families = ["a", "b"]
+        match = api.Subset
+
+    class Exact(api.InstancePlugin):
+        families = ["a"]
+        match = api.Exact
+
+    def names(plugin):
+        return [i.name for i in logic.instances_by_plugin(context, plugin)]
+
+    context = api.Context()
+    a = context.create_instance("A", family="a")
+    ab = context.create_instance("AB", family="a", families=["b"])
+    context.create_instance("C", family="c")
+
+    assert names(Intersecting) == ["A", "AB"], names(Intersecting)
+    assert names(Subset) == ["AB"], names(Subset)
+    assert names(Exact) == ["A"], names(Exact)
+
+    # Appending after the index is built
+    context.create_instance("B", family="b")
+    assert names(Intersecting) == ["A", "AB", "B"], names(Intersecting)
+
+    # Changing families through data
+    a.data["families"] = ["b"]
+    assert names(Subset) == ["A", "AB"], names(Subset)
+    assert names(Exact) == [], names(Exact)
+
+    ab.data["families"].remove("b")
+    assert names(Exact) == ["AB"], names(Exact)
+
+    ab.data.update({"family": "c"})
+    assert names(Intersecting) == ["A", "B"], names(Intersecting)
+
+    a.data.pop("families")
+    assert names(Exact) == ["A"], names(Exact)
+
+    # Changing the order of instances
+    context.insert(0, context.pop())
+    assert names(Intersecting) == ["B", "A"], names(Intersecting)
+
+    context.remove(a)
+    assert names(Intersecting) == ["B"], names(Intersecting)
+
+    # Instances occurring more than once are matched by a linear scan
+    context.append(context[0])
+    assert names(Intersecting) == ["B", "B"], names(Intersecting)
+
+
+def test_family_index_follows_assigned_lists():
+    """Lists assigned as families are kept, and followed once changed"""
+
+    from pyblish import api, logic, plugin
+
+    class MyPlugin(api.InstancePlugin):
+        families = ["y"]
+
+    context = api.Context()
+    instance = context.create_instance("A", family="a")
+
+    families = ["x"]
+    instance.data["families"] = families
+    assert instance.data["families"] is families
+
+    assert logic.instances_by_plugin(context, MyPlugin) == []
+
+    families.append("y")
+    assert instance.data["families"] == ["x", "y"]
+    assert logic.instances_by_plugin(context, MyPlugin) == [instance]
+
+    # Changed whilst no longer handed out, e.g. by a plug-in
+    # holding on to it, it is followed once a plug-in is processed
+    class ChangeFamilies(api.ContextPlugin):
+        def process(self, context):
+            families[1] = "z"
+
+    plugin.process(ChangeFamilies, context)
+    assert logic.instances_by_plugin(context, MyPlugin) == []
+
+    instance.data["families"][1] = "y"
+    assert logic.instances_by_plugin(context, MyPlugin) == [instance]
+
+
+def test_family_index_compares_lists_once_changed():
+    """Lists of families are only compared once they may have changed"""
+
+    from pyblish import api, logic
+
+    class Families(list):
+        compared = 0
+
+        def __eq__(self, other):
+            Families.compared += 1
+            return list.__eq__(self, other)
+
+        __hash__ = None
+
+    class MyPlugin(api.InstancePlugin):
+        families = ["x"]
+
+    context = api.Context()
+    instances = list(context.create_instance(name, families=Families("x"))
+                     for name in "ABC")
+
+    assert logic.instances_by_plugin(context, MyPlugin) == instances
+
+    Families.compared = 0
+
+    for _ in range(10):
+        assert logic.instances_by_plugin(context, MyPlugin) == instances
+
+    assert Families.compared == 0, Families.compared
+
+    instances[0].data["families"].remove("x")
+    assert logic.instances_by_plugin(context, MyPlugin) == instances[1:]
+    assert Families.compared > 0
+
+
+def test_id_lookup_follows_changes():
+    """Lookup by id remains consistent as instances are added and removed"""
+
+    from pyblish import api
+
+    context = api.Context()
+    a, b, c, d, e = (api.Instance(name) for name in "abcde")
+
+    def assert_consistent():
+        for instance in (a, b, c, d, e):
+            expected = next((i for i in context if i.id == instance.id), None)
+            assert (instance.id in context) == (expected is not None)
+            assert (instance in context) == (expected is not None)
+            assert context.get(instance.id) is expected
+
+    context.append(a)
+    context.extend([b, c])
+    context.insert(0, d)
+    assert_consistent()
+    assert context[d.id] is d
+
+    context.pop()
+    context.remove(a)
+    assert_consistent()
+
+    context.add(e)
+    context += [c, c]
+    del context[-1]
+    assert_consistent()
+
+    context[0] = a
+    context.reverse()
+    del context[1:]
+    assert_consistent()
+
+    context *= 2
+    context.sort(key=lambda i: i.name)
+    assert_consistent()
+
+    context[:] = [b, c]
+    assert_consistent()
+    assert_equals(list(context), [b, c])
+
+
+def test_copy_and_pickle():
+    """Contexts and instances survive copying and pickling"""
+
+    import copy
+    import pickle
+
+    from pyblish import api, logic
+
+    class MyPlugin(api.InstancePlugin):
+        families = ["b"]
+
+    context = api.Context()
+    instance = context.create_instance("A", families=["a"])
+    instance.custom = True
+
+    copies = [copy.deepcopy(context)] + list(
+        pickle.loads(pickle.dumps(context, protocol))
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1)
+    )
+
+    for copied in copies:
+        copied_instance = copied[instance.id]
+
+        assert_equals(copied_instance.data, instance.data)
+        assert_equals(copied_instance.custom, True)
+        assert copied_instance.parent is copied
+
+        assert_equals(logic.instances_by_plugin(copied, MyPlugin), [])
+        copied_instance.data["families"].append("b")
+        assert_equals(logic.instances_by_plugin(copied, MyPlugin),
+                      [copied_instance])
+
+
+def test_instance_context_nested():
+    """Instances find their context through nested and re-parented instances"""
+
+    from pyblish import api
+
+    context = api.Context()
+    parent = context.create_instance("Parent")
+    child = api.Instance("Child", parent=parent)
+    grandchild = api.Instance("Grandchild", parent=child)
+
+    assert grandchild.context is context
+    assert child.context is context
+    assert parent.context is context
+
+    # Cached, and repeated lookups agree
+    assert grandchild.context is grandchild.context
+
+    other = api.Context()
+    other.append(parent)
+    parent.parent = other
+
+    assert parent.context is other
+    assert child.context is other
+    assert grandchild.context is other
+
+    child.parent = context.create_instance("Another")
+
+    assert child.context is context
+    assert grandchild.context is context
+    assert parent.context is other
+
+    @raises(AssertionError)
+    def not_a_context():
+        api.Instance("Orphan", parent=api.Instance("Root")).context
+
+    not_a_context()
+
+
 if __name__ == '__main__':
     test_add_remove_instances()
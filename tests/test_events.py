@@ -67,7 +67,8 @@ def test_plugin_processed_event():
     count = {"#": 0}
 
     def on_processed(result):
-        assert isinstance(result, dict)
+        assert isinstance(result, pyblish.api.Result)
+        assert result["plugin"] is result.plugin
         count["#"] += 1
 
     pyblish.api.register_callback("pluginProcessed", on_processed)
@@ -246,3 +246,194 @@ def test_extracted_traceback_contains_correct_backtrace():
         assert formatted_tb.startswith('Traceback (most recent call last):\n')
         assert formatted_tb.endswith('\nException: A test exception\n')
         assert 'File "{0}",'.format(plugins[0].__module__) in formatted_tb
+
+
+def test_matching_follows_changes_to_families():
+    """Matching reflects families reassigned or appended after creation"""
+
+    class MyPlugin(api.InstancePlugin):
+        families = ["a"]
+
+    context = api.Context()
+    instance = context.create_instance("A", family="a", families=[])
+
+    assert_equals(logic.instances_by_plugin(context, MyPlugin), [instance])
+
+    MyPlugin.families = ["b"]
+    assert_equals(logic.instances_by_plugin(context, MyPlugin), [])
+    assert_equals(logic.plugins_by_instance([MyPlugin], instance), [])
+
+    instance.data["families"].append("b")
+    assert_equals(logic.instances_by_plugin(context, MyPlugin), [instance])
+    assert_equals(logic.plugins_by_instance([MyPlugin], instance),
+                  [MyPlugin])
+
+    instance.data["family"] = "c"
+    instance.data["families"] = ["c"]
+    assert_equals(logic.instances_by_plugin(context, MyPlugin), [])
+
+    MyPlugin.targets = ["studio"]
+    assert_equals(logic.plugins_by_targets([MyPlugin], ["default"]), [])
+    assert_equals(logic.plugins_by_targets([MyPlugin], ["studio"]),
+                  [MyPlugin])
+
+
+def test_matching_follows_same_length_changes():
+    """Matching reflects families replaced in-place, without resizing"""
+
+    class MyPlugin(api.InstancePlugin):
+        families = ["p"]
+
+    context = api.Context()
+    instance = context.create_instance("A", family="a", families=["p"])
+    loose = api.Instance("B", family="b", families=["p"])
+
+    assert_equals(logic.instances_by_plugin(context, MyPlugin), [instance])
+    assert_equals(logic.plugins_by_instance([MyPlugin], loose), [MyPlugin])
+
+    instance.data["families"][0] = "q"
+    loose.data["families"][0] = "q"
+    assert_equals(logic.instances_by_plugin(context, MyPlugin), [])
+    assert_equals(logic.plugins_by_instance([MyPlugin], loose), [])
+
+    MyPlugin.families[0] = "q"
+    assert_equals(logic.instances_by_plugin(context, MyPlugin), [instance])
+    assert_equals(logic.plugins_by_instance([MyPlugin], loose), [MyPlugin])
+
+
+def test_dependencies():
+    """Plug-ins wait for their requirements, or every plug-in before them"""
+
+    class CollectA(api.ContextPlugin):
+        order = api.CollectorOrder
+        provides = ["frames"]
+
+    class CollectB(api.ContextPlugin):
+        order = api.CollectorOrder + 0.1
+
+    class CollectC(api.ContextPlugin):
+        order = api.CollectorOrder + 0.2
+        requires_plugins = ["frames"]
+
+    class CollectD(api.ContextPlugin):
+        order = api.CollectorOrder + 0.3
+
+    class ValidateA(api.ContextPlugin):
+        order = api.ValidatorOrder
+        requires_plugins = ["CollectB"]
+
+    plugins = [CollectA, CollectB, CollectC, CollectD, ValidateA]
+    dependencies = logic.dependencies(plugins)
+
+    assert_equals(dependencies[CollectA], frozenset())
+    assert_equals(dependencies[CollectB], frozenset([CollectA]))
+    assert_equals(dependencies[CollectC], frozenset([CollectA]))
+    assert_equals(dependencies[CollectD], frozenset([CollectB, CollectC]))
+
+    # Earlier bands are done already
+    assert_equals(dependencies[ValidateA], frozenset())
+
+
+def test_dependencies_invalid():
+    """Requirements of later bands, or cyclic ones, are ignored"""
+
+    class CollectA(api.ContextPlugin):
+        order = api.CollectorOrder
+        requires_plugins = ["ValidateA"]
+
+    class CollectB(api.ContextPlugin):
+        order = api.CollectorOrder
+
+    class ValidateA(api.ContextPlugin):
+        order = api.ValidatorOrder
+
+    class ValidateB(api.ContextPlugin):
+        order = api.ValidatorOrder
+        requires_plugins = ["ValidateC"]
+
+    class ValidateC(api.ContextPlugin):
+        order = api.ValidatorOrder
+        requires_plugins = ["ValidateB"]
+
+    # As though no requirements were declared
+    plugins = [CollectB, CollectA, ValidateA, ValidateB, ValidateC]
+    dependencies = logic.dependencies(plugins)
+
+    assert_equals(dependencies[CollectA], frozenset([CollectB]))
+    assert_equals(dependencies[ValidateB], frozenset([ValidateA]))
+    assert_equals(dependencies[ValidateC], frozenset([ValidateB]))
+    assert_equals(logic.sort_by_dependencies(plugins), plugins)
+
+
+def test_estimate_instances():
+    """Estimates are at least the number of compatible instances"""
+
+    context = api.Context()
+    for index in range(30):
+        context.create_instance("Instance%02d" % index,
+                                family="family%d" % (index % 3),
+                                families=["extra%d" % (index % 2)])
+
+    plugins = list()
+    for match in (api.Intersection, api.Subset, api.Exact):
+        for families in (["family0"],
+                         ["family0", "extra1"],
+                         ["family1", "family2"],
+                         [],
+                         ["*"]):
+            plugins.append(type("Plugin", (api.InstancePlugin,), {
+                "families": families,
+                "match": match,
+            }))
+
+    for Plugin in plugins:
+        actual = len(logic.instances_by_plugin(context, Plugin))
+        estimate = logic.estimate_instances(context, Plugin)
+        assert actual <= estimate <= len(context), (
+            Plugin.families, Plugin.match, actual, estimate)
+
+    # Single families are estimated exactly
+    assert_equals(logic.estimate_instances(context, plugins[0]), 10)
+
+
+def test_plan():
+    """A plan matches instances as the Iterator would, until changed"""
+
+    context = api.Context()
+    for index in range(12):
+        context.create_instance("Instance%02d" % index,
+                                family="family%d" % (index % 3),
+                                families=["extra%d" % (index % 2)])
+
+    plugins = list()
+    for match in (api.Intersection, api.Subset, api.Exact):
+        for families in (["family0"],
+                         ["family0", "extra1"],
+                         ["*"]):
+            plugins.append(type("Plugin", (api.InstancePlugin,), {
+                "families": families,
+                "match": match,
+            }))
+
+    plugins.append(type("Context", (api.ContextPlugin,), {}))
+
+    plan = logic.plan(plugins, context)
+
+    assert_equals(list(plan.tasks()),
+                  list(logic.Iterator(plugins, context)))
+
+    for Plugin in plugins[:-1]:
+        assert_equals(plan.instances(Plugin),
+                      logic.instances_by_plugin(context, Plugin))
+
+    assert plan.is_current(context)
+    context[0].data["families"] = ["family1"]
+    assert not plan.is_current(context)
+
+    # A stale plan is recomputed per plug-in
+    assert_equals(list(logic.Iterator(plugins, context, plan=plan)),
+                  list(logic.Iterator(plugins, context)))
+
+    plan = logic.plan(plugins, context)
+    context.create_instance("New", family="family0")
+    assert not plan.is_current(context)
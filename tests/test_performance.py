@@ -0,0 +1,457 @@
+"""Benchmarks
+
+These run as part of the test-suite on synthetic data of realistic
+size, and assert on results rather than on timings. Timings are
+printed, and visible when running the suite with --nocapture.
+
+"""
+
+import os
+import sys
+import time
+import unittest
+
+import pyblish.api
+import pyblish.lib
+import pyblish.plugin
+from nose.tools import (
+    with_setup,
+    assert_equals,
+)
+
+from . import lib
+
+
+def _timeit(func, *args, **kwargs):
+    start = time.time()
+    result = func(*args, **kwargs)
+    return result, time.time() - start
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_parallel_discovery_1000_files():
+    """Parallel discovery of 1,000 files equals serial discovery"""
+
+    with lib.tempdir() as temp:
+        for index in range(1000):
+            fname = os.path.join(temp, "plugin_%04d.py" % index)
+            with open(fname, "w") as f:
+                f.write("""
+import pyblish.api
+
+class Plugin%04d(pyblish.api.InstancePlugin):
+    order = pyblish.api.ValidatorOrder + %f
+    families = ["family%d"]
+""" % (index, (index % 10) * 0.01, index % 20))
+
+        pyblish.plugin.discovery_cache.invalidate()
+        serial, serial_time = _timeit(
+            pyblish.api.discover, paths=[temp], parallel=False)
+
+        pyblish.plugin.discovery_cache.invalidate()
+        parallel, parallel_time = _timeit(
+            pyblish.api.discover, paths=[temp], parallel=True)
+
+    print("Serial discovery: %.3fs" % serial_time)
+    print("Parallel discovery: %.3fs" % parallel_time)
+
+    assert_equals(len(serial), 1000)
+    assert_equals([(p.__module__, p.__name__) for p in serial],
+                  [(p.__module__, p.__name__) for p in parallel])
+
+
+def _synthetic_plugins(count):
+    """Return `count` plug-ins, spread across modules of 10 plug-ins each
+
+    These are plain classes with only the attributes used during
+    discovery, as creating 10,000 actual plug-ins is costly in itself.
+
+    """
+
+    modules = list()
+
+    for index in range(0, count, 10):
+        modules.append(("/synthetic/module_%05d.py" % index, list(
+            type("Plugin%05d" % (index + offset),
+                 (object,),
+                 {"order": (index + offset) % 4})
+            for offset in range(10)
+        )))
+
+    return modules
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_discovery_bookkeeping_scales_linearly():
+    """Assembling discovered plug-ins scales to 10,000 plug-ins"""
+
+    small = _synthetic_plugins(1000)
+    large = _synthetic_plugins(10000)
+
+    # Every plug-in twice, to exercise duplicate detection
+    small_plugins, small_time = _timeit(
+        pyblish.plugin._assemble_plugins, small + small)
+    large_plugins, large_time = _timeit(
+        pyblish.plugin._assemble_plugins, large + large)
+
+    print("1,000 plug-ins: %.3fs" % small_time)
+    print("10,000 plug-ins: %.3fs" % large_time)
+
+    # Duplicates are excluded
+    assert_equals(len(small_plugins), 1000)
+    assert_equals(len(large_plugins), 10000)
+
+
+def test_version_compatibility_memoized():
+    """Memoized compatibility checks agree with parsing each time"""
+
+    from pyblish.vendor import iscompatible
+
+    class MyPlugin(pyblish.api.ContextPlugin):
+        requires = "pyblish>=1"
+
+    version = pyblish.version_info
+    pyblish.plugin.clear_compatibility_cache()
+
+    def direct():
+        return list(iscompatible.iscompatible(MyPlugin.requires, version)
+                    for _ in range(10000))
+
+    def memoized():
+        return list(pyblish.plugin.version_is_compatible(MyPlugin)
+                    for _ in range(10000))
+
+    expected, direct_time = _timeit(direct)
+    results, memoized_time = _timeit(memoized)
+
+    print("10,000 direct checks: %.3fs" % direct_time)
+    print("10,000 memoized checks: %.3fs" % memoized_time)
+
+    assert_equals(list(map(bool, results)), list(map(bool, expected)))
+
+
+def _naive_instances_by_plugin(instances, plugin):
+    """Reference implementation, rebuilding sets per comparison"""
+    algorithms = {
+        pyblish.api.Intersection: lambda a, b: set(a).intersection(b),
+        pyblish.api.Subset: lambda a, b: set(a).issubset(b),
+        pyblish.api.Exact: lambda a, b: set(a) == set(b)
+    }
+
+    compatible = list()
+
+    for instance in instances:
+        if "*" in plugin.families:
+            compatible.append(instance)
+            continue
+
+        family = instance.data.get("family")
+        families = [family] if family else []
+        families += instance.data.get("families", [])
+
+        if algorithms[plugin.match](plugin.families, families):
+            compatible.append(instance)
+
+    return compatible
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_matching_500_plugins_5000_instances():
+    """Matching 500 plug-ins against 5,000 instances uses cheap set operations"""
+
+    from pyblish import logic
+
+    matches = (pyblish.api.Intersection,
+               pyblish.api.Subset,
+               pyblish.api.Exact)
+
+    plugins = list()
+    for index in range(500):
+        plugins.append(type("Plugin%03d" % index,
+                            (pyblish.api.InstancePlugin,), {
+                                "order": index,
+                                "families": ["family%d" % (index % 20),
+                                             "family%d" % (index % 7)],
+                                "match": matches[index % 3],
+                            }))
+
+    context = pyblish.api.Context()
+    for index in range(5000):
+        context.create_instance("Instance%04d" % index,
+                                family="family%d" % (index % 20),
+                                families=["family%d" % (index % 7)])
+
+    def iterate():
+        return list(logic.Iterator(plugins, context))
+
+    def naive():
+        return list((plugin, instance)
+                    for plugin in plugins
+                    for instance in _naive_instances_by_plugin(
+                        context, plugin))
+
+    pairs, iterate_time = _timeit(iterate)
+    expected, naive_time = _timeit(naive)
+
+    print("500 plug-ins x 5,000 instances: %.3fs" % iterate_time)
+    print("500 plug-ins x 5,000 instances, naive: %.3fs" % naive_time)
+
+    assert_equals(len(pairs), len(expected))
+    assert pairs == expected
+
+
+def test_id_lookup_50000_instances():
+    """Looking up 50,000 instances by id takes constant time per lookup"""
+
+    context = pyblish.api.Context()
+
+    instances, create_time = _timeit(lambda: list(
+        context.create_instance("Instance%05d" % index)
+        for index in range(50000)))
+
+    def lookup():
+        for instance in instances:
+            assert instance.id in context
+            assert context[instance.id] is instance
+            assert context.get(instance.id) is instance
+
+    _, lookup_time = _timeit(lookup)
+
+    def remove():
+        for _ in range(25000):
+            context.pop()
+
+    _, remove_time = _timeit(remove)
+
+    print("Creating 50,000 instances: %.3fs" % create_time)
+    print("Looking up 50,000 instances: %.3fs" % lookup_time)
+    print("Removing 25,000 instances: %.3fs" % remove_time)
+
+    assert_equals(len(context), 25000)
+    assert instances[-1].id not in context
+    assert context.get(instances[0].id) is instances[0]
+
+
+def test_sequential_ids():
+    """Sequential ids are unique, like uuid4"""
+
+    def generate(generator):
+        return set(generator() for _ in range(100000))
+
+    uuids, uuid_time = _timeit(generate, pyblish.plugin.uuid_id)
+    ids, sequential_time = _timeit(generate, pyblish.plugin.SequentialIds())
+
+    print("100,000 uuid4 ids: %.3fs" % uuid_time)
+    print("100,000 sequential ids: %.3fs" % sequential_time)
+
+    assert_equals(len(uuids), 100000)
+    assert_equals(len(ids), 100000)
+
+
+class _PreviousData(dict):
+    def __init__(self, parent):
+        self._parent = parent
+
+
+class _PreviousInstance(list):
+    """Layout of instances prior to __slots__, for comparison"""
+
+    def __init__(self, name, parent):
+        self._name = name
+        self._data = _PreviousData(self)
+        self._id = pyblish.plugin.new_id()
+        self._parent = parent
+        self._families_set = None
+        self._family_indexes = None
+
+        parent.append(self)
+
+        self._data["family"] = "default"
+        self._data["name"] = name
+
+
+def _allocated(func):
+    """Return bytes allocated and kept by `func`"""
+    import tracemalloc
+
+    tracemalloc.start()
+
+    try:
+        before = tracemalloc.take_snapshot()
+        result = func()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    del result
+    return sum(stat.size_diff for stat in after.compare_to(before, "lineno"))
+
+
+@unittest.skipIf(sys.version_info < (3, 4), "skip without tracemalloc")
+def test_instance_memory_20000_instances():
+    """20,000 instances take less memory than before __slots__"""
+
+    def compact():
+        context = pyblish.api.Context()
+        for index in range(20000):
+            context.create_instance("Instance%05d" % index)
+        return context
+
+    def previous():
+        context = list()
+        for index in range(20000):
+            _PreviousInstance("Instance%05d" % index, parent=context)
+        return context
+
+    compact_size = _allocated(compact)
+    previous_size = _allocated(previous)
+
+    print("20,000 instances: %.1f MB" % (compact_size / 1e6))
+    print("20,000 instances, prior to __slots__: %.1f MB"
+          % (previous_size / 1e6))
+
+    assert compact_size < previous_size, (compact_size, previous_size)
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_implicit_process_5000_instances():
+    """Implicit plug-ins process 5,000 instances"""
+
+    class MyValidator(pyblish.api.Validator):
+        def process(self, context, instance):
+            pass
+
+    context = pyblish.api.Context()
+    instances = list(context.create_instance("Instance%04d" % index)
+                     for index in range(5000))
+
+    def publish():
+        return list(pyblish.plugin.process(MyValidator, context, instance)
+                    for instance in instances)
+
+    results, duration = _timeit(publish)
+
+    print("Implicit processing of 5,000 instances: %.3fs" % duration)
+
+    assert all(result["success"] for result in results)
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_progress_estimate_500_plugins_5000_instances():
+    """Estimating progress agrees with a dry run of every plug-in"""
+
+    from pyblish import logic, util
+
+    plugins = list()
+    for index in range(500):
+        plugins.append(type("Plugin%03d" % index,
+                            (pyblish.api.InstancePlugin,), {
+                                "order": index,
+                                "families": ["family%d" % (index % 20)],
+                            }))
+
+    context = pyblish.api.Context()
+    for index in range(5000):
+        context.create_instance("Instance%04d" % index,
+                                family="family%d" % (index % 20))
+
+    dry_run, dry_run_time = _timeit(
+        lambda: len(list(logic.Iterator(plugins, context))))
+    progress, estimate_time = _timeit(util._Progress, plugins, context)
+
+    print("Dry run of 500 plug-ins x 5,000 instances: %.3fs" % dry_run_time)
+    print("Estimate of 500 plug-ins x 5,000 instances: %.3fs"
+          % estimate_time)
+
+    assert_equals(sum(progress._counts.values()), dry_run)
+
+
+@unittest.skipIf(sys.version_info < (3, 4), "skip without tracemalloc")
+def test_result_memory_100000_results():
+    """100,000 results take less memory than as dictionaries"""
+
+    context = pyblish.api.Context()
+
+    def compact():
+        return list(
+            pyblish.plugin.Result(pyblish.api.ContextPlugin, context)
+            for _ in range(100000)
+        )
+
+    def previous():
+        return list(
+            {
+                "success": False,
+                "plugin": pyblish.api.ContextPlugin,
+                "instance": None,
+                "action": None,
+                "error": None,
+                "records": list(),
+                "duration": None,
+                "progress": 0,
+                "context": context,
+            }
+            for _ in range(100000)
+        )
+
+    compact_size = _allocated(compact)
+    previous_size = _allocated(previous)
+
+    print("100,000 results: %.1f MB" % (compact_size / 1e6))
+    print("100,000 results, as dictionaries: %.1f MB"
+          % (previous_size / 1e6))
+
+    assert compact_size < previous_size, (compact_size, previous_size)
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_failing_validation_5000_instances():
+    """Tracebacks of 5,000 failures are extracted"""
+
+    import traceback
+
+    class ValidateFails(pyblish.api.InstancePlugin):
+        order = pyblish.api.ValidatorOrder
+
+        def process(self, instance):
+            raise ValueError("%s is invalid" % instance)
+
+    context = pyblish.api.Context()
+    instances = list(context.create_instance("Instance%04d" % index)
+                     for index in range(5000))
+
+    def extract(func):
+        errors = list()
+        for instance in instances:
+            try:
+                ValidateFails().process(instance)
+            except ValueError as error:
+                func(error)
+                errors.append(error)
+        return errors
+
+    def previous(error):
+        exc_type, exc_value, exc_traceback = sys.exc_info()
+        error.traceback = traceback.extract_tb(exc_traceback)[-1]
+        error.formatted_traceback = "".join(
+            traceback.format_exception(exc_type, exc_value, exc_traceback))
+        del exc_type, exc_value, exc_traceback
+
+    errors, current_time = _timeit(extract, pyblish.lib.extract_traceback)
+    expected, previous_time = _timeit(extract, previous)
+
+    print("5,000 tracebacks: %.3fs" % current_time)
+    print("5,000 tracebacks, prior to summarising frames: %.3fs"
+          % previous_time)
+
+    assert_equals([e.formatted_traceback for e in errors],
+                  [e.formatted_traceback for e in expected])
+    assert_equals([tuple(e.traceback) for e in errors],
+                  [tuple(e.traceback) for e in expected])
+
+    results = list(pyblish.plugin.process(ValidateFails, context, instance)
+                   for instance in instances)
+
+    assert not any(result["success"] for result in results)
+    assert all("is invalid" in result["error"].formatted_traceback
+               for result in results)
@@ -2,12 +2,15 @@
 # -*- coding: utf-8 -*-
 
 import os
+import sys
 import logging
 
 from pyblish.vendor import mock
 import pyblish.api
 import pyblish.util
+import pyblish.lib
 import pyblish.plugin
+import pyblish.manifest
 from nose.tools import (
     with_setup,
     assert_true,
@@ -819,6 +822,103 @@ def test_logging_solely_from_pyblish():
             assert record.name.startswith("pyblish")
 
 
+@with_setup(lib.setup_empty, lib.teardown)
+def test_logging_per_task():
+    """Records are captured per task, without touching the root logger"""
+
+    import threading
+
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    barrier = {"started": 0, "condition": threading.Condition()}
+
+    class MyPlugin(pyblish.api.InstancePlugin):
+        def process(self, instance):
+            assert_equals(root.handlers, handlers)
+            assert_equals(root.level, level)
+
+            # Have both tasks log at the same time
+            with barrier["condition"]:
+                barrier["started"] += 1
+                barrier["condition"].notify_all()
+                while barrier["started"] < 2:
+                    barrier["condition"].wait(5)
+
+            for _ in range(100):
+                self.log.info(instance.name)
+
+    context = pyblish.api.Context()
+    instances = [context.create_instance("A"), context.create_instance("B")]
+    results = dict()
+
+    def run(instance):
+        results[instance.name] = pyblish.plugin.process(
+            MyPlugin, context, instance)
+
+    threads = list(threading.Thread(target=run, args=(instance,))
+                   for instance in instances)
+
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for name, result in results.items():
+        assert result["success"], result["error"]
+        assert_equals([record.msg for record in result["records"]],
+                      [name] * 100)
+
+    assert_equals(root.handlers, handlers)
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_logging_unconfigured():
+    """Errors reach stderr after publishing, with logging unconfigured"""
+
+    if getattr(logging, "lastResort", None) is None:
+        raise unittest.SkipTest("logging.lastResort requires Python 3.2")
+
+    from pyblish.vendor import six
+
+    class Validator(pyblish.api.InstancePlugin):
+        order = pyblish.api.ValidatorOrder
+
+        def process(self, instance):
+            self.log.warning("Captured")
+            assert False, "Invalid"
+
+    class Extractor(pyblish.api.InstancePlugin):
+        order = pyblish.api.ExtractorOrder
+
+    context = pyblish.api.Context()
+    context.create_instance("A")
+
+    loggers = (logging.getLogger(), logging.getLogger("pyblish"))
+    handlers = list(list(logger.handlers) for logger in loggers)
+
+    for logger in loggers:
+        logger.handlers[:] = []
+
+    stderr = sys.stderr
+    sys.stderr = six.StringIO()
+
+    try:
+        pyblish.util.publish(context, [Validator, Extractor])
+        logging.getLogger("pyblish.test").error("After publishing")
+        output = sys.stderr.getvalue()
+
+    finally:
+        sys.stderr = stderr
+
+        for logger, previous in zip(loggers, handlers):
+            logger.handlers[:] = previous
+
+    # Records of plug-ins are captured, not printed
+    assert "Captured" not in output, output
+    assert "Stopped due to failed validation" in output, output
+    assert "After publishing" in output, output
+
+
 @with_setup(lib.setup_empty, lib.teardown)
 def test_running_for_all_targets():
     """Run for all targets when family is "default"."""
@@ -1131,3 +1231,761 @@ def test_discover_missing_host():
     plugins = pyblish.api.discover()
     assert len(plugins) == 0
     # DEBUG - No supported host found for plugin:<class 'missing_host.CollectMissingHosts'>
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_discovery_cache():
+    """Unchanged plug-in files are served from the discovery cache"""
+
+    cache = pyblish.plugin.discovery_cache
+    cache.invalidate()
+    cache.reset_counters()
+
+    with lib.tempdir() as temp:
+        with open(os.path.join(temp, "my_plugin.py"), "w") as f:
+            f.write("""
+import pyblish.api
+
+class MyPlugin(pyblish.api.ContextPlugin):
+    pass
+""")
+
+        first = pyblish.api.discover(paths=[temp])
+        assert_equals(cache.misses, 1)
+        assert_equals(cache.hits, 0)
+
+        second = pyblish.api.discover(paths=[temp])
+        assert_equals(cache.misses, 1)
+        assert_equals(cache.hits, 1)
+
+        # Classes are still fresh on every discovery
+        assert_equals([p.__name__ for p in first],
+                      [p.__name__ for p in second])
+        assert first[0] is not second[0]
+
+        # Registering a host invalidates every file
+        pyblish.api.register_host("myHost")
+        pyblish.api.discover(paths=[temp])
+        assert_equals(cache.misses, 2)
+
+        # As does invalidating by path
+        cache.invalidate(os.path.join(temp, "my_plugin.py"))
+        pyblish.api.discover(paths=[temp])
+        assert_equals(cache.misses, 3)
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_discovery_cache_plugins_bound_to_other_names():
+    """Cached plug-ins are found by the name they are bound to"""
+
+    pyblish.plugin.discovery_cache.invalidate()
+
+    with lib.tempdir() as temp:
+        with open(os.path.join(temp, "my_plugin.py"), "w") as f:
+            f.write("""
+import pyblish.api
+
+def make():
+    class Inner(pyblish.api.ContextPlugin):
+        pass
+    return Inner
+
+Exported = make()
+""")
+
+        first = pyblish.api.discover(paths=[temp])
+        second = pyblish.api.discover(paths=[temp])
+
+    assert_equals([p.__name__ for p in first], ["Inner"])
+    assert_equals([p.__name__ for p in second], ["Inner"])
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_discovery_cache_invalidated_on_change():
+    """Changed plug-in files are re-read on discovery"""
+
+    with lib.tempdir() as temp:
+        module = os.path.join(temp, "my_plugin.py")
+
+        with open(module, "w") as f:
+            f.write("""
+import pyblish.api
+
+class MyPlugin(pyblish.api.ContextPlugin):
+    pass
+""")
+
+        plugins = pyblish.api.discover(paths=[temp])
+        assert_equals([p.__name__ for p in plugins], ["MyPlugin"])
+
+        with open(module, "w") as f:
+            f.write("""
+import pyblish.api
+
+class MyRenamedPlugin(pyblish.api.ContextPlugin):
+    pass
+""")
+
+        plugins = pyblish.api.discover(paths=[temp])
+        assert_equals([p.__name__ for p in plugins], ["MyRenamedPlugin"])
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_bytecode_cache():
+    """Compiled plug-ins are stored on disk and reused"""
+
+    with lib.tempdir() as temp:
+        plugindir = os.path.join(temp, "plugins")
+        cachedir = os.path.join(temp, "cache")
+        os.makedirs(plugindir)
+
+        module = os.path.join(plugindir, "my_plugin.py")
+        with open(module, "w") as f:
+            f.write("""
+import pyblish.api
+
+class MyPlugin(pyblish.api.ContextPlugin):
+    pass
+""")
+
+        pyblish.plugin.BYTECODE_CACHE_DIR = cachedir
+
+        try:
+            pyblish.plugin.discovery_cache.invalidate()
+            pyblish.api.discover(paths=[plugindir])
+
+            cachefiles = os.listdir(cachedir)
+            assert_equals(len(cachefiles), 1)
+            assert cachefiles[0].startswith("my_plugin-"), cachefiles
+
+            # As from another process
+            pyblish.plugin.discovery_cache.invalidate()
+
+            with mock.patch("pyblish.plugin.compile", create=True) as func:
+                plugins = pyblish.api.discover(paths=[plugindir])
+
+            assert not func.called
+            assert_equals([p.__name__ for p in plugins], ["MyPlugin"])
+
+            # Changes to the source invalidates the bytecode
+            with open(module, "w") as f:
+                f.write("""
+import pyblish.api
+
+class MyChangedPlugin(pyblish.api.ContextPlugin):
+    pass
+""")
+
+            pyblish.plugin.discovery_cache.invalidate()
+            plugins = pyblish.api.discover(paths=[plugindir])
+            assert_equals([p.__name__ for p in plugins], ["MyChangedPlugin"])
+
+        finally:
+            pyblish.plugin.BYTECODE_CACHE_DIR = None
+            pyblish.plugin.discovery_cache.invalidate()
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_discovered_plugin_traceback_filename():
+    """Tracebacks of discovered plug-ins carry their file name"""
+
+    with lib.tempdir() as temp:
+        module = os.path.join(temp, "my_plugin.py")
+        with open(module, "w") as f:
+            f.write("""
+import pyblish.api
+
+class MyPlugin(pyblish.api.ContextPlugin):
+    def process(self, context):
+        raise ValueError("Bad")
+""")
+
+        plugins = pyblish.api.discover(paths=[temp])
+        context = pyblish.util.publish(plugins=plugins)
+
+    error = context.data["results"][0]["error"]
+    assert_equals(error.traceback[0], module)
+    assert 'File "<string>"' not in error.formatted_traceback
+    assert 'File "%s"' % module in error.formatted_traceback
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_traceback_depth_limited():
+    """Formatted tracebacks are strings of up to a number of frames"""
+
+    import json
+
+    # Alternating, as repeated frames are collapsed by Python 3.6+
+    def recurse(depth):
+        if depth:
+            return alternate(depth - 1)
+        raise ValueError("Bad")
+
+    def alternate(depth):
+        return recurse(depth)
+
+    class MyPlugin(pyblish.api.ContextPlugin):
+        def process(self, context):
+            recurse(200)
+
+    result = pyblish.plugin.process(MyPlugin, pyblish.api.Context())
+    error = result["error"]
+
+    assert_equals(error.traceback[2], "recurse")
+    assert_equals(error.traceback[3], 'raise ValueError("Bad")')
+
+    formatted_traceback = error.formatted_traceback
+    assert isinstance(formatted_traceback, str)
+    assert formatted_traceback.startswith("Traceback")
+    assert formatted_traceback.endswith("ValueError: Bad\n")
+    assert_equals(formatted_traceback.count('File "'),
+                  pyblish.lib.TRACEBACK_LIMIT)
+
+    # E.g. serialised by GUIs
+    json.dumps({"traceback": formatted_traceback})
+
+    class MyChainedPlugin(pyblish.api.ContextPlugin):
+        def process(self, context):
+            try:
+                recurse(200)
+            except ValueError:
+                raise KeyError("Chained")
+
+    result = pyblish.plugin.process(MyChainedPlugin, pyblish.api.Context())
+    error = result["error"]
+
+    if sys.version_info >= (3,):
+        formatted_traceback = error.formatted_traceback
+        assert isinstance(formatted_traceback, str)
+        assert "ValueError: Bad\n" in formatted_traceback
+        assert formatted_traceback.endswith("KeyError: 'Chained'\n")
+
+        # Each exception of the chain is limited alike
+        assert_equals(formatted_traceback.count('File "'),
+                      pyblish.lib.TRACEBACK_LIMIT + 2)
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_lazy_discovery():
+    """Lazily discovered plug-ins only execute their module once processed"""
+
+    pyblish.api.register_host("python")
+
+    with lib.tempdir() as temp:
+        collect_a = os.path.join(temp, "collect_a.py")
+        with open(collect_a, "w") as f:
+            f.write("""
+import pyblish.api
+
+
+class CollectA(pyblish.api.ContextPlugin):
+    \"\"\"Collect A\"\"\"
+    order = pyblish.api.CollectorOrder + 0.1
+    label = "Collect A"
+    families = ["a"]
+    hosts = ["python"]
+
+    def process(self, context):
+        context.data["collectedA"] = self.label
+""")
+
+        collect_maya = os.path.join(temp, "collect_maya.py")
+        with open(collect_maya, "w") as f:
+            f.write("""
+from pyblish import api
+import maya_which_does_not_exist
+
+
+class CollectMaya(api.ContextPlugin):
+    hosts = ["maya"]
+""")
+
+        # Not eligible, due to its dynamic order
+        collect_dynamic = os.path.join(temp, "collect_dynamic.py")
+        with open(collect_dynamic, "w") as f:
+            f.write("""
+import pyblish.api
+
+
+class CollectDynamic(pyblish.api.ContextPlugin):
+    order = float("0")
+""")
+
+        pyblish.manifest.write(temp)
+        plugins = pyblish.api.discover(paths=[temp], lazy=True)
+
+        # Only the ineligible module is executed during discovery
+        assert collect_dynamic in sys.modules
+        assert collect_a not in sys.modules
+        assert collect_maya not in sys.modules
+
+        assert_equals([p.__name__ for p in plugins],
+                      ["CollectDynamic", "CollectA"])
+
+        CollectA = plugins[1]
+        assert_equals(CollectA.__doc__, "Collect A")
+        assert_equals(CollectA.order, 0.1)
+        assert_equals(CollectA.families, ["a"])
+        assert_equals(CollectA.label, "Collect A")
+        assert_equals(CollectA.__module__, collect_a)
+
+        context = pyblish.util.publish(plugins=[CollectA])
+
+        assert collect_a in sys.modules
+        assert_equals(context.data["collectedA"], "Collect A")
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_lazy_discovery_stale_manifest():
+    """Files changed since indexing are discovered as usual"""
+
+    with lib.tempdir() as temp:
+        fname = os.path.join(temp, "collect_a.py")
+
+        with open(fname, "w") as f:
+            f.write("""
+import pyblish.api
+
+class CollectA(pyblish.api.ContextPlugin):
+    pass
+""")
+
+        pyblish.manifest.write(temp)
+
+        with open(fname, "w") as f:
+            f.write("""
+import pyblish.api
+
+class CollectRenamed(pyblish.api.ContextPlugin):
+    pass
+""")
+
+        plugins = pyblish.api.discover(paths=[temp], lazy=True)
+        assert_equals([p.__name__ for p in plugins], ["CollectRenamed"])
+        assert not getattr(plugins[0], "__lazy__", False)
+
+
+def test_manifest_parse():
+    """Manifests are extracted from source without executing it"""
+
+    plugins = pyblish.manifest.parse("""
+import pyblish.api as api
+
+class ValidateA(api.InstancePlugin):
+    order = api.ValidatorOrder - 0.1
+    families = ["a", "b"]
+    match = api.Subset
+    optional = True
+
+    def process(self, instance):
+        pass
+""")
+
+    assert_equals(plugins, [{
+        "name": "ValidateA",
+        "base": "InstancePlugin",
+        "argument": "instance",
+        "doc": None,
+        "attributes": {
+            "order": 0.9,
+            "families": ["a", "b"],
+            "match": pyblish.api.Subset,
+            "optional": True,
+        }
+    }])
+
+    # Anything dynamic at module-level disqualifies the whole file
+    assert_equals(pyblish.manifest.parse("""
+import pyblish.api
+
+register()
+
+class ValidateA(pyblish.api.InstancePlugin):
+    pass
+"""), None)
+
+    # Tuples would be read back as lists
+    assert_equals(pyblish.manifest.parse("""
+import pyblish.api
+
+class ValidateA(pyblish.api.InstancePlugin):
+    version = (1, 2, 3)
+"""), None)
+
+    # As would names of anything but Pyblish
+    assert_equals(pyblish.manifest.parse("""
+import pyblish.api
+import other
+
+class ValidateA(pyblish.api.InstancePlugin):
+    order = other.CollectorOrder
+"""), None)
+
+    assert_equals(pyblish.manifest.parse("""
+import other
+
+class ValidateA(other.InstancePlugin):
+    pass
+"""), None)
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_discoverer():
+    """Discoverer only executes changed files on refresh"""
+
+    def write(fname, name):
+        with open(fname, "w") as f:
+            f.write("""
+import pyblish.api
+
+class %s(pyblish.api.ContextPlugin):
+    pass
+""" % name)
+
+    with lib.tempdir() as temp:
+        pyblish.api.register_plugin_path(temp)
+
+        fname_a = os.path.join(temp, "plugin_a.py")
+        fname_b = os.path.join(temp, "plugin_b.py")
+        write(fname_a, "PluginA")
+        write(fname_b, "PluginB")
+
+        discoverer = pyblish.api.Discoverer()
+        plugins = discoverer.refresh()
+
+        assert_equals([p.__name__ for p in plugins],
+                      [p.__name__ for p in pyblish.api.discover()])
+        assert not discoverer.changed()
+
+        module_a = sys.modules[fname_a]
+
+        # Change one, remove another and add a third
+        write(fname_a, "PluginRenamed")
+        os.remove(fname_b)
+        write(os.path.join(temp, "plugin_c.py"), "PluginC")
+
+        assert discoverer.changed()
+        plugins = discoverer.refresh()
+
+        assert sys.modules[fname_a] is not module_a
+        assert_equals(sorted(p.__name__ for p in plugins),
+                      ["PluginC", "PluginRenamed"])
+        assert_equals(sorted(p.__name__ for p in plugins),
+                      sorted(p.__name__ for p in pyblish.api.discover()))
+
+        # Unchanged files are left alone
+        module_a = sys.modules[fname_a]
+        discoverer.refresh()
+        assert sys.modules[fname_a] is module_a
+
+        # Returned plug-ins are new on each refresh
+        first = discoverer.refresh()
+        first[0].active = False
+        first[0].families.append("changed")
+        second = discoverer.refresh()
+        assert second[0].active
+        assert_equals(second[0].families, ["*"])
+
+        # As are those of a parallel refresh
+        parallel = pyblish.api.Discoverer(parallel=True).refresh()
+        assert_equals([p.__name__ for p in parallel],
+                      [p.__name__ for p in second])
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_discoverer_retries_failed():
+    """Discoverer executes files that failed to load on each refresh"""
+
+    with lib.tempdir() as temp:
+        plugins_dir = os.path.join(temp, "plugins")
+        os.makedirs(plugins_dir)
+
+        with open(os.path.join(plugins_dir, "plugin_a.py"), "w") as f:
+            f.write("""
+import pyblish.api
+
+class PluginA(pyblish.api.ContextPlugin):
+    pass
+""")
+
+        with open(os.path.join(plugins_dir, "plugin_b.py"), "w") as f:
+            f.write("""
+import pyblish.api
+import discoverer_dependency
+
+class PluginB(pyblish.api.ContextPlugin):
+    pass
+""")
+
+        discoverer = pyblish.api.Discoverer(paths=[plugins_dir])
+        plugins = discoverer.refresh()
+
+        assert_equals([p.__name__ for p in plugins], ["PluginA"])
+        assert not discoverer.changed()
+
+        # The missing module becomes available
+        with open(os.path.join(temp, "discoverer_dependency.py"), "w"):
+            pass
+
+        sys.path.insert(0, temp)
+
+        try:
+            plugins = discoverer.refresh()
+            expected = pyblish.api.discover(paths=[plugins_dir])
+
+        finally:
+            sys.path.remove(temp)
+            sys.modules.pop("discoverer_dependency", None)
+
+        assert_equals(sorted(p.__name__ for p in plugins),
+                      ["PluginA", "PluginB"])
+        assert_equals([p.__name__ for p in plugins],
+                      [p.__name__ for p in expected])
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_discoverer_lazy():
+    """Discoverer returns stand-ins of plug-ins described by manifests"""
+
+    with lib.tempdir() as temp:
+        fname = os.path.join(temp, "collect_lazy.py")
+        with open(fname, "w") as f:
+            f.write("""
+import pyblish.api
+
+class CollectLazy(pyblish.api.ContextPlugin):
+    def process(self, context):
+        context.data["collected"] = True
+""")
+
+        pyblish.manifest.write(temp)
+        discoverer = pyblish.api.Discoverer(paths=[temp], lazy=True)
+        plugins = discoverer.refresh()
+
+        assert fname not in sys.modules
+        assert_equals([p.__name__ for p in plugins], ["CollectLazy"])
+
+        context = pyblish.util.publish(plugins=plugins)
+        assert context.data["collected"]
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_discoverer_watch():
+    """Discoverer notifies of changes to files"""
+
+    import threading
+
+    changed = threading.Event()
+
+    with lib.tempdir() as temp:
+        discoverer = pyblish.api.Discoverer(paths=[temp])
+        discoverer.refresh()
+        discoverer.watch(changed.set, interval=0.01)
+
+        try:
+            with open(os.path.join(temp, "plugin_a.py"), "w") as f:
+                f.write("")
+
+            assert changed.wait(5)
+
+        finally:
+            discoverer.unwatch()
+
+
+def test_version_compatibility_memoized():
+    """Compatibility of requirements is memoized"""
+
+    from pyblish.vendor import iscompatible
+
+    pyblish.plugin.clear_compatibility_cache()
+    info = pyblish.plugin.requirements_are_compatible.cache_info
+
+    for requires in ("pyblish>=1",
+                     "pyblish>=1, <1.5",
+                     "pyblish==1.8.12",
+                     "pyblish<1",
+                     "pyblish"):
+        for version in ((1, 0, 0), (1, 8, 12), (2, 0, 0)):
+            assert_equals(
+                pyblish.plugin.requirements_are_compatible(requires, version),
+                iscompatible.iscompatible(requires, version)
+            )
+
+    assert_equals(info().misses, 15)
+
+    class MyPlugin(pyblish.api.ContextPlugin):
+        requires = "pyblish>=1, <1.5"
+
+    hits = info().hits
+    assert not pyblish.plugin.version_is_compatible(MyPlugin)
+    assert not pyblish.plugin.version_is_compatible(MyPlugin)
+    assert_equals(info().hits, hits + 2)
+
+    pyblish.plugin.clear_compatibility_cache()
+    assert_equals(info().currsize, 0)
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_host_index():
+    """Host compatibility follows registration and reassignment of hosts"""
+
+    class MyPlugin(pyblish.api.ContextPlugin):
+        hosts = ["maya"]
+
+    generation = pyblish.plugin.host_index.generation
+
+    assert not pyblish.plugin.host_is_compatible(MyPlugin)
+
+    pyblish.api.register_host("maya")
+    assert pyblish.plugin.host_index.generation > generation
+    assert pyblish.plugin.host_is_compatible(MyPlugin)
+
+    pyblish.api.deregister_host("maya")
+    assert not pyblish.plugin.host_is_compatible(MyPlugin)
+
+    pyblish.api.register_host("houdini")
+    assert not pyblish.plugin.host_is_compatible(MyPlugin)
+    assert_equals(pyblish.plugin.host_index.key, ("houdini",))
+
+    MyPlugin.hosts = ["houdini"]
+    assert pyblish.plugin.host_is_compatible(MyPlugin)
+
+    MyPlugin.hosts.append("nuke")
+    assert_equals(pyblish.plugin._attribute_set(MyPlugin, "hosts"),
+                  frozenset(["houdini", "nuke"]))
+
+    pyblish.api.deregister_all_hosts()
+    assert not pyblish.plugin.host_is_compatible(MyPlugin)
+
+    MyPlugin.hosts = ["*"]
+    assert pyblish.plugin.host_is_compatible(MyPlugin)
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_id_generator():
+    """Ids are generated by the registered id generator"""
+
+    ids = set(pyblish.api.Instance("A").id for _ in range(1000))
+    assert_equals(len(ids), 1000)
+
+    count = {"#": 0}
+
+    def generator():
+        count["#"] += 1
+        return "id%d" % count["#"]
+
+    pyblish.api.register_id_generator(generator)
+
+    try:
+        assert_equals(pyblish.api.registered_id_generator(), generator)
+
+        context = pyblish.api.Context()
+        instance = context.create_instance("A")
+
+        class MyPlugin(pyblish.api.ContextPlugin):
+            pass
+
+        assert_equals(context.id, "id1")
+        assert_equals(instance.id, "id2")
+        assert_equals(MyPlugin.id, "id3")
+
+    finally:
+        pyblish.api.deregister_id_generator()
+
+    assert_equals(pyblish.api.registered_id_generator(), None)
+    assert pyblish.api.Context().id.startswith(
+        pyblish.plugin.sequential_id().rsplit("-", 1)[0])
+
+
+@unittest.skipIf(not hasattr(os, "fork"), "skip when fork is not available")
+def test_sequential_ids_reseed_in_forked_process():
+    """Sequential ids differ between a process and its forks"""
+
+    ids = pyblish.plugin.SequentialIds()
+    parent = ids()
+
+    read, write = os.pipe()
+    pid = os.fork()
+
+    if pid == 0:
+        os.write(write, ids().encode("utf-8"))
+        os._exit(0)
+
+    os.waitpid(pid, 0)
+    child = os.read(read, 1024).decode("utf-8")
+
+    assert child.rsplit("-", 1)[0] != parent.rsplit("-", 1)[0], child
+    assert_equals(ids().rsplit("-", 1)[0], parent.rsplit("-", 1)[0])
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_provider_reuse():
+    """Providers look up arguments once and may be reused"""
+
+    calls = {"#": 0}
+    get_arg_spec = pyblish.plugin.get_arg_spec
+
+    def counting_get_arg_spec(func):
+        calls["#"] += 1
+        return get_arg_spec(func)
+
+    class MyValidator(pyblish.api.Validator):
+        def process(self, instance, context, asset):
+            assert instance is asset
+            instance.data["count"] = instance.data.get("count", 0) + 1
+
+    context = pyblish.api.Context()
+    instances = list(context.create_instance(str(i)) for i in range(10))
+
+    with mock.patch("pyblish.plugin.get_arg_spec", counting_get_arg_spec):
+        for instance in instances:
+            result = pyblish.plugin.process(MyValidator, context, instance)
+            assert result["success"], result["error"]
+
+    assert_equals(calls["#"], 1)
+    assert_equals([i.data["count"] for i in instances], [1] * 10)
+
+    provider = pyblish.plugin.Provider()
+    provider.inject("instance", instances[0])
+    provider.invoke(MyValidator().process)
+    provider.inject("instance", instances[1])
+    provider.invoke(MyValidator().process)
+
+    assert_equals(instances[0].data["count"], 2)
+    assert_equals(instances[1].data["count"], 2)
+
+
+def test_result_mapping():
+    """Results support the mapping API of the dictionary they replace"""
+
+    import copy
+    import pickle
+
+    context = pyblish.api.Context()
+    result = pyblish.plugin.process(pyblish.api.ContextPlugin, context)
+    result["custom"] = [1]
+
+    as_dict = dict(result)
+    assert_equals(result, as_dict)
+    assert_equals(as_dict, result)
+    assert result != dict(as_dict, success=False)
+
+    for duplicate in (result.copy(), copy.copy(result),
+                      pickle.loads(pickle.dumps(result))):
+        assert duplicate is not result
+        assert_equals(duplicate, result)
+        assert isinstance(duplicate, pyblish.api.Result)
+
+    # Copies are shallow, like those of dict
+    assert result.copy()["custom"] is result["custom"]
+
+    assert_equals(result.setdefault("custom", None), [1])
+    assert_equals(result.setdefault("other", 2), 2)
+    assert_equals(result.pop("other"), 2)
+    assert_equals(result.pop("other", None), None)
+    assert "other" not in result
+
+    # Members of every result remain
+    assert_raises(TypeError, result.pop, "success")
+    assert_raises(TypeError, result.__delitem__, "success")
+    assert result.success
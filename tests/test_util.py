@@ -4,7 +4,8 @@ from . import lib
 
 from pyblish import api, util
 from nose.tools import (
-    with_setup
+    with_setup,
+    assert_equals,
 )
 
 
@@ -407,3 +408,452 @@ def test_publish_iter_increment_progress():
     pluginB_progress = next(iterator)["progress"]
 
     assert pluginA_progress < pluginB_progress
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_publish_workers():
+    """Publishing with workers processes instances concurrently, in order"""
+
+    import time
+    import threading
+
+    threads = set()
+
+    class Collector(api.ContextPlugin):
+        order = api.CollectorOrder
+
+        def process(self, context):
+            for index in range(20):
+                instance = context.create_instance("Instance%02d" % index)
+                instance.data["publish"] = index != 5
+                instance.data["invalid"] = index % 7 == 0
+
+    class Validator(api.InstancePlugin):
+        order = api.ValidatorOrder
+
+        def process(self, instance):
+            threads.add(threading.current_thread())
+            time.sleep(0.01)
+            self.log.info(instance.name)
+            assert not instance.data["invalid"], "%s is invalid" % instance
+
+    class Extractor(api.InstancePlugin):
+        order = api.ExtractorOrder
+
+        def process(self, instance):
+            assert False, "Extractor should not run"
+
+    def summary(context):
+        return list(
+            (result["plugin"], getattr(result["instance"], "name", None),
+             result["success"], [r.msg for r in result["records"]])
+            for result in context.data["results"]
+        )
+
+    failed = list()
+
+    def on_failed(plugin, context, instance, error):
+        failed.append(threading.current_thread())
+
+    api.register_callback("pluginFailed", on_failed)
+
+    plugins = [Collector, Validator, Extractor]
+    serial = util.publish(plugins=plugins)
+    parallel = util.publish(plugins=plugins, workers=4)
+
+    assert summary(parallel) == summary(serial), summary(parallel)
+    assert len(threads) > 1, threads
+
+    # Listeners are notified from the publishing thread
+    assert_equals(failed, [threading.current_thread()] * 6)
+
+    # One instance was not to be published, and three failed validation
+    validated = list(r for r in parallel.data["results"]
+                     if r["plugin"] is Validator)
+    assert len(validated) == 19, len(validated)
+    assert len(list(r for r in validated if not r["success"])) == 3
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_publish_processes():
+    """Publishing with processes merges back data, records and errors"""
+
+    with lib.tempdir() as temp:
+        with open(os.path.join(temp, "extract_checksum.py"), "w") as f:
+            f.write("""
+import os
+import zlib
+import pyblish.api
+
+class ExtractChecksum(pyblish.api.InstancePlugin):
+    order = pyblish.api.ExtractorOrder
+    multiprocess = True
+
+    def process(self, instance):
+        self.log.info("Extracting %s", instance.name)
+        assert instance.name != "Invalid", "Invalid instance"
+
+        instance.data["pid"] = os.getpid()
+        instance.data["checksum"] = zlib.crc32(instance.name.encode())
+        instance.data["sizes"].append(len(instance.name))
+        del instance.data["temporary"]
+""")
+
+        plugins = api.discover(paths=[temp])
+
+    context = api.Context()
+    for name in ("A", "Invalid", "C"):
+        instance = context.create_instance(name)
+        instance.data["sizes"] = []
+        instance.data["temporary"] = True
+
+    # Unpicklable data is processed locally instead
+    local = context.create_instance("D")
+    local.data["sizes"] = []
+    local.data["temporary"] = lambda: None
+
+    util.publish(context, plugins, processes=2)
+
+    results = context.data["results"]
+    assert [r["instance"].name for r in results] == ["A", "Invalid", "C", "D"]
+    assert [r["success"] for r in results] == [True, False, True, True]
+    assert all(r["plugin"] is plugins[0] for r in results)
+
+    for result in results:
+        assert [r.getMessage() for r in result["records"]] == [
+            "Extracting %s" % result["instance"].name]
+
+    error = results[1]["error"]
+    assert str(error) == "Invalid instance", error
+    assert "Invalid instance" in error.formatted_traceback
+
+    for instance in (context[0], context[2]):
+        assert instance.data["pid"] != os.getpid()
+        assert instance.data["checksum"]
+        assert instance.data["sizes"] == [1], instance.data["sizes"]
+        assert "temporary" not in instance.data
+
+    assert local.data["pid"] == os.getpid()
+    assert "temporary" not in local.data
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_publish_processes_failure_reported_once():
+    """Failures in a separate process are reported by the publishing process"""
+
+    import logging
+
+    with lib.tempdir() as temp:
+        with open(os.path.join(temp, "extract_failing.py"), "w") as f:
+            f.write("""
+import pyblish.api
+
+class ExtractFailing(pyblish.api.InstancePlugin):
+    order = pyblish.api.ExtractorOrder
+    multiprocess = True
+
+    def process(self, instance):
+        raise ValueError("Failed %s" % instance.name)
+""")
+
+        Plugin, = api.discover(paths=[temp])
+
+    failed = list()
+    logged = list()
+
+    class Handler(logging.Handler):
+        def emit(self, record):
+            logged.append((record.levelname, record.getMessage()))
+
+    def on_failed(plugin, context, instance, error):
+        failed.append(instance.name)
+
+    api.register_callback("pluginFailed", on_failed)
+    handler = Handler()
+    logging.getLogger("pyblish.plugin").addHandler(handler)
+
+    try:
+        # As processed in the separate process, silently
+        context = api.Context()
+        instance = context.create_instance("A")
+        remote = util._process_remote(util._remote_job(Plugin, instance))
+
+        assert_equals(str(remote["error"]), "Failed A")
+        assert_equals(failed, [])
+        assert_equals(logged, [])
+
+        context = api.Context()
+        context.create_instance("A")
+        context.create_instance("B")
+        util.publish(context, [Plugin], processes=2)
+
+    finally:
+        logging.getLogger("pyblish.plugin").removeHandler(handler)
+
+    assert_equals(failed, ["A", "B"])
+    assert_equals(
+        [message for level, message in logged if level == "ERROR"],
+        ["ValueError: Failed A", "ValueError: Failed B"])
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_publish_scheduled():
+    """Plug-ins requiring others are processed once those are done"""
+
+    import threading
+
+    slow = threading.Event()
+    events = list()
+
+    class Collector(api.ContextPlugin):
+        order = api.CollectorOrder
+
+        def process(self, context):
+            context.create_instance("A")
+            context.create_instance("B")
+
+    class ValidateSlow(api.InstancePlugin):
+        order = api.ValidatorOrder
+
+        def process(self, instance):
+            # Waits for ValidateFrames, which does not wait for it
+            assert slow.wait(5), "ValidateFrames was not processed"
+            events.append("ValidateSlow")
+
+    class ValidateFrames(api.InstancePlugin):
+        order = api.ValidatorOrder + 0.1
+        requires_plugins = ["Collector"]
+
+        def process(self, instance):
+            events.append("ValidateFrames")
+            slow.set()
+            assert instance.name == "A", "Invalid frames"
+
+    class ValidateLast(api.ContextPlugin):
+        order = api.ValidatorOrder + 0.2
+
+        def process(self, context):
+            events.append("ValidateLast")
+
+    class Extractor(api.InstancePlugin):
+        order = api.ExtractorOrder
+
+        def process(self, instance):
+            assert False, "Extractor should not run"
+
+    plugins = [Collector, ValidateSlow, ValidateFrames,
+               ValidateLast, Extractor]
+    context = util.publish(plugins=plugins, workers=4)
+
+    assert events.index("ValidateFrames") < events.index("ValidateSlow")
+    assert_equals(events[-1], "ValidateLast")
+
+    # Results are recorded in order of plug-ins
+    results = context.data["results"]
+    assert_equals(
+        [(r["plugin"].__name__, getattr(r["instance"], "name", None))
+         for r in results],
+        [("Collector", None),
+         ("ValidateSlow", "A"),
+         ("ValidateSlow", "B"),
+         ("ValidateFrames", "A"),
+         ("ValidateFrames", "B"),
+         ("ValidateLast", None)])
+
+    assert_equals([r["success"] for r in results],
+                  [True, True, True, True, False, True])
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_publish_requirements_of_later_plugins():
+    """Requirements of plug-ins later in order are met, with or without workers"""
+
+    class Need(api.ContextPlugin):
+        order = api.ValidatorOrder
+        requires_plugins = ["frames"]
+
+        def process(self, context):
+            assert "frames" in context.data, "Provide was not processed"
+
+    class Provide(api.ContextPlugin):
+        order = api.ValidatorOrder + 0.1
+        provides = ["frames"]
+
+        def process(self, context):
+            context.data["frames"] = [1, 2, 3]
+
+    for workers in (None, 2):
+        context = util.publish(plugins=[Need, Provide], workers=workers)
+
+        assert_equals([r["plugin"] for r in context.data["results"]],
+                      [Provide, Need])
+        assert all(r["success"] for r in context.data["results"])
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_publish_invalid_requirements():
+    """Invalid requirements are ignored, with plug-ins processed by order"""
+
+    events = list()
+
+    class Collector(api.ContextPlugin):
+        order = api.CollectorOrder
+
+        def process(self, context):
+            events.append("Collector")
+
+    class ValidateA(api.ContextPlugin):
+        order = api.ValidatorOrder
+        requires_plugins = ["ValidateB"]
+
+        def process(self, context):
+            events.append("ValidateA")
+
+    class ValidateB(api.ContextPlugin):
+        order = api.ValidatorOrder + 0.1
+        requires_plugins = ["ValidateA"]
+
+        def process(self, context):
+            events.append("ValidateB")
+
+    class ValidateC(api.ContextPlugin):
+        order = api.ValidatorOrder
+        requires_plugins = ["Extractor"]
+
+        def process(self, context):
+            events.append("ValidateC")
+
+    class Extractor(api.ContextPlugin):
+        order = api.ExtractorOrder
+
+        def process(self, context):
+            events.append("Extractor")
+
+    plugins = [Collector, ValidateA, ValidateC, ValidateB, Extractor]
+
+    for workers in (None, 2):
+        del events[:]
+        context = util.publish(plugins=plugins, workers=workers)
+
+        assert_equals(events, ["Collector", "ValidateA", "ValidateC",
+                               "ValidateB", "Extractor"])
+        assert all(result["success"] for result in context.data["results"])
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_progress_without_dry_run():
+    """Progress is estimated without a dry run of every plug-in"""
+
+    from pyblish import logic
+    from pyblish.vendor import mock
+
+    class Collector(api.ContextPlugin):
+        order = api.CollectorOrder
+
+        def process(self, context):
+            for index in range(10):
+                context.create_instance("Instance%d" % index,
+                                        family="family%d" % (index % 2))
+
+    class ValidateA(api.InstancePlugin):
+        order = api.ValidatorOrder
+        families = ["family0"]
+
+    class ValidateB(api.InstancePlugin):
+        order = api.ValidatorOrder + 0.1
+
+    class Extractor(api.ContextPlugin):
+        order = api.ExtractorOrder
+
+    plugins = [Collector, ValidateA, ValidateB, Extractor]
+
+    with mock.patch.object(logic, "Iterator", wraps=logic.Iterator) as func:
+        progress = list(r["progress"] for r in util.publish_iter(
+            plugins=plugins))
+
+    # Collectors alone are iterated
+    assert_equals(func.call_count, 1)
+
+    assert_equals(len(progress), 17)
+    assert progress == sorted(progress), progress
+    assert_equals(progress[-1], 1.0)
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_publish_results_sink():
+    """Results are streamed to a file, and only the latest kept in memory"""
+
+    import io
+    import json
+    import shutil
+    import tempfile
+
+    class Collector(api.ContextPlugin):
+        order = api.CollectorOrder
+
+        def process(self, context):
+            for index in range(20):
+                context.create_instance("Instance%02d" % index)
+
+    class Validator(api.InstancePlugin):
+        order = api.ValidatorOrder
+
+        def process(self, instance):
+            self.log.warning("Checking %s", instance)
+            if instance.name == "Instance13":
+                raise ValueError("Invalid")
+
+    tempdir = tempfile.mkdtemp()
+    fname = os.path.join(tempdir, "results.jsonl")
+
+    try:
+        with io.open(fname, "w", encoding="utf-8") as f:
+            context = api.Context()
+            context.data["results"] = api.Results(maxlen=5, stream=f)
+            util.publish(context, plugins=[Collector, Validator])
+
+        with io.open(fname, encoding="utf-8") as f:
+            lines = list(json.loads(line) for line in f)
+
+    finally:
+        shutil.rmtree(tempdir)
+
+    results = context.data["results"]
+    assert_equals(results.count, 21)
+    assert_equals(len(results), 5)
+    assert_equals(results[-1]["instance"].name, "Instance19")
+
+    assert_equals(len(lines), 21)
+    assert_equals(lines[0]["plugin"], "Collector")
+    assert_equals(lines[-1]["instance"], "Instance19")
+    assert_equals(lines[-1]["records"][0]["msg"], "Checking Instance19")
+    assert_equals(lines[-1]["records"][0]["level"], "WARNING")
+
+    errors = list(line for line in lines if line["error"])
+    assert_equals(len(errors), 1)
+    assert_equals(errors[0]["instance"], "Instance13")
+    assert_equals(errors[0]["error"]["message"], "Invalid")
+    assert "ValueError" in errors[0]["error"]["traceback"]
+
+
+@with_setup(lib.setup_empty, lib.teardown)
+def test_progress_excludes_unpublished_instances():
+    """Progress reaches 1.0 with instances that are not to be published"""
+
+    class Collector(api.ContextPlugin):
+        order = api.CollectorOrder
+
+        def process(self, context):
+            for index in range(4):
+                context.create_instance("Instance%d" % index,
+                                        publish=index % 2 == 0)
+
+    class Validator(api.InstancePlugin):
+        order = api.ValidatorOrder
+
+    progress = list(r["progress"] for r in util.publish_iter(
+        plugins=[Collector, Validator]))
+
+    assert_equals(len(progress), 3)
+    assert progress == sorted(progress), progress
+    assert_equals(progress[-1], 1.0)